@@ -0,0 +1,4 @@
+import os
+
+with open(os.path.join(os.path.dirname(__file__), "VERSION"), "r", encoding="utf-8") as version_file:
+    VERSION = version_file.read().strip()
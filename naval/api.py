@@ -0,0 +1,91 @@
+import os
+from typing import IO, Dict, List, Optional, Sequence, Union
+
+from Bio.PDB.Structure import Structure
+
+from naval.arrow_printer import arrow_table
+from naval.printer import AnglesCsvPrinter, BondsCsvPrinter, GeometryCsvPrinter
+from naval.sqlite_store import results_rows
+from naval.validate import read_structure, read_structure_content, validate_structure
+from naval.validation_record import TorsionRecord
+from naval.validation_table import ValidationTable
+
+StructureSource = Union[str, "os.PathLike[str]", bytes, IO, Structure]
+
+
+class ValidationResult:
+    """
+    Results of one structure held in memory: bonds and angles as ValidationTable and the torsion records.
+    Rows can be converted to typed tuples or Arrow tables with the columns of the CSV outputs.
+    """
+
+    __slots__ = ("pdbcode", "validation_table", "geometry_records")
+
+    def __init__(self, pdbcode: str, validation_table: ValidationTable, geometry_records: List[TorsionRecord]) -> None:
+        self.pdbcode = pdbcode
+        self.validation_table = validation_table
+        self.geometry_records = geometry_records
+
+    def bonds(self) -> ValidationTable:
+        return self.validation_table.bonds()
+
+    def angles(self) -> ValidationTable:
+        return self.validation_table.angles()
+
+    def rows(self) -> Dict[str, List[tuple]]:
+        """
+        Typed rows of the bonds, angles and geometry outputs
+        """
+        return results_rows(self.validation_table, self.geometry_records)
+
+    def arrow_tables(self) -> Dict[str, object]:
+        """
+        Arrow tables of the bonds, angles and geometry outputs, requires the pyarrow package
+        """
+        return {
+            "bonds": arrow_table(BondsCsvPrinter, self.validation_table),
+            "angles": arrow_table(AnglesCsvPrinter, self.validation_table),
+            "geometry": arrow_table(GeometryCsvPrinter, self.geometry_records),
+        }
+
+
+def load(
+    source: StructureSource,
+    pdbcode: Optional[str] = None,
+    structure_format: Optional[str] = None,
+    fast_reader: bool = False,
+    res_names: Optional[Sequence[str]] = None,
+) -> Structure:
+    """
+    Parse the structure from a file path, file content (bytes), binary or text file-like object.
+    The pdbcode (structure id) defaults to the beginning of the file name for paths and to empty string for content,
+    Biopython structures are returned unchanged (with their id).
+    """
+    if isinstance(source, Structure):
+        return source
+    if isinstance(source, (str, os.PathLike)):
+        structure = read_structure(os.fspath(source), fast_reader, res_names)
+        if pdbcode is not None:
+            structure.id = pdbcode  # type: ignore
+        return structure
+    content = source if isinstance(source, bytes) else source.read()
+    return read_structure_content(content, pdbcode or "", structure_format, fast_reader, res_names)
+
+
+def validate(
+    source: StructureSource,
+    pdbcode: Optional[str] = None,
+    structure_format: Optional[str] = None,
+    fast_reader: bool = False,
+    res_names: Optional[Sequence[str]] = None,
+    processes: int = 1,
+) -> ValidationResult:
+    """
+    Validate the structure without reading or writing files (except reading the given path) and without printing.
+    The source is a file path, file content (bytes), file-like object or Biopython structure (see load).
+    For content and file-like objects the format (pdb, cif or bcif) is detected when not given.
+    """
+    # pylint: disable=too-many-arguments
+    structure = load(source, pdbcode, structure_format, fast_reader, res_names)
+    validation_table, geometry_records = validate_structure(structure, processes=processes)
+    return ValidationResult(structure.id, validation_table, geometry_records)
@@ -0,0 +1,134 @@
+import os
+from typing import Iterable, List, Optional, Type, Union
+
+from naval.printer import (
+    FLOAT_COLUMNS,
+    INT_COLUMNS,
+    AnglesCsvPrinter,
+    BondAngleRecord,
+    BondsCsvPrinter,
+    GeometryCsvPrinter,
+    column_names,
+    typed_rows,
+)
+from naval.validation_record import TorsionRecord
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+CSV_FORMAT = "csv"
+PARQUET_FORMAT = "parquet"
+ARROW_FORMAT = "arrow"
+OUTPUT_EXTENSIONS = {".csv": CSV_FORMAT, ".parquet": PARQUET_FORMAT, ".arrow": ARROW_FORMAT}
+
+# unique per residue, not worth a dictionary
+PLAIN_STRING_COLUMNS = ("atom1_resid", "atom2_resid", "atom3_resid", "resid")
+
+# printers are used as classes (all methods are classmethods)
+CsvPrinter = Union[Type[BondsCsvPrinter], Type[AnglesCsvPrinter], Type[GeometryCsvPrinter]]
+
+
+def output_format(out_filename: str) -> str:
+    """
+    Output format based on the file extension (.parquet or .arrow), files with other extensions are written as csv
+    """
+    return OUTPUT_EXTENSIONS.get(os.path.splitext(out_filename)[1].lower(), CSV_FORMAT)
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Parquet and Arrow output requires the pyarrow package (pip install naval[arrow])")
+
+
+def _column_type(name: str):
+    if name in INT_COLUMNS:
+        return pa.int32()
+    if name in FLOAT_COLUMNS:
+        return pa.float64()
+    if name in PLAIN_STRING_COLUMNS:
+        return pa.string()
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def arrow_schema(printer: CsvPrinter):
+    """
+    Typed schema of the CSV printer columns, repeated strings (pdbcode, chain, atom names, labels, ...) are dictionary encoded
+    """
+    _require_pyarrow()
+    return pa.schema([(name, _column_type(name)) for name in column_names(printer)])
+
+
+def arrow_table(printer: CsvPrinter, records: Iterable[Union[BondAngleRecord, TorsionRecord]]):
+    """
+    Convert records supported by the CSV printer to the Arrow table with the same columns
+    """
+    return arrow_table_from_rows(printer, typed_rows(printer, records))
+
+
+def arrow_table_from_rows(printer: CsvPrinter, rows: Iterable[tuple]):
+    """
+    Convert typed rows (typed_rows or typed_rows_from_fields) of the CSV printer columns to the Arrow table
+    """
+    schema = arrow_schema(printer)
+    columns: List[list] = [[] for _ in schema.names]
+    for row in rows:
+        for column, value in zip(columns, row):
+            column.append(value)
+
+    arrays = []
+    for column, field in zip(columns, schema):
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(column, type=pa.string()).dictionary_encode().cast(field.type))
+        else:
+            arrays.append(pa.array(column, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class ArrowTableWriter:
+    """
+    Write Arrow tables (for example one per structure) to a single Parquet or Arrow IPC file
+    """
+
+    def __init__(self, out_filename: str, schema, table_format: Optional[str] = None) -> None:
+        _require_pyarrow()
+        self.table_format = table_format or output_format(out_filename)
+        if self.table_format == PARQUET_FORMAT:
+            self._writer = pq.ParquetWriter(out_filename, schema)
+        elif self.table_format == ARROW_FORMAT:
+            # stream format allows a new dictionary for each table
+            self._writer = pa.ipc.new_stream(out_filename, schema)
+        else:
+            raise ValueError(f"Unsupported table format: {self.table_format}")
+
+    def write(self, table) -> None:
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def __enter__(self) -> "ArrowTableWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_arrow_table(table, out_filename: str, table_format: Optional[str] = None) -> None:
+    with ArrowTableWriter(out_filename, table.schema, table_format) as writer:
+        writer.write(table)
+
+
+def read_arrow_table(in_filename: str, table_format: Optional[str] = None):
+    """
+    Read the table written by write_arrow_table or ArrowTableWriter
+    """
+    _require_pyarrow()
+    table_format = table_format or output_format(in_filename)
+    if table_format == PARQUET_FORMAT:
+        return pq.read_table(in_filename)
+    with pa.ipc.open_stream(in_filename) as reader:
+        return reader.read_all()
@@ -0,0 +1,289 @@
+import functools
+import glob
+import multiprocessing
+import os
+import sys
+import traceback
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from naval.arrow_printer import (
+    CSV_FORMAT,
+    ArrowTableWriter,
+    arrow_schema,
+    arrow_table,
+    arrow_table_from_rows,
+    write_arrow_table,
+)
+from naval.mmcif_printer import format_mmcif
+from naval.printer import (
+    AnglesCsvPrinter,
+    BondsCsvPrinter,
+    GeometryCsvPrinter,
+    lines_from_fields,
+    record_fields,
+    typed_rows_from_fields,
+    write_lines,
+)
+from naval.readers.compressed import split_compression_extension
+from naval.result_cache import (
+    CSV_OUTPUTS,
+    DEFAULT_RESULT_CACHE_SIZE,
+    MMCIF_OUTPUTS,
+    ResultCache,
+    ResultOutputs,
+)
+from naval.sqlite_store import ResultsStore, results_rows
+from naval.structure_cache import DEFAULT_STRUCTURE_CACHE_SIZE, StructureCache
+from naval.validate import load_structure, pdbcode_from_path, validate_structure
+from naval.validation_record import TorsionRecord
+from naval.validation_table import ValidationTable
+
+STRUCTURE_EXTENSIONS = (".cif", ".pdb", ".bcif")
+SQLITE_FORMAT = "sqlite"
+SQLITE_DATABASE_NAME = "naval.sqlite"
+MMCIF_FORMAT = "mmcif"
+MMCIF_OUTPUT_NAME = "naval"
+OUTPUT_PRINTERS = (
+    ("bonds", BondsCsvPrinter),
+    ("angles", AnglesCsvPrinter),
+    ("geometry", GeometryCsvPrinter),
+)
+
+
+def is_structure_file(file_path: str) -> bool:
+    base, _ = split_compression_extension(file_path)
+    return os.path.splitext(base)[1].lower() in STRUCTURE_EXTENSIONS
+
+
+def entry_name(file_path: str) -> str:
+    """
+    File name without the format and compression extensions, for example `/data/1abc.cif.gz` -> `1abc`
+    """
+    base, _ = split_compression_extension(os.path.basename(file_path))
+    return os.path.splitext(base)[0]
+
+
+def _read_manifest(manifest_path: str) -> Iterator[str]:
+    manifest_dir = os.path.dirname(manifest_path)
+    with open(manifest_path, "r", encoding="utf-8") as manifest:
+        for line in manifest:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line if os.path.isabs(line) else os.path.join(manifest_dir, line)
+
+
+def collect_inputs(sources: Sequence[str]) -> List[str]:
+    """
+    Expand structure files, directories, glob patterns and manifest files (one structure path per line) to the list of structures
+    """
+    inputs = []
+    for source in sources:
+        if os.path.isdir(source):
+            inputs.extend(sorted(os.path.join(source, name) for name in os.listdir(source) if is_structure_file(name)))
+        elif os.path.isfile(source) and is_structure_file(source):
+            inputs.append(source)
+        elif os.path.isfile(source):
+            inputs.extend(_read_manifest(source))
+        else:
+            inputs.extend(sorted(path for path in glob.glob(source) if is_structure_file(path)))
+    return inputs
+
+
+def duplicate_entry_names(inputs: Sequence[str]) -> List[str]:
+    """
+    Entry names shared by more than one input, their per-entry output files would overwrite each other
+    """
+    counts: Dict[str, int] = {}
+    for structure_filepath in inputs:
+        name = entry_name(structure_filepath)
+        counts[name] = counts.get(name, 0) + 1
+    return sorted(name for name, count in counts.items() if count > 1)
+
+
+def format_entry_outputs(pdbcode: str, validation_table: ValidationTable, geometry_records: List[TorsionRecord], table_format: str) -> Dict[str, Any]:
+    """
+    Outputs of the validated structure: lines (with headers) of the CSV outputs, Arrow tables (parquet and arrow formats),
+    typed rows (sqlite format) or lines of the mmCIF data block (mmcif format)
+    """
+    if table_format == MMCIF_FORMAT:
+        return {MMCIF_OUTPUT_NAME: list(format_mmcif(pdbcode, validation_table, geometry_records))}
+    if table_format == SQLITE_FORMAT:
+        return results_rows(validation_table, geometry_records)
+    if table_format == CSV_FORMAT:
+        return {
+            "bonds": BondsCsvPrinter.print(validation_table),
+            "angles": AnglesCsvPrinter.print(validation_table),
+            "geometry": GeometryCsvPrinter.print(geometry_records),
+        }
+    return {name: arrow_table(printer, geometry_records if name == "geometry" else validation_table) for name, printer in OUTPUT_PRINTERS}
+
+
+def cached_entry_outputs(pdbcode: str, validation_table: ValidationTable, geometry_records: List[TorsionRecord], output_kind: str) -> ResultOutputs:
+    """
+    Outputs of the validated structure kept in the result cache: csv fields of each record or lines of the mmCIF data block
+    """
+    if output_kind == MMCIF_OUTPUTS:
+        return format_entry_outputs(pdbcode, validation_table, geometry_records, MMCIF_FORMAT)
+    return {name: list(record_fields(printer, geometry_records if name == "geometry" else validation_table)) for name, printer in OUTPUT_PRINTERS}
+
+
+def format_cached_outputs(cached: ResultOutputs, table_format: str) -> Dict[str, Any]:
+    """
+    Outputs of the structure found in the result cache, the same as format_entry_outputs of the records
+    """
+    if table_format == MMCIF_FORMAT:
+        return cached
+    outputs: Dict[str, Any] = {}
+    for name, printer in OUTPUT_PRINTERS:
+        if table_format == CSV_FORMAT:
+            outputs[name] = list(lines_from_fields(printer, cached[name]))
+        elif table_format == SQLITE_FORMAT:
+            outputs[name] = list(typed_rows_from_fields(printer, cached[name]))
+        else:
+            outputs[name] = arrow_table_from_rows(printer, typed_rows_from_fields(printer, cached[name]))
+    return outputs
+
+
+def validate_entry(
+    structure_filepath: str,
+    fast_reader: bool = False,
+    res_names: Optional[Sequence[str]] = None,
+    structure_cache_dir: Optional[str] = None,
+    structure_cache_size: int = DEFAULT_STRUCTURE_CACHE_SIZE,
+    table_format: str = CSV_FORMAT,
+    result_cache_dir: Optional[str] = None,
+    result_cache_size: int = DEFAULT_RESULT_CACHE_SIZE,
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Validate one structure in a worker process.
+    Returns the file path, formatted output lines (with headers) or Arrow tables (parquet and arrow formats)
+    for each output or the error message. With mmcif format the only output are lines of the mmCIF data block.
+    With the result cache, outputs of unchanged structures (the same naval version, restraint library and reader options)
+    are not computed again.
+    """
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-locals
+    try:
+        pdbcode = pdbcode_from_path(structure_filepath)
+        print(f"# PDB id: {pdbcode}")
+        output_kind = MMCIF_OUTPUTS if table_format == MMCIF_FORMAT else CSV_OUTPUTS
+        result_cache = ResultCache(result_cache_dir, result_cache_size) if result_cache_dir else None
+        key = result_cache.key(structure_filepath, res_names, output_kind, fast_reader) if result_cache else ""
+        cached = result_cache.load(key) if result_cache else None
+        if cached is not None:
+            return structure_filepath, format_cached_outputs(cached, table_format), None
+
+        structure_cache = StructureCache(structure_cache_dir, structure_cache_size) if structure_cache_dir else None
+        structure, links = load_structure(structure_filepath, fast_reader, res_names, structure_cache)
+        validation_table, geometry_records = validate_structure(structure, links)
+        if result_cache:
+            result_cache.save(key, cached_entry_outputs(pdbcode, validation_table, geometry_records, output_kind))
+        return structure_filepath, format_entry_outputs(pdbcode, validation_table, geometry_records, table_format), None
+    except Exception:  # pylint: disable=broad-except
+        return structure_filepath, None, traceback.format_exc()
+
+
+def _validate_all(worker, inputs: Sequence[str], processes: int) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    if processes <= 1:
+        yield from map(worker, inputs)
+        return
+    # each worker process imports the validators (and builds the restraint tables) only once
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap(worker, inputs)
+
+
+def run_batch(
+    inputs: Sequence[str],
+    out_dir: str,
+    processes: int = 1,
+    merged: bool = False,
+    fast_reader: bool = False,
+    res_names: Optional[Sequence[str]] = None,
+    structure_cache_dir: Optional[str] = None,
+    structure_cache_size: int = DEFAULT_STRUCTURE_CACHE_SIZE,
+    table_format: str = CSV_FORMAT,
+    result_cache_dir: Optional[str] = None,
+    result_cache_size: int = DEFAULT_RESULT_CACHE_SIZE,
+) -> int:
+    """
+    Validate all structures using a pool of worker processes.
+    Writes `<entry>_bonds.csv`, `<entry>_angles.csv` and `<entry>_geometry.csv` for each structure,
+    or `bonds.csv`, `angles.csv` and `geometry.csv` with all structures when merged (in the input order).
+    With parquet or arrow table format the files have `.parquet` or `.arrow` extension,
+    with sqlite format all structures are stored (upserted) in the `naval.sqlite` database with the entry name of the file.
+    With mmcif format `<entry>_naval.cif` is written for each structure, or `naval.cif` with one data block per structure when merged.
+    Outputs of structures found in the result cache (when given) are not computed again.
+    Raises ValueError when per-entry outputs (or SQLite entries) of two inputs have the same name (for example `1abc.cif` and `1abc.pdb`).
+    Returns the number of structures that failed.
+    """
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-branches
+    duplicates = duplicate_entry_names(inputs) if table_format == SQLITE_FORMAT or not merged else []
+    if duplicates:
+        raise ValueError(f"Duplicate entry names, outputs would overwrite each other: {', '.join(duplicates)}")
+    os.makedirs(out_dir, exist_ok=True)
+    worker = functools.partial(
+        validate_entry,
+        fast_reader=fast_reader,
+        res_names=res_names,
+        structure_cache_dir=structure_cache_dir,
+        structure_cache_size=structure_cache_size,
+        table_format=table_format,
+        result_cache_dir=result_cache_dir,
+        result_cache_size=result_cache_size,
+    )
+
+    merged_files: Dict[str, Any] = {}
+    if table_format == SQLITE_FORMAT:
+        # all structures are stored in one database, one transaction per structure
+        merged_files[SQLITE_FORMAT] = ResultsStore(os.path.join(out_dir, SQLITE_DATABASE_NAME))
+    elif table_format == MMCIF_FORMAT:
+        if merged:
+            merged_filepath = os.path.join(out_dir, f"{MMCIF_OUTPUT_NAME}.cif")
+            merged_files[MMCIF_OUTPUT_NAME] = open(merged_filepath, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+    elif merged:
+        for name, printer in OUTPUT_PRINTERS:
+            merged_filepath = os.path.join(out_dir, f"{name}.{table_format}")
+            if table_format == CSV_FORMAT:
+                merged_files[name] = open(merged_filepath, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+                write_lines(merged_files[name], [printer.format_header()])
+            else:
+                # one row group (record batch) per structure
+                merged_files[name] = ArrowTableWriter(merged_filepath, arrow_schema(printer), table_format)
+
+    failed = 0
+    try:
+        for structure_filepath, outputs, error in _validate_all(worker, inputs, processes):
+            if outputs is None:
+                failed += 1
+                print(f"# Failed: {structure_filepath}\n{error}", file=sys.stderr)
+                continue
+            if table_format == SQLITE_FORMAT:
+                merged_files[SQLITE_FORMAT].store_rows(outputs, entry_name(structure_filepath), replace_entries=True)
+                continue
+            if table_format == MMCIF_FORMAT:
+                if merged:
+                    write_lines(merged_files[MMCIF_OUTPUT_NAME], outputs[MMCIF_OUTPUT_NAME])
+                else:
+                    out_filepath = os.path.join(out_dir, f"{entry_name(structure_filepath)}_{MMCIF_OUTPUT_NAME}.cif")
+                    with open(out_filepath, "w", encoding="utf-8") as out_file:
+                        write_lines(out_file, outputs[MMCIF_OUTPUT_NAME])
+                continue
+            for name, _ in OUTPUT_PRINTERS:
+                out_filepath = os.path.join(out_dir, f"{entry_name(structure_filepath)}_{name}.{table_format}")
+                if table_format != CSV_FORMAT:
+                    if merged:
+                        merged_files[name].write(outputs[name])
+                    else:
+                        write_arrow_table(outputs[name], out_filepath, table_format)
+                elif merged:
+                    # skip per structure header
+                    write_lines(merged_files[name], outputs[name][1:])
+                else:
+                    with open(out_filepath, "w", encoding="utf-8") as out_file:
+                        write_lines(out_file, outputs[name])
+    finally:
+        for out_file in merged_files.values():
+            out_file.close()
+    return failed
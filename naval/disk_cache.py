@@ -0,0 +1,100 @@
+import hashlib
+import os
+import tempfile
+from typing import List, Optional, Tuple
+
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_content_hash(file_path: str) -> str:
+    """
+    Return sha256 hex digest of the file content
+    """
+    content_hash = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        for block in iter(lambda: handle.read(HASH_BLOCK_SIZE), b""):
+            content_hash.update(block)
+    return content_hash.hexdigest()
+
+
+class DiskCache:
+    """
+    Directory of cache entries (one file per key) with least recently used eviction bounded by the total size
+    """
+
+    def __init__(self, cache_dir: str, max_size: int, suffix: str) -> None:
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.suffix = suffix
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.suffix)
+
+    def lookup(self, key: str) -> Optional[str]:
+        """
+        Return path to the cache entry or None, the entry is marked as recently used
+        """
+        path = self.entry_path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def store(self, key: str, content: bytes) -> str:
+        """
+        Atomically write the cache entry and evict the least recently used entries above the size limit
+        """
+        path = self.entry_path(key)
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as handle:
+                handle.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.evict()
+        return path
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """
+        Return (last use time, size, path) of all entries, the least recently used first
+        """
+        entries = []
+        with os.scandir(self.cache_dir) as directory:
+            for entry in directory:
+                if entry.is_file() and entry.name.endswith(self.suffix):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def evict(self) -> None:
+        entries = self.entries()
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove the cache entry, returns False when there was no entry
+        """
+        try:
+            os.unlink(self.entry_path(key))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def clear(self) -> None:
+        for _, _, path in self.entries():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
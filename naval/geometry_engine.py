@@ -0,0 +1,258 @@
+import math
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+if False:  # pylint: disable=using-constant-test
+    # trick for mypy to avoid cyclic imports
+    # pylint: disable=cyclic-import
+    from naval.nucleotide_geometry import NucleotideGeometry
+
+
+def _dot(vectors1: np.ndarray, vectors2: np.ndarray) -> np.ndarray:
+    # summed in the same order as Bio.PDB.vectors.Vector
+    return vectors1[:, 0] * vectors2[:, 0] + vectors1[:, 1] * vectors2[:, 1] + vectors1[:, 2] * vectors2[:, 2]
+
+
+def _cross(vectors1: np.ndarray, vectors2: np.ndarray) -> np.ndarray:
+    return np.stack(
+        (
+            vectors1[:, 1] * vectors2[:, 2] - vectors1[:, 2] * vectors2[:, 1],
+            vectors1[:, 2] * vectors2[:, 0] - vectors1[:, 0] * vectors2[:, 2],
+            vectors1[:, 0] * vectors2[:, 1] - vectors1[:, 1] * vectors2[:, 0],
+        ),
+        axis=1,
+    )
+
+
+def _vector_angles(vectors1: np.ndarray, vectors2: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cosine = _dot(vectors1, vectors2) / (np.sqrt(_dot(vectors1, vectors1)) * np.sqrt(_dot(vectors2, vectors2)))
+    # zero length vectors give the same result as Bio.PDB.vectors.Vector.angle (min(nan, 1) and max(-1, nan) is -1)
+    cosine = np.where(np.isnan(cosine), -1.0, np.clip(cosine, -1.0, 1.0))
+    return np.arccos(cosine)
+
+
+def bond_lengths(coords: np.ndarray) -> np.ndarray:
+    """
+    Calculate distances for (n, 2, 3) array of atom coordinates, rounded to 3 decimals in float32 as Atom.__sub__
+    (float32 squares are summed in double precision like the float32 numpy dot product)
+    """
+    coords = np.asarray(coords, dtype=np.float32).reshape(-1, 2, 3)
+    diff = coords[:, 1] - coords[:, 0]
+    squares = (diff * diff).astype(np.float64)
+    return np.round(np.sqrt((squares[:, 0] + squares[:, 1] + squares[:, 2]).astype(np.float32)), 3)
+
+
+def bond_angles(coords: np.ndarray) -> np.ndarray:
+    """
+    Calculate angles for (n, 3, 3) array of atom coordinates, the same formula as Bio.PDB.vectors.calc_angle,
+    return angles in degrees rounded to 1 decimal
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3, 3)
+    angles = _vector_angles(coords[:, 0] - coords[:, 1], coords[:, 2] - coords[:, 1])
+    return np.round(np.rad2deg(angles), 1)
+
+
+def dihedral_angles(coords: np.ndarray) -> np.ndarray:
+    """
+    Calculate dihedral angles for (n, 4, 3) array of atom coordinates,
+    the same formula as Bio.PDB.vectors.calc_dihedral, return angles in degrees rounded to 1 decimal
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4, 3)
+    vector_ab = coords[:, 0] - coords[:, 1]
+    vector_cb = coords[:, 2] - coords[:, 1]
+    vector_db = coords[:, 3] - coords[:, 2]
+    vector_u = _cross(vector_ab, vector_cb)
+    vector_v = _cross(vector_db, vector_cb)
+    vector_w = _cross(vector_u, vector_v)
+
+    angles = _vector_angles(vector_u, vector_v)
+    angles = np.where(_vector_angles(vector_cb, vector_w) > 0.001, -angles, angles)
+    return np.round(np.rad2deg(angles), 1)
+
+
+def calculate_torsions(geometries: "List[NucleotideGeometry]") -> "List[NucleotideGeometry]":
+    """
+    Calculate all torsion angles (alpha-zeta, chi and theta0-theta4) of all nucleotides in one pass:
+    atoms of every torsion and alternative conformation are gathered into one coordinate array,
+    the per alternative conformation dictionaries of the geometries are filled with the results
+    """
+    coords: List[np.ndarray] = []
+    selections: List[Tuple["NucleotideGeometry", str, Optional[List[str]]]] = []
+    for geometry in geometries:
+        for torsion_name, atom_names, atom_relative_positions in geometry.torsion_definitions():
+            torsion_atoms = geometry.torsion_atoms(atom_names, atom_relative_positions)
+            if torsion_atoms is None:
+                selections.append((geometry, torsion_name, None))
+                continue
+            selections.append((geometry, torsion_name, [alt_loc for alt_loc, _ in torsion_atoms]))
+            coords.extend(atom.get_coord() for _, atoms in torsion_atoms for atom in atoms)
+
+    angles = dihedral_angles(np.array(coords, dtype=np.float64)).tolist() if coords else []
+
+    row = 0
+    for geometry, torsion_name, alt_locs in selections:
+        if alt_locs is None:
+            torsions = {"": None}
+        else:
+            torsions = {}
+            for alt_loc in alt_locs:
+                torsions[alt_loc] = angles[row]
+                row += 1
+        setattr(geometry, torsion_name, torsions)
+    return geometries
+
+
+# the initial definition is Theta(1) = C1-C2-C3-C4, Theta(2) = C2-C3-C4-O4, etc.
+PSEUDOROTATION_THETA_ORDER = [2, 3, 4, 0, 1]
+PSEUDOROTATION_SIN = [math.sin(0.8 * math.pi * i_t) for i_t in range(5)]
+PSEUDOROTATION_COS = [math.cos(0.8 * math.pi * i_t) for i_t in range(5)]
+
+UNDEFINED_CONFORMATION = "undefined"
+
+
+def _round(values: np.ndarray, ndigits: int) -> np.ndarray:
+    # Python round (correctly rounded decimal), np.round differs for values close to half
+    return np.array([round(value, ndigits) for value in values.tolist()], dtype=np.float64)
+
+
+def pseudorotation_with_sd(thetas: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate pseudorotation angles
+    :param thetas: (n, 5) array of theta0-theta4 torsion values, for example theta0 = torsion(C4', O4' C1', C2')
+    :return: arrays of P in deg, standard deviation of P, Tm, standard deviation of Tm
+    """
+    thetas = np.asarray(thetas, dtype=np.float64).reshape(-1, 5)[:, PSEUDOROTATION_THETA_ORDER]
+
+    sum_sin = np.zeros(len(thetas))
+    sum_cos = np.zeros(len(thetas))
+    for i_t in range(5):
+        sum_sin += thetas[:, i_t] * PSEUDOROTATION_SIN[i_t]
+        sum_cos += thetas[:, i_t] * PSEUDOROTATION_COS[i_t]
+
+    pseudo_deg = np.degrees(np.arctan2(-sum_sin, sum_cos))
+    pseudo_deg = np.where(pseudo_deg < 0.0, pseudo_deg + 360.0, pseudo_deg)
+
+    pseudo_rad = np.radians(pseudo_deg)
+    tau_max = 0.4 * (np.cos(pseudo_rad) * sum_cos - np.sin(pseudo_rad) * sum_sin)
+
+    sum_squares = np.zeros(len(thetas))
+    for i_t in range(5):
+        difference = thetas[:, i_t] - tau_max * np.cos(pseudo_rad + (0.8 * math.pi * i_t))
+        sum_squares += difference * difference
+
+    sd_tau_max = np.sqrt(0.4 * sum_squares / 3.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sd_pseudo = sd_tau_max / np.radians(tau_max)
+    return _round(pseudo_deg, 1), sd_pseudo, _round(tau_max, 1), sd_tau_max
+
+
+def torsion_values(angles: Iterable[Optional[float]]) -> np.ndarray:
+    """
+    Convert torsion values to an array, undefined (None) torsions are stored as 0.0 which is also classified as undefined
+    """
+    return np.array([0.0 if angle is None else angle for angle in angles], dtype=np.float64)
+
+
+def _classify(angles: np.ndarray, conditions: List[np.ndarray], labels: List[str], default: str) -> np.ndarray:
+    # 0.0 and undefined angles are not classified, nan falls through to the default class
+    undefined = angles == 0.0
+    return np.select([undefined] + conditions, [UNDEFINED_CONFORMATION] + labels, default)
+
+
+def classify_alpha_conformation(angles: np.ndarray) -> np.ndarray:
+    """
+    Classify alpha (or zeta) torsion angles as sc+, sc-, ap or other
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    return _classify(
+        angles,
+        [(30 <= angles) & (angles <= 110), (-110 <= angles) & (angles <= -30), (angles <= -130) | (angles > 110)],
+        ["sc+", "sc-", "ap"],
+        "other",
+    )
+
+
+classify_zeta_conformation = classify_alpha_conformation
+
+
+def classify_gamma_conformation(angles: np.ndarray) -> np.ndarray:
+    """
+    Classify gamma torsion angles as gauche+, gauche-, trans or other
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    return _classify(
+        angles,
+        [(30 <= angles) & (angles <= 90), (-90 <= angles) & (angles <= -30), (150 <= angles) | (angles <= -150)],
+        ["gauche+", "gauche-", "trans"],
+        "other",
+    )
+
+
+def classify_sugar_conformation(pseudorotations: np.ndarray) -> np.ndarray:
+    """
+    Classify pseudorotation phase angles as C2'-endo, C3'-endo or other
+    """
+    pseudorotations = np.asarray(pseudorotations, dtype=np.float64)
+    return _classify(
+        pseudorotations,
+        [(140 <= pseudorotations) & (pseudorotations <= 190), (0 <= pseudorotations) & (pseudorotations <= 36)],
+        ["C2'-endo", "C3'-endo"],
+        "other",
+    )
+
+
+def classify_chi_conformation(angles: np.ndarray) -> np.ndarray:
+    """
+    Classify chi torsion angles as syn or anti
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    return _classify(angles, [(-90 <= angles) & (angles <= 90)], ["syn"], "anti")
+
+
+def classify_torsions(geometries: "List[NucleotideGeometry]", torsion_name: str, conformation_name: str, classify: Callable) -> None:
+    """
+    Classify torsion values of all alternative conformations of all geometries in one call
+    """
+    rows = [(geometry, alt_loc, angle) for geometry in geometries for alt_loc, angle in getattr(geometry, torsion_name).items()]
+    labels = classify(torsion_values([angle for _, _, angle in rows])).tolist()
+    for (geometry, alt_loc, _), label in zip(rows, labels):
+        getattr(geometry, conformation_name)[alt_loc] = label
+
+
+def calculate_pseudorotations(geometries: "List[NucleotideGeometry]") -> None:
+    """
+    Calculate pseudorotation and tau_max of all alternative conformations of all geometries in one call
+    """
+    rows = [(geometry, alt_loc, thetas) for geometry in geometries for alt_loc, thetas in geometry.theta_rows()]
+    complete_thetas = [thetas for _, _, thetas in rows if thetas is not None]
+    pseudorotations: List[float] = []
+    tau_maxs: List[float] = []
+    if complete_thetas:
+        pseudorotation_array, _, tau_max_array, _ = pseudorotation_with_sd(np.array(complete_thetas, dtype=np.float64))
+        pseudorotations = pseudorotation_array.tolist()
+        tau_maxs = tau_max_array.tolist()
+
+    row = 0
+    for geometry, alt_loc, thetas in rows:
+        if thetas is None:
+            geometry.pseudorotation[alt_loc] = None
+            geometry.tau_max[alt_loc] = None
+        else:
+            geometry.pseudorotation[alt_loc] = pseudorotations[row]
+            geometry.tau_max[alt_loc] = tau_maxs[row]
+            row += 1
+
+
+def classify_conformations(geometries: "List[NucleotideGeometry]") -> "List[NucleotideGeometry]":
+    """
+    Classify torsion angles, calculate pseudorotation and sugar conformation of all geometries, one vectorized call per class
+    """
+    classify_torsions(geometries, "alpha", "alpha_conformation", classify_alpha_conformation)
+    classify_torsions(geometries, "gamma", "gamma_conformation", classify_gamma_conformation)
+    classify_torsions(geometries, "zeta", "zeta_conformation", classify_zeta_conformation)
+    calculate_pseudorotations(geometries)
+    classify_torsions(geometries, "pseudorotation", "sugar_conformation", classify_sugar_conformation)
+    classify_torsions(geometries, "chi", "chi_conformation", classify_chi_conformation)
+    return geometries
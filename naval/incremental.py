@@ -0,0 +1,239 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from naval.geometry_engine import calculate_torsions, classify_conformations
+from naval.nucleotide_geometry import NucleotideGeometry
+from naval.residue_cache_entry import ResidueCacheEntry
+from naval.validate import (
+    LINK_ATOM_NAMES,
+    VALIDATOR_CLASSES,
+    assign_residue_links,
+    link_candidates,
+    prepare_residue_cache,
+    residue_links,
+)
+from naval.validation_engine import ResolvedRestraint, validation_table
+from naval.validation_record import TorsionRecord
+from naval.validation_table import ValidationRecordView, ValidationTable
+from naval.validators.geometry_validator import GeometryValidator
+
+AnyRecord = Union[ValidationRecordView, TorsionRecord]
+
+
+class RecordsDiff:
+    """
+    Records changed by the coordinates update: (previous, updated) pairs of records with other value, label or restraint,
+    records present only before the update (removed) and only after the update (added),
+    and (previous, next) residue pairs linked or unlinked by the moved O3' and P atoms
+    """
+
+    __slots__ = ("changed", "added", "removed", "linked", "unlinked")
+
+    def __init__(self) -> None:
+        self.changed: List[Tuple[AnyRecord, AnyRecord]] = []
+        self.added: List[AnyRecord] = []
+        self.removed: List[AnyRecord] = []
+        self.linked: List[Tuple[ResidueCacheEntry, ResidueCacheEntry]] = []
+        self.unlinked: List[Tuple[ResidueCacheEntry, ResidueCacheEntry]] = []
+
+    def compare(self, previous: Dict[tuple, AnyRecord], updated: Dict[tuple, AnyRecord]) -> None:
+        for key, record in updated.items():
+            previous_record = previous.get(key)
+            if previous_record is None:
+                self.added.append(record)
+            elif _record_state(previous_record) != _record_state(record):
+                self.changed.append((previous_record, record))
+        self.removed.extend(record for key, record in previous.items() if key not in updated)
+
+    def __len__(self) -> int:
+        return len(self.changed) + len(self.added) + len(self.removed) + len(self.linked) + len(self.unlinked)
+
+
+def _record_state(record: AnyRecord) -> tuple:
+    if isinstance(record, TorsionRecord):
+        return record.calculated_value, record.calculated_value_label
+    return id(record.definition), record.calculated_value, record.label
+
+
+class ValidationSession:
+    """
+        Validation results of the structure kept between coordinate updates, for example during refinement.
+        After the update only residues with moved atoms and their linked neighbours are validated again:
+        torsions of a nucleotide use atoms of the previous and next residue, and restraints (PO4 atoms and conformation classes)
+        use the neighbouring residues and their torsions. When O3' or P atoms move, residues of their model are linked again
+    the same way as validate_structure links them, and residues with changed links are validated again too.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, structure) -> None:
+        self.structure = structure
+        self.residue_cache: List[ResidueCacheEntry] = prepare_residue_cache(structure)
+        self._residue_index = {id(residue_entry): i for i, residue_entry in enumerate(self.residue_cache)}
+
+        # all atoms (each alternative conformation separately) in the residue order
+        self.atoms = []
+        atom_residues = []
+        for i, residue_entry in enumerate(self.residue_cache):
+            residue_atoms = residue_entry.residue.get_unpacked_list()
+            self.atoms.extend(residue_atoms)
+            atom_residues.extend([i] * len(residue_atoms))
+        self.atom_residues = np.array(atom_residues, dtype=np.int64)
+        self.coords = self._atom_coords()
+
+        # O3' and P atoms (indices in atoms) of each model, to link residues again after they move
+        models: Dict[int, List[int]] = {}
+        for atom_index, atom in enumerate(self.atoms):
+            if atom.get_name() in LINK_ATOM_NAMES:
+                models.setdefault(id(self.residue_cache[atom_residues[atom_index]].model), []).append(atom_index)
+        self.link_model_ids = list(models)
+        self.link_atoms = [np.array(atom_indices, dtype=np.int64) for atom_indices in models.values()]
+        self.atom_link_models = np.full(len(self.atoms), -1, dtype=np.int64)
+        for model_index, atom_indices in enumerate(self.link_atoms):
+            self.atom_link_models[atom_indices] = model_index
+
+        self.residue_tables: List[ValidationTable] = [ValidationTable.empty()] * len(self.residue_cache)
+        self.residue_validators: List[np.ndarray] = [np.empty(0, dtype=np.uint8)] * len(self.residue_cache)
+        self.residue_geometry_records: List[List[TorsionRecord]] = [[] for _ in self.residue_cache]
+        indices = range(len(self.residue_cache))
+        self._validate_residues(indices, indices)
+
+    def _atom_coords(self) -> np.ndarray:
+        return np.array([atom.get_coord() for atom in self.atoms], dtype=np.float32).reshape(-1, 3)
+
+    def linked_residues(self, indices: Iterable[int]) -> Set[int]:
+        """
+        Indices (in residue_cache) of the residues and their linked previous and next residues
+        """
+        selected = set(indices)
+        for i in list(selected):
+            for neighbour in (self.residue_cache[i].prev_res, self.residue_cache[i].next_res):
+                if neighbour is not None:
+                    selected.add(self._residue_index[id(neighbour)])
+        return selected
+
+    def _relink_residues(self, model_indices: Iterable[int], diff: "RecordsDiff") -> Set[int]:
+        """
+        Link residues of the models again from the current O3' and P coordinates, record the link changes in the diff
+        and return indices of the residues with changed links
+        """
+        model_ids = {self.link_model_ids[model_index] for model_index in model_indices}
+        previous_links = {
+            (prev_index, next_index)
+            for prev_index, next_index in residue_links(self.residue_cache).tolist()
+            if id(self.residue_cache[prev_index].model) in model_ids
+        }
+        links = set()
+        for model_index in model_indices:
+            atom_indices = self.link_atoms[model_index]
+            is_o3 = np.array([self.atoms[i].get_name() == "O3'" for i in atom_indices.tolist()], dtype=bool)
+            altlocs = [self.atoms[i].get_altloc() for i in atom_indices.tolist()]
+            candidates = link_candidates(self.coords[atom_indices], self.atom_residues[atom_indices], is_o3, altlocs)
+            links.update(assign_residue_links(candidates))
+
+        for prev_index, next_index in sorted(previous_links - links):
+            self.residue_cache[prev_index].next_res = None
+            self.residue_cache[next_index].prev_res = None
+            diff.unlinked.append((self.residue_cache[prev_index], self.residue_cache[next_index]))
+        for prev_index, next_index in sorted(links - previous_links):
+            self.residue_cache[prev_index].next_res = self.residue_cache[next_index]
+            self.residue_cache[next_index].prev_res = self.residue_cache[prev_index]
+            diff.linked.append((self.residue_cache[prev_index], self.residue_cache[next_index]))
+        return {i for link in previous_links ^ links for i in link}
+
+    def _resolve_residue(self, residue_entry: ResidueCacheEntry) -> Tuple[List[ResolvedRestraint], List[int]]:
+        """
+        Restraints of the residue and index of the validator (in VALIDATOR_CLASSES) resolving each restraint
+        """
+        restraints: List[ResolvedRestraint] = []
+        validators: List[int] = []
+        if residue_entry.is_nucleotide() and residue_entry.geometry:
+            for validator_index, validator_class in enumerate(VALIDATOR_CLASSES):
+                validator_restraints = validator_class(residue_entry.geometry).resolve()
+                restraints.extend(validator_restraints)
+                validators.extend([validator_index] * len(validator_restraints))
+        return restraints, validators
+
+    def _validate_residues(self, geometry_indices: Iterable[int], restraint_indices: Iterable[int]) -> None:
+        """
+        Calculate geometry (torsions and conformations) of the first residues, then validate restraints of the second residues
+        in one batch and keep results of each residue
+        """
+        geometries = []
+        for i in sorted(geometry_indices):
+            residue_entry = self.residue_cache[i]
+            if residue_entry.is_nucleotide():
+                residue_entry.geometry = NucleotideGeometry(residue_entry)
+                geometries.append(residue_entry.geometry)
+        calculate_torsions(geometries)
+        classify_conformations(geometries)
+        for geometry in geometries:
+            i = self._residue_index[id(geometry.residue_entry)]
+            self.residue_geometry_records[i] = GeometryValidator(geometry).validate()
+
+        indices = sorted(restraint_indices)
+        restraints: List[ResolvedRestraint] = []
+        offsets = [0]
+        for i in indices:
+            residue_restraints, validators = self._resolve_residue(self.residue_cache[i])
+            restraints.extend(residue_restraints)
+            offsets.append(len(restraints))
+            self.residue_validators[i] = np.array(validators, dtype=np.uint8)
+        table = validation_table(restraints)
+        for i, start, end in zip(indices, offsets[:-1], offsets[1:]):
+            # the residue tables share atoms, geometries and definitions lists of the batch
+            self.residue_tables[i] = table.take(slice(start, end))
+
+    def _residue_records(self, i: int) -> Dict[tuple, AnyRecord]:
+        """
+        Records of the residue keyed by validator and atoms (bonds and angles) or by torsion name and altloc
+        """
+        records: Dict[tuple, AnyRecord] = {}
+        table = self.residue_tables[i]
+        for view, validator_index in zip(table, self.residue_validators[i].tolist()):
+            records[(validator_index, view.validation_type, id(view.atom1), id(view.atom2), id(view.atom3))] = view
+        for record in self.residue_geometry_records[i]:
+            records[(record.validation_type, record.name, record.alt_loc)] = record
+        return records
+
+    def update(self, coords: Optional[np.ndarray] = None) -> RecordsDiff:
+        """
+        Set the (n_atoms, 3) coordinates of atoms (in the order of the atoms attribute), or use the coordinates
+        changed directly in the structure atoms, and validate again residues with moved atoms and their neighbours.
+        Returns the diff of the records.
+        """
+        if coords is None:
+            updated_coords = self._atom_coords()
+            moved_atoms = np.flatnonzero(np.any(updated_coords != self.coords, axis=1))
+        else:
+            updated_coords = np.array(coords, dtype=np.float32).reshape(-1, 3)
+            if len(updated_coords) != len(self.atoms):
+                raise ValueError(f"Expected coordinates of {len(self.atoms)} atoms, got {len(updated_coords)}")
+            moved_atoms = np.flatnonzero(np.any(updated_coords != self.coords, axis=1))
+            for atom_index in moved_atoms.tolist():
+                self.atoms[atom_index].set_coord(updated_coords[atom_index].copy())
+        moved = np.unique(self.atom_residues[moved_atoms]).tolist()
+        self.coords = updated_coords
+
+        diff = RecordsDiff()
+        moved_link_models = np.unique(self.atom_link_models[moved_atoms])
+        relinked = self._relink_residues(moved_link_models[moved_link_models >= 0].tolist(), diff)
+
+        geometry_indices = self.linked_residues(set(moved) | relinked)
+        restraint_indices = self.linked_residues(geometry_indices)
+        previous = {i: self._residue_records(i) for i in restraint_indices}
+        self._validate_residues(geometry_indices, restraint_indices)
+
+        for i in sorted(restraint_indices):
+            diff.compare(previous[i], self._residue_records(i))
+        return diff
+
+    def validation_table(self) -> ValidationTable:
+        """
+        Bonds and angles of all residues, the same rows as validate_structure returns
+        """
+        return ValidationTable.concatenate(self.residue_tables)
+
+    def geometry_records(self) -> List[TorsionRecord]:
+        return [record for records in self.residue_geometry_records for record in records]
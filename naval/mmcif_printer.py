@@ -0,0 +1,127 @@
+from typing import Iterable, Iterator, List, Optional, Sequence, TextIO
+
+from naval.printer import write_lines
+from naval.readers.compressed import open_structure_file, split_compression_extension
+from naval.restraint_definition import VALIDATION_LABELS
+from naval.validation_record import TorsionRecord
+from naval.validation_table import ValidationTable
+
+BOND_CATEGORY = "naval_bond"
+ANGLE_CATEGORY = "naval_angle"
+TORSION_CATEGORY = "naval_torsion"
+
+BOND_COLUMNS = ("id", "atom_site_id_1", "atom_site_id_2", "value", "target", "validation_label", "validator_name")
+ANGLE_COLUMNS = ("id", "atom_site_id_1", "atom_site_id_2", "atom_site_id_3", "value", "target", "validation_label", "validator_name")
+TORSION_COLUMNS = (
+    "id",
+    "type",
+    "name",
+    "pdbx_PDB_model_num",
+    "auth_asym_id",
+    "auth_comp_id",
+    "auth_seq_id",
+    "pdbx_PDB_ins_code",
+    "label_alt_id",
+    "value",
+    "validation_label",
+)
+# characters which can not start an unquoted CIF value
+CIF_RESERVED_PREFIXES = ("_", "#", "$", "'", '"', ";", "[", "]")
+
+
+def cif_value(value) -> str:
+    """
+    Format value as a CIF token, missing values are written as `.`
+    """
+    text = "" if value is None else str(value)
+    if not text:
+        return "."
+    if text.startswith(CIF_RESERVED_PREFIXES) or any(char.isspace() for char in text) or text in (".", "?"):
+        return f"'{text}'" if "'" not in text else f'"{text}"'
+    return text
+
+
+def format_loop(category: str, columns: Sequence[str], rows: Iterable[Sequence]) -> Iterator[str]:
+    yield "#"
+    yield "loop_"
+    for column in columns:
+        yield f"_{category}.{column}"
+    for row in rows:
+        yield " ".join(cif_value(value) for value in row)
+
+
+def _validation_rows(table: ValidationTable, n_atoms: int, decimals: int) -> Iterator[tuple]:
+    # rows are formatted directly from the table columns (atom_site ids of the atoms, definitions, values and label codes)
+    serials = [atom.get_serial_number() for atom in table.atoms]
+    rows = zip(table.atom_indices[:, :n_atoms].tolist(), table.definition_index.tolist(), table.calculated_value.tolist(), table.label_code.tolist())
+    for row_id, (atom_indices, definition_index, value, label_code) in enumerate(rows, 1):
+        definition = table.definitions[definition_index]
+        yield (
+            row_id,
+            *(serials[atom_index] for atom_index in atom_indices),
+            f"{value:.{decimals}f}",
+            f"{definition.csd_target:.{decimals}f}",
+            VALIDATION_LABELS[label_code],
+            definition.name,
+        )
+
+
+def _torsion_rows(geometry_records: Iterable[TorsionRecord]) -> Iterator[tuple]:
+    for row_id, record in enumerate(geometry_records, 1):
+        residue_entry = record.geometry.residue_entry
+        model = residue_entry.model
+        yield (
+            row_id,
+            record.validation_type,
+            record.name,
+            # models of files without MODEL records have serial number 0
+            model.serial_num or model.get_id() + 1,
+            residue_entry.chain.get_id(),
+            residue_entry.res_name,
+            residue_entry.resseq,
+            residue_entry.inscode.strip(),
+            record.alt_loc.strip(),
+            f"{record.calculated_value:.1f}" if record.calculated_value else "",
+            record.calculated_value_label,
+        )
+
+
+def is_mmcif_file(structure_filepath: str) -> bool:
+    return split_compression_extension(structure_filepath)[0].lower().endswith(".cif")
+
+
+def format_mmcif(
+    pdbcode: str,
+    validation_table: ValidationTable,
+    geometry_records: List[TorsionRecord],
+    structure_filepath: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Yield lines of the mmCIF file with the bond, angle and torsion results as naval_bond, naval_angle and naval_torsion
+    categories, bonds and angles are keyed to the atom_site ids. With the mmCIF structure file, its content is copied first
+    and the categories are appended to its (last) data block, otherwise the lines form a sidecar data block.
+    """
+    if structure_filepath and is_mmcif_file(structure_filepath):
+        with open_structure_file(structure_filepath) as structure_file:
+            for line in structure_file:
+                yield line.rstrip("\n")
+    else:
+        yield f"data_{pdbcode}"
+
+    yield from format_loop(BOND_CATEGORY, BOND_COLUMNS, _validation_rows(validation_table.bonds(), 2, 3))
+    yield from format_loop(ANGLE_CATEGORY, ANGLE_COLUMNS, _validation_rows(validation_table.angles(), 3, 1))
+    yield from format_loop(TORSION_CATEGORY, TORSION_COLUMNS, _torsion_rows(geometry_records))
+    yield "#"
+
+
+def write_mmcif(
+    out_file: TextIO,
+    pdbcode: str,
+    validation_table: ValidationTable,
+    geometry_records: List[TorsionRecord],
+    structure_filepath: Optional[str] = None,
+) -> None:
+    """
+    Write the results (and optionally the structure) to the mmCIF file in a single sequential pass
+    """
+    write_lines(out_file, format_mmcif(pdbcode, validation_table, geometry_records, structure_filepath))
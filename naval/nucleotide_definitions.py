@@ -2,3 +2,16 @@ NUCLEOTIDE_RES_NAMES = ("A", "C", "G", "T", "U", "DA", "DC", "DG", "DT", "DU")
 PURINES_RES_NAMES = ("A", "G", "DA", "DG")
 RNA_RES_NAMES = ("A", "C", "G", "T", "U")
 DNA_RES_NAMES = ("DA", "DC", "DG", "DT", "DU")
+# residues sharing the restraint tables
+RESIDUE_CLASSES = {
+    "A": "A_G",
+    "G": "A_G",
+    "U": "U_T_C",
+    "T": "U_T_C",
+    "C": "U_T_C",
+    "DA": "DA_DG",
+    "DG": "DA_DG",
+    "DU": "DU_DT_DC",
+    "DT": "DU_DT_DC",
+    "DC": "DU_DT_DC",
+}
@@ -1,14 +1,67 @@
-import math
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar
 
 import numpy as np
 from Bio.PDB.Atom import Atom
 from Bio.PDB.Residue import Residue
-from Bio.PDB.vectors import calc_dihedral
 
+from naval.geometry_engine import (
+    calculate_pseudorotations,
+    classify_alpha_conformation,
+    classify_chi_conformation,
+    classify_conformations,
+    classify_gamma_conformation,
+    classify_sugar_conformation,
+    classify_torsions,
+    classify_zeta_conformation,
+    dihedral_angles,
+    pseudorotation_with_sd,
+)
 from naval.nucleotide_definitions import PURINES_RES_NAMES
 from naval.residue_cache_entry import ResidueCacheEntry
 
+# atom names and relative residue positions of torsion angles, chi depends on the base
+TORSION_ATOMS = {
+    "alpha": (("O3'", "P", "O5'", "C5'"), (-1, 0, 0, 0)),
+    "beta": (("P", "O5'", "C5'", "C4'"), (0, 0, 0, 0)),
+    "gamma": (("O5'", "C5'", "C4'", "C3'"), (0, 0, 0, 0)),
+    "delta": (("C5'", "C4'", "C3'", "O3'"), (0, 0, 0, 0)),
+    "epsilon": (("C4'", "C3'", "O3'", "P"), (0, 0, 0, 1)),
+    "zeta": (("C3'", "O3'", "P", "O5'"), (0, 0, 1, 1)),
+    "theta0": (("C4'", "O4'", "C1'", "C2'"), (0, 0, 0, 0)),
+    "theta1": (("O4'", "C1'", "C2'", "C3'"), (0, 0, 0, 0)),
+    "theta2": (("C1'", "C2'", "C3'", "C4'"), (0, 0, 0, 0)),
+    "theta3": (("C2'", "C3'", "C4'", "O4'"), (0, 0, 0, 0)),
+    "theta4": (("C3'", "C4'", "O4'", "C1'"), (0, 0, 0, 0)),
+}
+PYRIMIDINE_CHI_ATOMS = ("O4'", "C1'", "N1", "C2")
+PURINE_CHI_ATOMS = ("O4'", "C1'", "N9", "C4")
+
+
+T = TypeVar("T")
+
+
+def _defined_values(values: Sequence[Optional[T]]) -> Optional[Tuple[T, ...]]:
+    defined = tuple(value for value in values if value is not None)
+    return defined if len(defined) == len(values) else None
+
+
+def theta_rows(thetas: Sequence[Dict[str, Optional[T]]]) -> List[Tuple[str, Optional[Tuple[T, ...]]]]:
+    """
+    Return (alt_loc, theta0-theta4) rows of the theta values by altloc, thetas are None if any torsion is undefined
+    """
+    alt_locs = set(thetas[0].keys())
+    for theta in thetas[1:]:
+        alt_locs.update(theta.keys())
+
+    rows: List[Tuple[str, Optional[Tuple[T, ...]]]] = []
+    if "" in alt_locs and len(alt_locs) == 1:
+        rows.append(("", _defined_values([theta[""] for theta in thetas])))
+
+    alt_locs.discard("")
+    for alt_loc in alt_locs:
+        rows.append((alt_loc, _defined_values([theta.get(alt_loc, theta.get("", None)) for theta in thetas])))
+    return rows
+
 
 class NucleotideGeometry:
     """
@@ -60,23 +113,18 @@ class NucleotideGeometry:
         atom_group: Atom = relative_residue[atom_name]
         return atom_group.disordered_get_list() if atom_group.is_disordered() else [atom_group]
 
-    @staticmethod
-    def _round_torsion(atom1: Atom, atom2: Atom, atom3: Atom, atom4: Atom):
-        torsion = calc_dihedral(atom1.get_vector(), atom2.get_vector(), atom3.get_vector(), atom4.get_vector())
-        return round(np.rad2deg(torsion), 1)
-
-    def _calculate_ordered_torsions(self, atom_names: List[str], atom_relative_positions: List[int]):
+    def _ordered_torsion_atoms(self, atom_names: Sequence[str], atom_relative_positions: Sequence[int]):
         try:
             atom1 = self.pick_atoms(atom_names[0], atom_relative_positions[0])[0]
             atom2 = self.pick_atoms(atom_names[1], atom_relative_positions[1])[0]
             atom3 = self.pick_atoms(atom_names[2], atom_relative_positions[2])[0]
             atom4 = self.pick_atoms(atom_names[3], atom_relative_positions[3])[0]
         except KeyError:
-            return {"": None}
-        return {"": self._round_torsion(atom1, atom2, atom3, atom4)}
+            return None
+        return [("", (atom1, atom2, atom3, atom4))]
 
-    def _calculate_disordered_torsions(self, atom_names: List[str], atom_relative_positions: List[int]) -> Dict[str, Optional[float]]:
-        torsions = {}
+    def _disordered_torsion_atoms(self, atom_names: Sequence[str], atom_relative_positions: Sequence[int]):
+        torsion_atoms = []
 
         try:
             atoms1 = self.pick_atoms(atom_names[0], atom_relative_positions[0])
@@ -84,7 +132,7 @@ class NucleotideGeometry:
             atoms3 = self.pick_atoms(atom_names[2], atom_relative_positions[2])
             atoms4 = self.pick_atoms(atom_names[3], atom_relative_positions[3])
         except KeyError:
-            return {"": None}
+            return None
 
         # pylint: disable=too-many-nested-blocks
         for atom1 in atoms1:
@@ -102,17 +150,46 @@ class NucleotideGeometry:
                         alt_locs.discard("")
                         # if not mixed (for example only "", or only one alternative fonformation "" and "A")
                         if len(alt_locs) <= 1:
-                            torsion = self._round_torsion(atom1, atom2, atom3, atom4)
                             alt_loc = ""
                             if len(alt_locs) == 1:
                                 alt_loc = alt_locs.pop()
-                            torsions[alt_loc] = torsion
-        return torsions
+                            torsion_atoms.append((alt_loc, (atom1, atom2, atom3, atom4)))
+        return torsion_atoms
 
-    def calculate_torsions(self, atom_names: List[str], atom_relative_positions: List[int]) -> Dict[str, Optional[float]]:
+    def torsion_atoms(self, atom_names: Sequence[str], atom_relative_positions: Sequence[int]) -> Optional[List[Tuple[str, Tuple[Atom, ...]]]]:
+        """
+        Select atoms of the torsion for all alternative conformations, return (alt_loc, atoms) pairs or None if any atom is missing
+        """
         if self.residue_entry.residue.is_disordered() == 0:
-            return self._calculate_ordered_torsions(atom_names, atom_relative_positions)
-        return self._calculate_disordered_torsions(atom_names, atom_relative_positions)
+            return self._ordered_torsion_atoms(atom_names, atom_relative_positions)
+        return self._disordered_torsion_atoms(atom_names, atom_relative_positions)
+
+    def calculate_torsions(self, atom_names: Sequence[str], atom_relative_positions: Sequence[int]) -> Dict[str, Optional[float]]:
+        torsion_atoms = self.torsion_atoms(atom_names, atom_relative_positions)
+        if torsion_atoms is None:
+            return {"": None}
+        coords = np.array([atom.get_coord() for _, atoms in torsion_atoms for atom in atoms], dtype=np.float64)
+        angles = dihedral_angles(coords).tolist()
+
+        torsions: Dict[str, Optional[float]] = {}
+        for (alt_loc, _), angle in zip(torsion_atoms, angles):
+            torsions[alt_loc] = angle
+        return torsions
+
+    def chi_atom_names(self) -> Tuple[str, ...]:
+        if self.residue_entry.res_name in PURINES_RES_NAMES:
+            return PURINE_CHI_ATOMS
+        return PYRIMIDINE_CHI_ATOMS
+
+    def torsion_definitions(self) -> List[Tuple[str, Tuple[str, ...], Tuple[int, ...]]]:
+        """
+        Return (torsion name, atom names, atom relative positions) of all torsions of the residue
+        """
+        definitions: List[Tuple[str, Tuple[str, ...], Tuple[int, ...]]] = [
+            (torsion_name, atom_names, positions) for torsion_name, (atom_names, positions) in TORSION_ATOMS.items()
+        ]
+        definitions.append(("chi", self.chi_atom_names(), (0, 0, 0, 0)))
+        return definitions
 
     @classmethod
     def _pseudorotation_with_sd(cls, theta0, theta1, theta2, theta3, theta4):
@@ -122,195 +199,78 @@ class NucleotideGeometry:
         :return: P in deg, standard deviation of P, Tm, standard deviation of Tm
         """
         # pylint: disable=too-many-arguments
-        # pylint: disable=too-many-locals
-
-        # the initial definition  is Theta(1) = C1-C2-C3-C4, Theta(2) = C2-C3-C4-O4, etc.
-        _theta = [theta2, theta3, theta4, theta0, theta1]
-
-        sum_sin = 0.0
-        sum_cos = 0.0
-
-        for i_t, _t in enumerate(_theta):
-            _x = 0.8 * math.pi * i_t
-            sum_sin += _t * math.sin(_x)
-            sum_cos += _t * math.cos(_x)
-
-        pseudo_deg = math.degrees(math.atan2(-sum_sin, sum_cos))
-
-        if pseudo_deg < 0.0:
-            pseudo_deg += 360.0
-
-        pseudo_rad = math.radians(pseudo_deg)
-        _tm = 0.4 * (math.cos(pseudo_rad) * sum_cos - math.sin(pseudo_rad) * sum_sin)
-
-        _st = 0.0
-        thc = [0.0, 0.0, 0.0, 0.0, 0.0]
-
-        for i_t, _t in enumerate(_theta):
-            thc[i_t] = _tm * math.cos(pseudo_rad + (0.8 * math.pi * i_t))
-            _d = _t - thc[i_t]
-            _st += _d * _d
-
-        sd_tm = math.sqrt(0.4 * _st / 3.0)
-        sd_p = sd_tm / math.radians(_tm)
-        return round(pseudo_deg, 1), sd_p, round(_tm, 1), sd_tm
+        pseudo_deg, sd_p, tau_max, sd_tm = pseudorotation_with_sd(np.array([theta0, theta1, theta2, theta3, theta4], dtype=np.float64))
+        return pseudo_deg[0], sd_p[0], tau_max[0], sd_tm[0]
 
     def calculate_alpha(self):
-        self.alpha = self.calculate_torsions(("O3'", "P", "O5'", "C5'"), (-1, 0, 0, 0))
+        self.alpha = self.calculate_torsions(*TORSION_ATOMS["alpha"])
 
     def calculate_alpha_conformation(self):
-        for alt_loc, angle in self.alpha.items():
-            if angle:
-                if 30 <= angle <= 110:
-                    self.alpha_conformation[alt_loc] = "sc+"
-                elif -110 <= angle <= -30:
-                    self.alpha_conformation[alt_loc] = "sc-"
-                elif angle <= -130 or angle > 110:
-                    self.alpha_conformation[alt_loc] = "ap"
-                else:
-                    self.alpha_conformation[alt_loc] = "other"
-            else:
-                self.alpha_conformation[alt_loc] = "undefined"
+        classify_torsions([self], "alpha", "alpha_conformation", classify_alpha_conformation)
 
     def calculate_beta(self):
-        self.beta = self.calculate_torsions(("P", "O5'", "C5'", "C4'"), (0, 0, 0, 0))
+        self.beta = self.calculate_torsions(*TORSION_ATOMS["beta"])
 
     def calculate_gamma(self):
-        self.gamma = self.calculate_torsions(("O5'", "C5'", "C4'", "C3'"), (0, 0, 0, 0))
+        self.gamma = self.calculate_torsions(*TORSION_ATOMS["gamma"])
 
     def calculate_gamma_conformation(self):
-        for alt_loc, angle in self.gamma.items():
-            if angle:
-                if 30 <= angle <= 90:
-                    self.gamma_conformation[alt_loc] = "gauche+"
-                elif -90 <= angle <= -30:
-                    self.gamma_conformation[alt_loc] = "gauche-"
-                elif 150 <= angle or angle <= -150:
-                    self.gamma_conformation[alt_loc] = "trans"
-                else:
-                    self.gamma_conformation[alt_loc] = "other"
-            else:
-                self.gamma_conformation[alt_loc] = "undefined"
+        classify_torsions([self], "gamma", "gamma_conformation", classify_gamma_conformation)
 
     def calculate_delta(self):
-        self.delta = self.calculate_torsions(("C5'", "C4'", "C3'", "O3'"), (0, 0, 0, 0))
+        self.delta = self.calculate_torsions(*TORSION_ATOMS["delta"])
 
     def calculate_epsilon(self):
-        self.epsilon = self.calculate_torsions(("C4'", "C3'", "O3'", "P"), (0, 0, 0, 1))
+        self.epsilon = self.calculate_torsions(*TORSION_ATOMS["epsilon"])
 
     def calculate_zeta(self):
-        self.zeta = self.calculate_torsions(("C3'", "O3'", "P", "O5'"), (0, 0, 1, 1))
+        self.zeta = self.calculate_torsions(*TORSION_ATOMS["zeta"])
 
     def calculate_zeta_conformation(self):
-        for alt_loc, angle in self.zeta.items():
-            if angle:
-                if 30 <= angle <= 110:
-                    self.zeta_conformation[alt_loc] = "sc+"
-                elif -110 <= angle <= -30:
-                    self.zeta_conformation[alt_loc] = "sc-"
-                elif angle <= -130 or angle > 110:
-                    self.zeta_conformation[alt_loc] = "ap"
-                else:
-                    self.zeta_conformation[alt_loc] = "other"
-            else:
-                self.zeta_conformation[alt_loc] = "undefined"
+        classify_torsions([self], "zeta", "zeta_conformation", classify_zeta_conformation)
 
     def calculate_theta_and_pseudorotation(self):
-        self.theta0 = self.calculate_torsions(("C4'", "O4'", "C1'", "C2'"), (0, 0, 0, 0))
-        self.theta1 = self.calculate_torsions(("O4'", "C1'", "C2'", "C3'"), (0, 0, 0, 0))
-        self.theta2 = self.calculate_torsions(("C1'", "C2'", "C3'", "C4'"), (0, 0, 0, 0))
-        self.theta3 = self.calculate_torsions(("C2'", "C3'", "C4'", "O4'"), (0, 0, 0, 0))
-        self.theta4 = self.calculate_torsions(("C3'", "C4'", "O4'", "C1'"), (0, 0, 0, 0))
+        self.theta0 = self.calculate_torsions(*TORSION_ATOMS["theta0"])
+        self.theta1 = self.calculate_torsions(*TORSION_ATOMS["theta1"])
+        self.theta2 = self.calculate_torsions(*TORSION_ATOMS["theta2"])
+        self.theta3 = self.calculate_torsions(*TORSION_ATOMS["theta3"])
+        self.theta4 = self.calculate_torsions(*TORSION_ATOMS["theta4"])
         self.calculate_pseudorotation()
 
+    def theta_rows(self) -> List[Tuple[str, Optional[Tuple[float, ...]]]]:
+        """
+        Return (alt_loc, theta0-theta4) rows used to calculate pseudorotation, thetas are None if any torsion is undefined
+        """
+        return theta_rows((self.theta0, self.theta1, self.theta2, self.theta3, self.theta4))
+
     def calculate_pseudorotation(self):
-        alt_locs = set(self.theta0.keys())
-        alt_locs.update(self.theta1.keys())
-        alt_locs.update(self.theta2.keys())
-        alt_locs.update(self.theta3.keys())
-        alt_locs.update(self.theta4.keys())
-
-        if "" in alt_locs and len(alt_locs) == 1:
-            if (
-                self.theta0[""] is not None
-                and self.theta1[""] is not None
-                and self.theta2[""] is not None
-                and self.theta3[""] is not None
-                and self.theta4[""] is not None
-            ):
-                pseudorotation, _, tau_max, _ = self._pseudorotation_with_sd(
-                    self.theta0[""], self.theta1[""], self.theta2[""], self.theta3[""], self.theta4[""]
-                )
-                self.pseudorotation[""] = pseudorotation
-                self.tau_max[""] = tau_max
-            else:
-                self.pseudorotation[""] = None
-                self.tau_max[""] = None
-
-        alt_locs.discard("")
-        for alt_loc in alt_locs:
-            if (
-                self.theta0.get(alt_loc, self.theta0.get("", None)) is not None
-                and self.theta1.get(alt_loc, self.theta1.get("", None)) is not None
-                and self.theta2.get(alt_loc, self.theta2.get("", None)) is not None
-                and self.theta3.get(alt_loc, self.theta3.get("", None)) is not None
-                and self.theta4.get(alt_loc, self.theta4.get("", None)) is not None
-            ):
-                pseudorotation, _, tau_max, _ = self._pseudorotation_with_sd(
-                    self.theta0.get(alt_loc, self.theta0.get("", None)),
-                    self.theta1.get(alt_loc, self.theta1.get("", None)),
-                    self.theta2.get(alt_loc, self.theta2.get("", None)),
-                    self.theta3.get(alt_loc, self.theta3.get("", None)),
-                    self.theta4.get(alt_loc, self.theta4.get("", None)),
-                )
-                self.pseudorotation[alt_loc] = pseudorotation
-                self.tau_max[alt_loc] = tau_max
-            else:
-                self.pseudorotation[alt_loc] = None
-                self.tau_max[alt_loc] = None
+        calculate_pseudorotations([self])
 
     def calulate_sugar_conformation(self):
-        for alt_loc, angle in self.pseudorotation.items():
-            if angle:
-                if 140 <= angle <= 190:
-                    self.sugar_conformation[alt_loc] = "C2'-endo"
-                elif 0 <= angle <= 36:
-                    self.sugar_conformation[alt_loc] = "C3'-endo"
-                else:
-                    self.sugar_conformation[alt_loc] = "other"
-            else:
-                self.sugar_conformation[alt_loc] = "undefined"
+        classify_torsions([self], "pseudorotation", "sugar_conformation", classify_sugar_conformation)
 
     def calculate_chi(self):
-        atoms_names = ["O4'", "C1'", "N1", "C2"]
-        if self.residue_entry.res_name in PURINES_RES_NAMES:
-            atoms_names = ["O4'", "C1'", "N9", "C4"]
-        self.chi = self.calculate_torsions(atoms_names, (0, 0, 0, 0))
+        self.chi = self.calculate_torsions(self.chi_atom_names(), (0, 0, 0, 0))
 
     def calculate_chi_conformation(self):
-        for alt_loc, angle in self.chi.items():
-            if angle:
-                if -90 <= angle <= 90:
-                    self.chi_conformation[alt_loc] = "syn"
-                else:
-                    self.chi_conformation[alt_loc] = "anti"
-            else:
-                self.chi_conformation[alt_loc] = "undefined"
+        classify_torsions([self], "chi", "chi_conformation", classify_chi_conformation)
 
     def calculate_conformation(self):
         self.calculate_alpha()
-        self.calculate_alpha_conformation()
         self.calculate_beta()
         self.calculate_gamma()
-        self.calculate_gamma_conformation()
         self.calculate_delta()
         self.calculate_epsilon()
         self.calculate_zeta()
-        self.calculate_zeta_conformation()
         self.calculate_theta_and_pseudorotation()
-        self.calulate_sugar_conformation()
         self.calculate_chi()
-        self.calculate_chi_conformation()
+        self.classify_conformation()
+
+    def classify_conformation(self):
+        """
+        Classify already calculated torsion angles, calculate pseudorotation and sugar conformation
+        """
+        classify_conformations([self])
 
     @staticmethod
     def _print_torsion(name, torsion, conformation=None):
@@ -0,0 +1,123 @@
+import functools
+import multiprocessing
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+from Bio.PDB.Atom import Atom
+
+from naval.residue_cache_entry import ResidueCacheEntry
+from naval.validation_engine import ResolvedRestraint, validation_table
+from naval.validation_record import TorsionRecord
+from naval.validation_table import ValidationTable
+
+# residue cache shared with the forked worker processes
+_RESIDUE_CACHE: List[ResidueCacheEntry] = []
+_RESIDUE_INDICES: Dict[int, int] = {}
+
+AtomKey = Tuple[int, str, str]
+# residue index, validation type, name, alt loc, calculated value and label of the torsion record
+EncodedTorsionRecord = Tuple[int, str, str, str, float, str]
+ResolveResidueEntry = Callable[[ResidueCacheEntry], Tuple[List[ResolvedRestraint], List[TorsionRecord]]]
+
+
+def partition_residue_cache(residue_cache: List[ResidueCacheEntry]) -> List[List[int]]:
+    """
+    Group residue indices by model and chain to balance the work of the worker processes.
+    Links may cross chains, partitions are validated correctly because the workers are forked with the whole linked residue cache
+    """
+    partitions: Dict[Tuple[int, str], List[int]] = {}
+    for i, residue_entry in enumerate(residue_cache):
+        partitions.setdefault((residue_entry.model.get_id(), residue_entry.chain.get_id()), []).append(i)
+    return list(partitions.values())
+
+
+def _atom_key(atom: Atom) -> AtomKey:
+    return _RESIDUE_INDICES[id(atom.get_parent())], atom.get_name(), atom.get_altloc()
+
+
+def _atom_from_key(residue_cache: List[ResidueCacheEntry], key: AtomKey) -> Atom:
+    residue_index, name, altloc = key
+    atom = residue_cache[residue_index].residue[name]
+    return atom.disordered_get(altloc) if atom.is_disordered() else atom
+
+
+def _encode_validation_table(table: ValidationTable) -> tuple:
+    return (
+        [_atom_key(atom) for atom in table.atoms],
+        [_RESIDUE_INDICES[id(geometry.residue_entry.residue)] for geometry in table.geometries],
+        table.definitions,
+        table.validation_type,
+        table.geometry_index,
+        table.definition_index,
+        table.atom_indices,
+        table.calculated_value,
+        table.label_code,
+    )
+
+
+def _decode_validation_table(residue_cache: List[ResidueCacheEntry], encoded_table: tuple) -> Tuple[ValidationTable, np.ndarray]:
+    """
+    Rebuild the worker table on the parent process atoms and geometries, return also residue index of each row
+    """
+    atom_keys, geometry_residues, definitions, *columns = encoded_table
+    table = ValidationTable(
+        [_atom_from_key(residue_cache, key) for key in atom_keys],
+        [residue_cache[i].get_geometry() for i in geometry_residues],
+        definitions,
+        *columns,
+    )
+    return table, np.array(geometry_residues, dtype=np.int64)[table.geometry_index]
+
+
+def _validate_partition(resolve_residue_entry: ResolveResidueEntry, indices: List[int]) -> Tuple[tuple, List[EncodedTorsionRecord]]:
+    """
+    Validate residues of one partition in the worker process (one batch for the whole partition),
+    results are returned as arrays and tuples of plain values
+    """
+    restraints = []
+    encoded_geometry_records: List[EncodedTorsionRecord] = []
+    for i in indices:
+        residue_restraints, geometry_records = resolve_residue_entry(_RESIDUE_CACHE[i])
+        restraints.extend(residue_restraints)
+        encoded_geometry_records.extend(
+            (i, record.validation_type, record.name, record.alt_loc, record.calculated_value, record.calculated_value_label)
+            for record in geometry_records
+        )
+    return _encode_validation_table(validation_table(restraints)), encoded_geometry_records
+
+
+def validate_residue_cache_parallel(
+    residue_cache: List[ResidueCacheEntry],
+    resolve_residue_entry: ResolveResidueEntry,
+    processes: int,
+) -> Tuple[ValidationTable, List[TorsionRecord]]:
+    """
+    Validate model/chain partitions of the prepared residue cache in a pool of forked worker processes.
+    Records are merged in the residue cache order, so the result is the same as for the serial validation.
+    """
+    # pylint: disable=global-statement
+    global _RESIDUE_CACHE, _RESIDUE_INDICES
+
+    partitions = partition_residue_cache(residue_cache)
+    _RESIDUE_CACHE = residue_cache
+    _RESIDUE_INDICES = {id(residue_entry.residue): i for i, residue_entry in enumerate(residue_cache)}
+    try:
+        # workers inherit the residue cache from the parent process, only plain values are sent back
+        with multiprocessing.get_context("fork").Pool(processes) as pool:
+            partition_results = pool.map(functools.partial(_validate_partition, resolve_residue_entry), partitions, chunksize=1)
+    finally:
+        _RESIDUE_CACHE = []
+        _RESIDUE_INDICES = {}
+
+    tables, row_residues = zip(*[_decode_validation_table(residue_cache, encoded_table) for encoded_table, _ in partition_results])
+    table = ValidationTable.concatenate(tables)
+    table = table.take(np.argsort(np.concatenate(row_residues), kind="stable"))
+
+    encoded_geometry_records = sorted(
+        (record for _, partition_geometry_records in partition_results for record in partition_geometry_records), key=lambda record: record[0]
+    )
+    geometry_records = [
+        TorsionRecord(validation_type, name, residue_cache[i].get_geometry(), alt_loc, calculated_value, calculated_value_label)
+        for i, validation_type, name, alt_loc, calculated_value, calculated_value_label in encoded_geometry_records
+    ]
+    return table, geometry_records
@@ -1,36 +1,62 @@
-from typing import List, Tuple
+from typing import Generic, Iterable, Iterator, List, TextIO, Tuple, TypeVar, Union
 
 from naval.validation_record import TorsionRecord, ValidationRecord
+from naval.validation_table import ValidationRecordView
 
+# bond and angle records, ValidationTable rows are views with the ValidationRecord interface
+BondAngleRecord = Union[ValidationRecord, ValidationRecordView]
+# records formatted by a printer
+RecordT = TypeVar("RecordT", bound=Union[ValidationRecord, ValidationRecordView, TorsionRecord])
 
-class Printer:
+# typed columns of the tabular outputs (Arrow, SQLite), all other columns are strings
+INT_COLUMNS = ("model_id",)
+FLOAT_COLUMNS = ("calculated", "target")
+
+
+class Printer(Generic[RecordT]):
     """
     Base class for all Printers.
     """
 
-    supported_record_types: Tuple[str] = tuple()  # type: ignore
+    supported_record_types: Tuple[str, ...] = tuple()
 
     @classmethod
     def format_header(cls):
         return ""
 
     @classmethod
-    def format_record(cls, record: ValidationRecord):
-        return record.validation_type
+    def record_values(cls, record: RecordT) -> tuple:
+        return (record.validation_type,)
+
+    @classmethod
+    def format_record(cls, record: RecordT):
+        return ",".join(str(_) for _ in cls.record_values(record))
 
     @classmethod
-    def print(cls, records: List[ValidationRecord]):
-        lines = []
+    def format_lines(cls, records: Iterable[RecordT]) -> Iterator[str]:
+        """
+        Yield the header and lines of the supported records one by one
+        """
         header = cls.format_header()
         if header:
-            lines.append(header)
+            yield header
         for record in records:
             if record.validation_type in cls.supported_record_types:
-                lines.append(cls.format_record(record))
-        return lines
+                yield cls.format_record(record)
 
+    @classmethod
+    def print(cls, records: Iterable[RecordT]):
+        return list(cls.format_lines(records))
 
-class BondsCsvPrinter(Printer):
+    @classmethod
+    def write(cls, records: Iterable[RecordT], out_file: TextIO) -> None:
+        """
+        Write lines to the file as the records are formatted, without building the whole output in memory
+        """
+        write_lines(out_file, cls.format_lines(records))
+
+
+class BondsCsvPrinter(Printer[BondAngleRecord]):
     """
     CSV printer converts Validation Records to lines of text.
     """
@@ -47,32 +73,28 @@ class BondsCsvPrinter(Printer):
         )
 
     @classmethod
-    def format_record(cls, record: ValidationRecord):
-        line = ",".join(
-            str(_)
-            for _ in (
-                record.validation_type,
-                record.geometry.residue_entry.pdbcode,
-                record.geometry.residue_entry.model.get_id(),
-                record.geometry.residue_entry.chain.get_id(),
-                record.atom1.get_parent().get_resname(),
-                str(record.atom1.get_parent().get_id()[1]) + record.atom1.get_parent().get_id()[2].strip(),
-                record.atom1.get_name(),
-                record.atom1.get_altloc().strip(),
-                record.atom2.get_parent().get_resname(),
-                str(record.atom2.get_parent().get_id()[1]) + record.atom2.get_parent().get_id()[2].strip(),
-                record.atom2.get_name(),
-                record.atom2.get_altloc().strip(),
-                round(record.calculated_value, 3),
-                round(record.target_value, 3),
-                record.label,
-                record.name,
-            )
+    def record_values(cls, record: BondAngleRecord) -> tuple:
+        return (
+            record.validation_type,
+            record.geometry.residue_entry.pdbcode,
+            record.geometry.residue_entry.model.get_id(),
+            record.geometry.residue_entry.chain.get_id(),
+            record.atom1.get_parent().get_resname(),
+            str(record.atom1.get_parent().get_id()[1]) + record.atom1.get_parent().get_id()[2].strip(),
+            record.atom1.get_name(),
+            record.atom1.get_altloc().strip(),
+            record.atom2.get_parent().get_resname(),
+            str(record.atom2.get_parent().get_id()[1]) + record.atom2.get_parent().get_id()[2].strip(),
+            record.atom2.get_name(),
+            record.atom2.get_altloc().strip(),
+            round(record.calculated_value, 3),
+            round(record.target_value, 3),
+            record.label,
+            record.name,
         )
-        return line
 
 
-class AnglesCsvPrinter(Printer):
+class AnglesCsvPrinter(Printer[BondAngleRecord]):
     """
     CSV printer converts Validation Records to lines of text.
     """
@@ -90,69 +112,126 @@ class AnglesCsvPrinter(Printer):
         )
 
     @classmethod
-    def format_record(cls, record: ValidationRecord):
-        line = ",".join(
-            str(_)
-            for _ in (
-                record.validation_type,
-                record.geometry.residue_entry.pdbcode,
-                record.geometry.residue_entry.model.get_id(),
-                record.geometry.residue_entry.chain.get_id(),
-                record.atom1.get_parent().get_resname(),
-                str(record.atom1.get_parent().get_id()[1]) + record.atom1.get_parent().get_id()[2].strip(),
-                record.atom1.get_name(),
-                record.atom1.get_altloc().strip(),
-                record.atom2.get_parent().get_resname(),
-                str(record.atom2.get_parent().get_id()[1]) + record.atom2.get_parent().get_id()[2].strip(),
-                record.atom2.get_name(),
-                record.atom2.get_altloc().strip(),
-                record.atom3.get_parent().get_resname() if record.atom3 else "",
-                str(record.atom3.get_parent().get_id()[1]) + record.atom3.get_parent().get_id()[2].strip() if record.atom3 else "",
-                record.atom3.get_name() if record.atom3 else "",
-                record.atom3.get_altloc().strip() if record.atom3 else "",
-                round(record.calculated_value, 1),
-                round(record.target_value, 1),
-                record.label,
-                record.name,
-            )
+    def record_values(cls, record: BondAngleRecord) -> tuple:
+        return (
+            record.validation_type,
+            record.geometry.residue_entry.pdbcode,
+            record.geometry.residue_entry.model.get_id(),
+            record.geometry.residue_entry.chain.get_id(),
+            record.atom1.get_parent().get_resname(),
+            str(record.atom1.get_parent().get_id()[1]) + record.atom1.get_parent().get_id()[2].strip(),
+            record.atom1.get_name(),
+            record.atom1.get_altloc().strip(),
+            record.atom2.get_parent().get_resname(),
+            str(record.atom2.get_parent().get_id()[1]) + record.atom2.get_parent().get_id()[2].strip(),
+            record.atom2.get_name(),
+            record.atom2.get_altloc().strip(),
+            record.atom3.get_parent().get_resname() if record.atom3 else "",
+            str(record.atom3.get_parent().get_id()[1]) + record.atom3.get_parent().get_id()[2].strip() if record.atom3 else "",
+            record.atom3.get_name() if record.atom3 else "",
+            record.atom3.get_altloc().strip() if record.atom3 else "",
+            round(record.calculated_value, 1),
+            round(record.target_value, 1),
+            record.label,
+            record.name,
         )
-        return line
 
 
-class GeometryCsvPrinter:
+class GeometryCsvPrinter(Printer[TorsionRecord]):
     """
     CSV printer converts Torsion Records to lines of text.
     """
 
+    supported_record_types: Tuple[str, ...] = ("torsion", "pseudorotation")
+
     @classmethod
     def format_header(cls):
         return "type,pdbcode,model_id,chain,res_name,resid,altloc,name,calculated,validation_label"
 
     @classmethod
-    def format_record(cls, record: TorsionRecord):
-        line = ",".join(
-            str(_)
-            for _ in (
-                record.validation_type,
-                record.geometry.residue_entry.pdbcode,
-                record.geometry.residue_entry.model.get_id(),
-                record.geometry.residue_entry.chain.get_id(),
-                record.geometry.residue_entry.res_name,
-                str(record.geometry.residue_entry.resseq) + record.geometry.residue_entry.inscode.strip(),
-                record.alt_loc.strip(),
-                record.name,
-                round(record.calculated_value, 1) if record.calculated_value else "",
-                record.calculated_value_label,
-            )
+    def record_values(cls, record: TorsionRecord) -> tuple:
+        return (
+            record.validation_type,
+            record.geometry.residue_entry.pdbcode,
+            record.geometry.residue_entry.model.get_id(),
+            record.geometry.residue_entry.chain.get_id(),
+            record.geometry.residue_entry.res_name,
+            str(record.geometry.residue_entry.resseq) + record.geometry.residue_entry.inscode.strip(),
+            record.alt_loc.strip(),
+            record.name,
+            round(record.calculated_value, 1) if record.calculated_value else "",
+            record.calculated_value_label,
         )
-        return line
 
-    @classmethod
-    def print(cls, records: List[TorsionRecord]):
-        lines = []
-        header = cls.format_header()
-        if header:
-            lines.append(header)
-        for record in records:
-            lines.append(cls.format_record(record))
-        return lines
+
+def write_lines(out_file: TextIO, lines: Iterable[str]) -> None:
+    for line in lines:
+        out_file.write(line)
+        out_file.write("\n")
+
+
+def write_validation_records(records: Iterable[BondAngleRecord], bonds_file: TextIO, angles_file: TextIO) -> None:
+    """
+    Write bonds and angles to their files in a single pass over the records
+    """
+    printers = {
+        validation_type: (printer, out_file)
+        for printer, out_file in ((BondsCsvPrinter, bonds_file), (AnglesCsvPrinter, angles_file))
+        for validation_type in printer.supported_record_types
+    }
+    for printer, out_file in printers.values():
+        write_lines(out_file, [printer.format_header()])
+    for record in records:
+        printer, out_file = printers[record.validation_type]
+        out_file.write(printer.format_record(record))
+        out_file.write("\n")
+
+
+def column_names(printer) -> List[str]:
+    return printer.format_header().split(",")
+
+
+def typed_value(name: str, value):
+    if name in FLOAT_COLUMNS:
+        # the same value as written to the CSV file, empty values are missing
+        return float(str(value)) if value != "" else None
+    if name in INT_COLUMNS:
+        return int(value)
+    return str(value)
+
+
+def typed_rows(printer, records: Iterable[Union[BondAngleRecord, TorsionRecord]]) -> Iterator[tuple]:
+    """
+    Yield the CSV columns of the records supported by the printer as typed values (int, float or None, str)
+    """
+    names = column_names(printer)
+    for record in records:
+        if record.validation_type in printer.supported_record_types:
+            yield tuple(typed_value(name, value) for name, value in zip(names, printer.record_values(record)))
+
+
+def record_fields(printer, records: Iterable[Union[BondAngleRecord, TorsionRecord]]) -> Iterator[List[str]]:
+    """
+    Yield the CSV fields (strings joined to the CSV lines) of the records supported by the printer
+    """
+    for record in records:
+        if record.validation_type in printer.supported_record_types:
+            yield [str(value) for value in printer.record_values(record)]
+
+
+def lines_from_fields(printer, rows: Iterable[List[str]]) -> Iterator[str]:
+    """
+    Yield the header and CSV lines of the record_fields rows, the same lines as printed for the records
+    """
+    yield printer.format_header()
+    for row in rows:
+        yield ",".join(row)
+
+
+def typed_rows_from_fields(printer, rows: Iterable[List[str]]) -> Iterator[tuple]:
+    """
+    Yield typed values of the record_fields rows, the same values as typed_rows of the records
+    """
+    names = column_names(printer)
+    for row in rows:
+        yield tuple(typed_value(name, value) for name, value in zip(names, row))
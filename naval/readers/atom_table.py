@@ -0,0 +1,200 @@
+import warnings
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+from Bio.PDB.PDBExceptions import PDBConstructionException, PDBConstructionWarning
+from Bio.PDB.Structure import Structure
+from Bio.PDB.StructureBuilder import StructureBuilder
+
+# backbone atoms linking neighbouring nucleotides, dropped residues with them are most likely modified nucleotides
+LINK_ATOM_NAMES = ("P", "O3'")
+
+
+def warn_dropped_nucleotides(res_names: Iterable[str]) -> None:
+    """
+    Warn about nucleotide-like residues (with P or O3' atoms) dropped while parsing,
+    their standard neighbours lose the links through them
+    """
+    dropped = sorted(set(res_names))
+    if dropped:
+        warnings.warn(
+            f"Dropped residues with P or O3' atoms: {','.join(dropped)}, "
+            "pass them with --modified-nucleotides to keep the links of their neighbouring nucleotides"
+        )
+
+
+class AtomTable:
+    """
+    Columnar (struct-of-arrays) representation of the atom records of a structure
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = (
+        "serial",
+        "name",
+        "altloc",
+        "res_name",
+        "chain",
+        "resseq",
+        "inscode",
+        "hetero",
+        "model",
+        "element",
+        "xyz",
+        "occupancy",
+        "bfactor",
+    )
+
+    def __init__(
+        self,
+        serial: np.ndarray,
+        name: np.ndarray,
+        altloc: np.ndarray,
+        res_name: np.ndarray,
+        chain: np.ndarray,
+        resseq: np.ndarray,
+        inscode: np.ndarray,
+        hetero: np.ndarray,
+        model: np.ndarray,
+        element: np.ndarray,
+        xyz: np.ndarray,
+        occupancy: np.ndarray,
+        bfactor: np.ndarray,
+    ) -> None:
+        """
+        All columns are expected to have the same length (one row per atom, alternative conformations
+        are kept as separate rows). Blank altloc and insertion code are stored as " ",
+        hetero flag is " " for ATOM, "H" for HETATM and "W" for water records.
+        """
+        # pylint: disable=too-many-arguments
+        # pylint: disable=too-many-locals
+        self.serial = serial
+        self.name = name
+        self.altloc = altloc
+        self.res_name = res_name
+        self.chain = chain
+        self.resseq = resseq
+        self.inscode = inscode
+        self.hetero = hetero
+        self.model = model
+        self.element = element
+        self.xyz = xyz
+        self.occupancy = occupancy
+        self.bfactor = bfactor
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def select(self, mask: np.ndarray) -> "AtomTable":
+        """
+        Return a new table with the rows selected by the boolean mask (or index array)
+        """
+        return AtomTable(*(getattr(self, column)[mask] for column in self.__slots__))
+
+
+def build_structure(table: AtomTable, structure_id: str, selected: Optional[np.ndarray] = None) -> Structure:
+    """
+    Build a Biopython Structure from the atom table, following the same rules as the Biopython parsers
+    (a new model on model number change, a new chain on chain change, a new residue on residue id or name change)
+    """
+    # pylint: disable=too-many-locals
+    if selected is not None:
+        table = table.select(selected)
+
+    builder = StructureBuilder()
+    builder.init_structure(structure_id)
+    builder.init_seg(" ")
+
+    current_model = None
+    current_model_id = -1
+    current_chain = None
+    current_residue = None
+
+    columns = zip(
+        table.serial.tolist(),
+        table.name.tolist(),
+        table.altloc.tolist(),
+        table.res_name.tolist(),
+        table.chain.tolist(),
+        table.resseq.tolist(),
+        table.inscode.tolist(),
+        table.hetero.tolist(),
+        table.model.tolist(),
+        table.element.tolist(),
+        table.xyz,
+        table.occupancy.tolist(),
+        table.bfactor.tolist(),
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", PDBConstructionWarning)
+        for line, (serial, name, altloc, res_name, chain, resseq, inscode, hetero, model, element, xyz, occupancy, bfactor) in enumerate(columns):
+            builder.set_line_counter(line)
+            if model != current_model:
+                current_model = model
+                current_model_id += 1
+                builder.init_model(current_model_id, model)
+                current_chain = None
+                current_residue = None
+
+            if chain != current_chain:
+                current_chain = chain
+                builder.init_chain(chain)
+                current_residue = None
+
+            residue = (hetero, resseq, inscode, res_name)
+            try:
+                if residue != current_residue:
+                    current_residue = residue
+                    builder.init_residue(res_name, hetero, resseq, inscode)
+                builder.init_atom(name, xyz, bfactor, occupancy, altloc, name, serial, element or None)
+            except PDBConstructionException as exception:
+                warnings.warn(f"PDBConstructionException: {exception}, exception ignored", PDBConstructionWarning)
+    return builder.get_structure()
+
+
+def _hetero_flag(residue) -> str:
+    field = residue.get_id()[0]
+    return "H" if field.startswith("H_") else field
+
+
+def _structure_atoms(structure: Structure) -> Iterator:
+    """
+    Yield all atoms of the structure including the alternative conformations of disordered atoms and residues
+    """
+    for residue_group in structure.get_residues():
+        residues = residue_group.disordered_get_list() if residue_group.is_disordered() == 2 else [residue_group]
+        for residue in residues:
+            for atom_group in residue:
+                atoms = atom_group.disordered_get_list() if atom_group.is_disordered() else [atom_group]
+                # atoms with blank altloc have to be added before the alternative conformations
+                yield from sorted(atoms, key=lambda atom: atom.get_altloc() != " ")
+
+
+def atom_table_from_structure(structure: Structure) -> AtomTable:
+    """
+    Convert the Biopython Structure back to the AtomTable, the table builds the same structure with build_structure
+    """
+    rows = []
+    for atom in _structure_atoms(structure):
+        residue = atom.get_parent()
+        chain = residue.get_parent()
+        _, resseq, inscode = residue.get_id()
+        rows.append((atom, residue.get_resname(), chain.get_id(), resseq, inscode, _hetero_flag(residue), chain.get_parent().serial_num))
+
+    return AtomTable(
+        serial=np.array([row[0].get_serial_number() for row in rows], dtype=np.int64),
+        name=np.array([row[0].get_name() for row in rows], dtype=str),
+        altloc=np.array([row[0].get_altloc() for row in rows], dtype=str),
+        res_name=np.array([row[1] for row in rows], dtype=str),
+        chain=np.array([row[2] for row in rows], dtype=str),
+        resseq=np.array([row[3] for row in rows], dtype=np.int64),
+        inscode=np.array([row[4] for row in rows], dtype=str),
+        hetero=np.array([row[5] for row in rows], dtype=str),
+        model=np.array([row[6] for row in rows], dtype=np.int64),
+        element=np.array([row[0].element or "" for row in rows], dtype=str),
+        xyz=np.array([row[0].get_coord() for row in rows], dtype=np.float32).reshape(-1, 3),
+        occupancy=np.array([row[0].get_occupancy() for row in rows], dtype=np.float64),
+        bfactor=np.array([row[0].get_bfactor() for row in rows], dtype=np.float64),
+    )
@@ -0,0 +1,147 @@
+from typing import BinaryIO, Dict, Optional, Sequence, Union
+
+import numpy as np
+
+from naval.readers.atom_table import AtomTable
+from naval.readers.mmcif_reader import atom_table_from_columns
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+# BinaryCIF data types of the ByteArray encoding
+BYTE_ARRAY_TYPES: Dict[int, np.dtype] = {
+    1: np.dtype("<i1"),
+    2: np.dtype("<i2"),
+    3: np.dtype("<i4"),
+    4: np.dtype("<u1"),
+    5: np.dtype("<u2"),
+    6: np.dtype("<u4"),
+    32: np.dtype("<f4"),
+    33: np.dtype("<f8"),
+}
+
+# only the columns used to build the structure are decoded
+ATOM_SITE_COLUMNS = (
+    "group_PDB",
+    "id",
+    "type_symbol",
+    "label_atom_id",
+    "label_alt_id",
+    "label_comp_id",
+    "label_asym_id",
+    "label_seq_id",
+    "pdbx_PDB_ins_code",
+    "Cartn_x",
+    "Cartn_y",
+    "Cartn_z",
+    "occupancy",
+    "B_iso_or_equiv",
+    "auth_seq_id",
+    "auth_asym_id",
+    "pdbx_PDB_model_num",
+)
+
+
+def _decode_byte_array(data, encoding: dict) -> np.ndarray:
+    return np.frombuffer(data, dtype=BYTE_ARRAY_TYPES[encoding["type"]])
+
+
+def _decode_fixed_point(data: np.ndarray, encoding: dict) -> np.ndarray:
+    return data.astype(np.float64) / encoding["factor"]
+
+
+def _decode_interval_quantization(data: np.ndarray, encoding: dict) -> np.ndarray:
+    delta = (encoding["max"] - encoding["min"]) / (encoding["numSteps"] - 1)
+    return encoding["min"] + delta * data.astype(np.float64)
+
+
+def _decode_run_length(data: np.ndarray, encoding: dict) -> np.ndarray:
+    return np.repeat(data[0::2], data[1::2]).astype(BYTE_ARRAY_TYPES[encoding["srcType"]])
+
+
+def _decode_delta(data: np.ndarray, encoding: dict) -> np.ndarray:
+    dtype = BYTE_ARRAY_TYPES[encoding["srcType"]]
+    return (np.cumsum(data, dtype=np.int64) + encoding["origin"]).astype(dtype)
+
+
+def _decode_integer_packing(data: np.ndarray, encoding: dict) -> np.ndarray:
+    # values equal to the packing limits are continued in the next element
+    upper = np.iinfo(data.dtype).max
+    lower = np.iinfo(data.dtype).min
+    is_continued = data == upper if encoding["isUnsigned"] else (data == upper) | (data == lower)
+    if not is_continued.any():
+        return data.astype(np.int32)
+    group_ends = np.flatnonzero(~is_continued)
+    group_starts = np.concatenate(([0], group_ends[:-1] + 1))
+    return np.add.reduceat(data.astype(np.int32), group_starts)
+
+
+def _decode_string_array(data: np.ndarray, encoding: dict) -> np.ndarray:
+    offsets = decode_data(encoding["offsets"], encoding["offsetEncoding"])
+    indices = decode_data(data, encoding["dataEncoding"])
+    string_data = encoding["stringData"]
+    # the last (empty) string is selected by the -1 index of values which are not present
+    strings = [string_data[start:end] for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())] + [""]
+    return np.array(strings, dtype=str)[indices]
+
+
+DECODERS = {
+    "ByteArray": _decode_byte_array,
+    "FixedPoint": _decode_fixed_point,
+    "IntervalQuantization": _decode_interval_quantization,
+    "RunLength": _decode_run_length,
+    "Delta": _decode_delta,
+    "IntegerPacking": _decode_integer_packing,
+    "StringArray": _decode_string_array,
+}
+
+
+def decode_data(data, encodings) -> np.ndarray:
+    """
+    Decode BinaryCIF data by applying the encodings in the reverse order
+    """
+    for encoding in reversed(encodings):
+        data = DECODERS[encoding["kind"]](data, encoding)
+    return data
+
+
+def decode_column(column: dict) -> np.ndarray:
+    """
+    Decode BinaryCIF column, not specified (mask 1) and unknown (mask 2) values are mapped to `.` and `?` like in the text mmCIF
+    """
+    values = decode_data(column["data"]["data"], column["data"]["encoding"])
+    if column.get("mask"):
+        mask = decode_data(column["mask"]["data"], column["mask"]["encoding"])
+        if mask.any():
+            values = np.where(mask == 0, values.astype(str), np.where(mask == 1, ".", "?"))
+    return values
+
+
+def read_atom_site_binary_columns(content: bytes) -> Dict[str, np.ndarray]:
+    """
+    Decode the _atom_site columns of the first data block of BinaryCIF file
+    """
+    if msgpack is None:
+        raise ImportError("BinaryCIF support requires the msgpack package (pip install naval[bcif])")
+    data = msgpack.unpackb(content, raw=False)
+    for category in data["dataBlocks"][0]["categories"]:
+        if category["name"] == "_atom_site":
+            return {column["name"]: decode_column(column) for column in category["columns"] if column["name"] in ATOM_SITE_COLUMNS}
+    raise ValueError("Missing _atom_site category")
+
+
+def read_bcif_atom_table(source: Union[str, bytes, BinaryIO], res_names: Optional[Sequence[str]] = None) -> AtomTable:
+    """
+    Read the _atom_site category of the BinaryCIF file (path, bytes or binary handle) directly into the AtomTable,
+    optionally keeping only atoms of residues with given names
+    """
+    if isinstance(source, str):
+        with open(source, "rb") as handle:
+            content = handle.read()
+    elif isinstance(source, bytes):
+        content = source
+    else:
+        content = source.read()
+    return atom_table_from_columns(read_atom_site_binary_columns(content), res_names)
@@ -0,0 +1,71 @@
+import bz2
+import gzip
+import lzma
+import os
+from typing import IO, BinaryIO, Callable, Dict, Optional, TextIO, Tuple, cast
+
+COMPRESSION_OPENERS: Dict[str, Callable[..., IO]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+# leading bytes of the compressed content
+COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", ".gz"),
+    (b"BZh", ".bz2"),
+    (b"\xfd7zXZ\x00", ".xz"),
+)
+COMPRESSION_DECOMPRESSORS = {
+    ".gz": gzip.decompress,
+    ".bz2": bz2.decompress,
+    ".xz": lzma.decompress,
+}
+
+
+def split_compression_extension(file_path: str) -> Tuple[str, str]:
+    """
+    Split the compression extension from the file path, for example `1abc.cif.gz` -> (`1abc.cif`, `.gz`).
+    Returns empty extension for not compressed files.
+    """
+    base, ext = os.path.splitext(file_path)
+    if ext.lower() in COMPRESSION_OPENERS:
+        return base, ext.lower()
+    return file_path, ""
+
+
+def _opener(file_path: str) -> Callable[..., IO]:
+    _, compression = split_compression_extension(file_path)
+    return COMPRESSION_OPENERS.get(compression, open)
+
+
+def open_structure_file(file_path: str) -> TextIO:
+    """
+    Open the (optionally compressed) structure file as text, compressed files are decompressed on the fly while reading
+    """
+    return cast(TextIO, _opener(file_path)(file_path, "rt", encoding="utf-8"))
+
+
+def open_structure_binary_file(file_path: str) -> BinaryIO:
+    """
+    Open the (optionally compressed) structure file in the binary mode
+    """
+    return cast(BinaryIO, _opener(file_path)(file_path, "rb"))
+
+
+def content_compression(content: bytes) -> Optional[str]:
+    """
+    Compression extension detected from the leading bytes of the content, None for not compressed content
+    """
+    for magic, compression in COMPRESSION_MAGIC:
+        if content.startswith(magic):
+            return compression
+    return None
+
+
+def decompress_content(content: bytes) -> bytes:
+    """
+    Decompress content held in memory (compression is detected from the content), not compressed content is returned unchanged
+    """
+    compression = content_compression(content)
+    return COMPRESSION_DECOMPRESSORS[compression](content) if compression else content
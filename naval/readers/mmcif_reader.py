@@ -0,0 +1,150 @@
+import re
+from typing import Dict, List, Optional, Sequence, TextIO, Union
+
+import numpy as np
+
+from naval.readers.atom_table import (
+    LINK_ATOM_NAMES,
+    AtomTable,
+    warn_dropped_nucleotides,
+)
+
+# two special chars as placeholders in the mmCIF format for values that cannot be explicitly assigned
+UNASSIGNED = (".", "?")
+
+ATOM_SITE_LOOP_RE = re.compile(r"^loop_[ \t]*\r?\n((?:[ \t]*_atom_site\.\S+[ \t]*\r?\n)+)", re.MULTILINE)
+LOOP_END_RE = re.compile(r"^(?:#|loop_|_|data_|save_)", re.MULTILINE)
+# quoted value ends with the quote followed by a whitespace, so the quotes may appear inside the value (e.g. "O5'")
+TOKEN_RE = re.compile(r"""'.*?'(?=\s)|".*?"(?=\s)|\S+""")
+
+
+def _tokenize(body: str) -> List[str]:
+    if "'" not in body and '"' not in body:
+        return body.split()
+    if "\n;" in body:
+        raise ValueError("Multi-line text fields are not supported in the _atom_site loop")
+    return [token[1:-1] if token[0] in "'\"" else token for token in TOKEN_RE.findall(body + "\n")]
+
+
+def _tokenize_selected(body: str, n_columns: int, res_name_column: int, atom_name_column: int, res_names: Sequence[str]) -> List[str]:
+    """
+    Tokenize the loop line by line and keep only values of the rows with selected residue names,
+    so other residues (protein, water) are never stored in the columns
+    """
+    if "\n;" in body:
+        raise ValueError("Multi-line text fields are not supported in the _atom_site loop")
+    selected_names = set(res_names)
+    dropped_nucleotides = set()
+    tokens: List[str] = []
+    row: List[str] = []
+    for line in body.splitlines():
+        row.extend(_tokenize(line))
+        # a row is usually one line, but it may also span several lines
+        while len(row) >= n_columns:
+            if row[res_name_column] in selected_names:
+                tokens.extend(row[:n_columns])
+            elif row[atom_name_column] in LINK_ATOM_NAMES:
+                dropped_nucleotides.add(row[res_name_column])
+            row = row[n_columns:]
+    # incomplete row is kept to report the wrong number of values
+    tokens.extend(row)
+    warn_dropped_nucleotides(dropped_nucleotides)
+    return tokens
+
+
+def read_atom_site_columns(text: str, res_names: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    Tokenize the _atom_site loop of the mmCIF file into a dictionary of string arrays, one array per column.
+    If res_names is given, only rows of residues (label_comp_id) with these names are kept.
+    """
+    loop_match = ATOM_SITE_LOOP_RE.search(text)
+    if loop_match is None:
+        raise ValueError("Missing _atom_site loop")
+    headers = [line.strip().split(".", 1)[1] for line in loop_match.group(1).splitlines()]
+
+    start = loop_match.end()
+    end_match = LOOP_END_RE.search(text, start)
+    end = end_match.start() if end_match else len(text)
+    body = text[start:end]
+
+    if res_names is not None and "label_comp_id" in headers:
+        tokens = _tokenize_selected(body, len(headers), headers.index("label_comp_id"), headers.index("label_atom_id"), res_names)
+    else:
+        tokens = _tokenize(body)
+    if len(tokens) % len(headers) != 0:
+        raise ValueError(f"Number of values in the _atom_site loop is not a multiple of {len(headers)}")
+    values = np.array(tokens, dtype=str).reshape(-1, len(headers))
+    return {header: values[:, i] for i, header in enumerate(headers)}
+
+
+def _assigned_or_blank(column: np.ndarray) -> np.ndarray:
+    # empty strings come from not present values of BinaryCIF string arrays
+    return np.where(np.isin(column, UNASSIGNED + ("",)), " ", column)
+
+
+def atom_table_from_columns(columns: Dict[str, np.ndarray], res_names: Optional[Sequence[str]] = None) -> AtomTable:
+    """
+    Convert the mmCIF _atom_site columns to the AtomTable, using the same (auth) identifiers as MMCIFParser.
+    If res_names is given, only atoms of residues with these names are converted.
+    """
+    resseq = columns["auth_seq_id"] if "auth_seq_id" in columns else columns["label_seq_id"]
+    chain = columns["auth_asym_id"] if "auth_asym_id" in columns else columns["label_asym_id"]
+
+    # atoms without residue id cannot be placed in the structure
+    selected = resseq != "." if resseq.dtype.kind == "U" else np.ones(len(resseq), dtype=bool)
+    if res_names is not None:
+        dropped = selected & ~np.isin(columns["label_comp_id"], res_names)
+        warn_dropped_nucleotides(columns["label_comp_id"][dropped & np.isin(columns["label_atom_id"], LINK_ATOM_NAMES)].tolist())
+        selected &= ~dropped
+    columns = {header: column[selected] for header, column in columns.items()}
+    resseq = resseq[selected]
+    chain = chain[selected]
+
+    res_name = columns["label_comp_id"]
+    hetero = np.where(columns["group_PDB"] == "HETATM", np.where(np.isin(res_name, ("HOH", "WAT")), "W", "H"), " ")
+
+    try:
+        serial = columns["id"].astype(np.int64)
+    except ValueError:
+        serial = columns["id"]
+
+    if "pdbx_PDB_model_num" in columns:
+        model = columns["pdbx_PDB_model_num"].astype(np.int64)
+    else:
+        model = np.zeros(len(res_name), dtype=np.int64)
+
+    if "type_symbol" in columns:
+        element = np.char.upper(columns["type_symbol"])
+    else:
+        element = np.full(len(res_name), "")
+
+    xyz = np.stack([columns["Cartn_x"], columns["Cartn_y"], columns["Cartn_z"]], axis=1).astype(np.float64).astype(np.float32)
+
+    return AtomTable(
+        serial=serial,
+        name=columns["label_atom_id"],
+        altloc=_assigned_or_blank(columns["label_alt_id"]),
+        res_name=res_name,
+        chain=chain,
+        resseq=resseq.astype(np.int64),
+        inscode=_assigned_or_blank(columns["pdbx_PDB_ins_code"]),
+        hetero=hetero,
+        model=model,
+        element=element,
+        xyz=xyz,
+        occupancy=columns["occupancy"].astype(np.float64),
+        bfactor=columns["B_iso_or_equiv"].astype(np.float64),
+    )
+
+
+def read_mmcif_atom_table(source: Union[str, TextIO], res_names: Optional[Sequence[str]] = None) -> AtomTable:
+    """
+    Read the _atom_site loop of the mmCIF file (path or text handle) directly into the AtomTable,
+    optionally keeping only atoms of residues with given names
+    """
+    if isinstance(source, str):
+        with open(source, "r", encoding="utf-8") as handle:
+            text = handle.read()
+    else:
+        text = source.read()
+    return atom_table_from_columns(read_atom_site_columns(text, res_names), res_names)
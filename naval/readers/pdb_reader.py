@@ -0,0 +1,138 @@
+import mmap
+from typing import BinaryIO, Optional, Sequence, Union
+
+import numpy as np
+
+from naval.readers.atom_table import (
+    LINK_ATOM_NAMES,
+    AtomTable,
+    warn_dropped_nucleotides,
+)
+
+ATOM_RECORDS = (b"ATOM  ", b"HETATM")
+END_RECORDS = (b"END   ", b"CONECT")
+
+
+def _record_mask(data: np.ndarray, line_starts: np.ndarray, line_ends: np.ndarray, records) -> np.ndarray:
+    return np.isin(_column(data, line_starts, line_ends, 0, 6), records)
+
+
+def _column(data: np.ndarray, line_starts: np.ndarray, line_ends: np.ndarray, start: int, end: int) -> np.ndarray:
+    """
+    Gather the fixed columns start:end of the lines straight from the buffer, one column at a time,
+    as byte strings, columns beyond the end of shorter lines are spaces
+    """
+    column = np.full((len(line_starts), end - start), ord(" "), dtype=np.uint8)
+    for offset in range(start, end):
+        positions = line_starts + offset
+        inside = positions < line_ends
+        column[inside, offset - start] = data[positions[inside]]
+    column[column == ord("\r")] = ord(" ")
+    return column.view(f"S{end - start}").ravel()
+
+
+def _to_numbers(column: np.ndarray, dtype, default) -> np.ndarray:
+    try:
+        return column.astype(dtype)
+    except ValueError:
+        # fall back to per value conversion only when some of the values are missing or malformed
+        values = []
+        for value in column.tolist():
+            try:
+                values.append(dtype(value))
+            except ValueError:
+                values.append(default)
+        return np.array(values, dtype=dtype)
+
+
+def _decode(column: np.ndarray) -> np.ndarray:
+    return column.astype(np.str_)
+
+
+def atom_table_from_buffer(data: np.ndarray, res_names: Optional[Sequence[str]] = None) -> AtomTable:
+    """
+    Slice the fixed ATOM/HETATM columns of the PDB file (as uint8 buffer) into the AtomTable,
+    using the same rules for atom names, residue ids and models as PDBParser.
+    If res_names is given, only atoms of residues with these names are converted.
+    """
+    # pylint: disable=too-many-locals
+    line_ends = np.flatnonzero(data == ord("\n"))
+    if len(data) and data[-1] != ord("\n"):
+        line_ends = np.append(line_ends, len(data))
+    line_starts = np.concatenate(([0], line_ends[:-1] + 1)).astype(line_ends.dtype)
+
+    # only the record names are read for all lines, other columns are gathered just for the coordinate records
+    selected = _record_mask(data, line_starts, line_ends, ATOM_RECORDS + END_RECORDS + (b"MODEL ",))
+    starts, ends = line_starts[selected], line_ends[selected]
+
+    # atomic data ends at the first END or CONECT record
+    end_lines = np.flatnonzero(_record_mask(data, starts, ends, END_RECORDS))
+    if len(end_lines):
+        starts, ends = starts[: end_lines[0]], ends[: end_lines[0]]
+
+    model_lines = np.flatnonzero(_record_mask(data, starts, ends, (b"MODEL ",)))
+    model_serials = _to_numbers(_column(data, starts[model_lines], ends[model_lines], 10, 14), np.int64, 0)
+    atom_lines = np.flatnonzero(_record_mask(data, starts, ends, ATOM_RECORDS))
+    # each atom belongs to the last MODEL record before it
+    model_index = np.searchsorted(model_lines, atom_lines) - 1
+    model = np.where(model_index >= 0, model_serials[model_index] if len(model_serials) else 0, 0)
+
+    starts, ends = starts[atom_lines], ends[atom_lines]
+
+    def column(start: int, end: int) -> np.ndarray:
+        return _column(data, starts, ends, start, end)
+
+    res_name = np.char.strip(_decode(column(17, 20)))
+    if res_names is not None:
+        selected = np.isin(res_name, res_names)
+        dropped_names = np.char.strip(_decode(_column(data, starts[~selected], ends[~selected], 12, 16)))
+        warn_dropped_nucleotides(res_name[~selected][np.isin(dropped_names, LINK_ATOM_NAMES)].tolist())
+        starts, ends = starts[selected], ends[selected]
+        model = model[selected]
+        res_name = res_name[selected]
+
+    fullname = _decode(column(12, 16))
+    name = np.char.strip(fullname)
+    # atom names with internal spaces (for example " N B") are not stripped
+    name = np.where(np.char.find(name, " ") >= 0, fullname, name)
+
+    hetero = np.where(column(0, 6) == b"HETATM", np.where(np.isin(res_name, ("HOH", "WAT")), "W", "H"), " ")
+
+    xyz = np.stack([column(30, 38), column(38, 46), column(46, 54)], axis=1).astype(np.float64).astype(np.float32)
+
+    return AtomTable(
+        serial=_to_numbers(column(6, 11), np.int64, 0),
+        name=name,
+        altloc=_decode(column(16, 17)),
+        res_name=res_name,
+        chain=_decode(column(21, 22)),
+        resseq=column(22, 26).astype(np.int64),
+        inscode=_decode(column(26, 27)),
+        hetero=hetero,
+        model=model,
+        element=np.char.upper(np.char.strip(_decode(column(76, 78)))),
+        xyz=xyz,
+        occupancy=_to_numbers(column(54, 60), np.float64, 1.0),
+        bfactor=_to_numbers(column(60, 66), np.float64, 0.0),
+    )
+
+
+def read_pdb_atom_table(source: Union[str, bytes, BinaryIO], res_names: Optional[Sequence[str]] = None) -> AtomTable:
+    """
+    Read ATOM/HETATM records of the PDB file into the AtomTable, optionally keeping only atoms of residues with given names.
+    File paths are memory-mapped, so the file is never split into Python line objects.
+    """
+    if isinstance(source, bytes):
+        return atom_table_from_buffer(np.frombuffer(source, dtype=np.uint8), res_names)
+    if not isinstance(source, str):
+        return atom_table_from_buffer(np.frombuffer(source.read(), dtype=np.uint8), res_names)
+
+    with open(source, "rb") as handle:
+        if handle.seek(0, 2) == 0:
+            return atom_table_from_buffer(np.zeros(0, dtype=np.uint8), res_names)
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = np.frombuffer(mapped, dtype=np.uint8)
+            table = atom_table_from_buffer(data, res_names)
+            # the buffer has to be released before the mapping is closed
+            del data
+    return table
@@ -58,5 +58,10 @@ class ResidueCacheEntry:
             return self.prev_res
         raise KeyError("Does not have prev residue cache entry")
 
+    def get_geometry(self) -> "NucleotideGeometry":
+        if self.geometry is not None:
+            return self.geometry
+        raise KeyError("Does not have nucleotide geometry")
+
     def is_nucleotide(self):
         return self.res_name in NUCLEOTIDE_RES_NAMES
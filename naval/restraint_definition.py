@@ -1,4 +1,49 @@
-class BondDefinition:
+from typing import Tuple
+
+# label codes of VALIDATION_LABELS
+CSD_PREFERRED, PDB_ACCEPTABLE, PDB_SUSPICIOUS, PDB_OUTLIER = range(4)
+VALIDATION_LABELS = ("CSD-preferred", "PDB-acceptable", "PDB-suspicious", "PDB-outlier")
+
+# (csd preferred left, right, pdb allowed left, right, pdb suspicious left, right)
+Thresholds = Tuple[float, float, float, float, float, float]
+
+
+def label_thresholds(
+    csd_target: float, csd_std: float, pdb_3low: float, pdb_3high: float, pdb_4low: float, pdb_4high: float, csd_sig: float = 3
+) -> Thresholds:
+    # pylint: disable=too-many-arguments
+    return (csd_target - csd_sig * csd_std, csd_target + csd_sig * csd_std, pdb_3low, pdb_3high, pdb_4low, pdb_4high)
+
+
+def classify_value(value: float, thresholds: Thresholds) -> int:
+    """
+    Return label code of the value, intervals are checked once in the order preferred, allowed, suspicious
+    """
+    if thresholds[0] <= value <= thresholds[1]:
+        return CSD_PREFERRED
+    if thresholds[2] <= value <= thresholds[3]:
+        return PDB_ACCEPTABLE
+    if thresholds[4] <= value <= thresholds[5]:
+        return PDB_SUSPICIOUS
+    return PDB_OUTLIER
+
+
+class RestraintDefinition:
+    """
+    Base class of bond and angle definitions with the label thresholds
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("thresholds",)
+
+    thresholds: Thresholds
+
+    def label_code(self, value: float) -> int:
+        return classify_value(value, self.thresholds)
+
+
+class BondDefinition(RestraintDefinition):
     """
     Simple container class for bond definitions
     """
@@ -56,9 +101,11 @@ class BondDefinition:
         self.pdb_3high = pdb_3high
         self.pdb_4low = pdb_4low
         self.pdb_4high = pdb_4high
+        # thresholds are calculated once per definition and shared by all validated bonds
+        self.thresholds: Thresholds = label_thresholds(csd_target, csd_std, pdb_3low, pdb_3high, pdb_4low, pdb_4high)
 
 
-class AngleDefinition:
+class AngleDefinition(RestraintDefinition):
     """
     Simple container class for angle definitions
     """
@@ -123,3 +170,5 @@ class AngleDefinition:
         self.pdb_3high = pdb_3high
         self.pdb_4low = pdb_4low
         self.pdb_4high = pdb_4high
+        # thresholds are calculated once per definition and shared by all validated angles
+        self.thresholds = label_thresholds(csd_target, csd_std, pdb_3low, pdb_3high, pdb_4low, pdb_4high)
@@ -0,0 +1,53 @@
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from naval.restraint_definition import AngleDefinition, BondDefinition
+
+# (residue class, conformation class, definitions) compiled into the index
+RestraintTable = Tuple[str, str, Iterable]
+
+
+class RestraintIndex:
+    """
+    Hash index of restraint definitions keyed by (validator, residue class, conformation class, atom names)
+    """
+
+    def __init__(self) -> None:
+        self.bonds: Dict[Tuple[str, str, str, str, str], BondDefinition] = {}
+        self.angles: Dict[Tuple[str, str, str, str, str, str], AngleDefinition] = {}
+        self.validators: Set[str] = set()
+
+    def clear(self) -> None:
+        self.bonds.clear()
+        self.angles.clear()
+        self.validators.clear()
+
+    def add_bonds(self, validator: str, residue_class: str, conformation_class: str, definitions: Iterable[BondDefinition]) -> None:
+        for definition in definitions:
+            # the first definition for given atom names wins, as with the linear scan of the definitions list
+            self.bonds.setdefault((validator, residue_class, conformation_class, definition.atom1_name, definition.atom2_name), definition)
+
+    def add_angles(self, validator: str, residue_class: str, conformation_class: str, definitions: Iterable[AngleDefinition]) -> None:
+        for definition in definitions:
+            self.angles.setdefault(
+                (validator, residue_class, conformation_class, definition.atom1_name, definition.atom2_name, definition.atom3_name), definition
+            )
+
+    def add_validator(self, validator: str, bond_tables: Iterable[RestraintTable], angle_tables: Iterable[RestraintTable]) -> None:
+        for residue_class, conformation_class, definitions in bond_tables:
+            self.add_bonds(validator, residue_class, conformation_class, definitions)
+        for residue_class, conformation_class, definitions in angle_tables:
+            self.add_angles(validator, residue_class, conformation_class, definitions)
+        self.validators.add(validator)
+
+    def bond(self, validator: str, residue_class: str, conformation_class: str, atom1_name: str, atom2_name: str) -> Optional[BondDefinition]:
+        return self.bonds.get((validator, residue_class, conformation_class, atom1_name, atom2_name))
+
+    def angle(
+        self, validator: str, residue_class: str, conformation_class: str, atom1_name: str, atom2_name: str, atom3_name: str
+    ) -> Optional[AngleDefinition]:
+        # pylint: disable=too-many-arguments
+        return self.angles.get((validator, residue_class, conformation_class, atom1_name, atom2_name, atom3_name))
+
+
+# index shared by all validators, restraint tables of a validator are compiled on its first use
+RESTRAINT_INDEX = RestraintIndex()
@@ -0,0 +1,141 @@
+import hashlib
+import os
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from naval.restraint_definition import AngleDefinition, BondDefinition
+from naval.restraint_index import RESTRAINT_INDEX
+
+RESTRAINT_LIBRARY_ENV = "NAVAL_RESTRAINT_LIBRARY"
+DEFAULT_RESTRAINT_LIBRARY_PATH = os.path.join(os.path.dirname(__file__), "data", "restraints.npy")
+
+# one row per restraint definition (ASCII strings), bonds have empty atom3_name
+RESTRAINT_COLUMNS = [
+    ("library", "S32"),
+    ("table", "S32"),
+    ("name", "S32"),
+    ("atom1_name", "S4"),
+    ("atom2_name", "S4"),
+    ("atom3_name", "S4"),
+    ("atom1_relative_res_position", "i1"),
+    ("atom2_relative_res_position", "i1"),
+    ("atom3_relative_res_position", "i1"),
+    ("csd_target", "f8"),
+    ("csd_std", "f8"),
+    ("pdb_count", "i8"),
+    ("pdb_mean", "f8"),
+    ("pdb_std", "f8"),
+    ("pdb_3low", "f8"),
+    ("pdb_3high", "f8"),
+    ("pdb_4low", "f8"),
+    ("pdb_4high", "f8"),
+]
+RESTRAINT_DTYPE = np.dtype(RESTRAINT_COLUMNS)
+RESTRAINT_FIELDS = [name for name, _ in RESTRAINT_COLUMNS]
+BOND_FIELDS = list(BondDefinition.__slots__)
+ANGLE_FIELDS = list(AngleDefinition.__slots__)
+
+RestraintTables = Dict[str, List[Union[BondDefinition, AngleDefinition]]]
+
+_RESTRAINT_LIBRARY_PATH: Optional[str] = None
+_RESTRAINT_LIBRARY: Optional[np.ndarray] = None
+_RESTRAINT_TABLES: Dict[str, RestraintTables] = {}
+_RESTRAINT_LIBRARY_FINGERPRINT: Optional[str] = None
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def restraint_library_path() -> str:
+    """
+    Path of the restraint library: set with use_restraint_library, NAVAL_RESTRAINT_LIBRARY environment variable or the bundled file
+    """
+    return _RESTRAINT_LIBRARY_PATH or os.environ.get(RESTRAINT_LIBRARY_ENV) or DEFAULT_RESTRAINT_LIBRARY_PATH
+
+
+def load_restraint_library(path: str) -> np.ndarray:
+    """
+    Memory map restraint library (.npy structured array)
+    """
+    library = np.load(path, mmap_mode="r", allow_pickle=False)
+    if library.dtype != RESTRAINT_DTYPE:
+        raise ValueError(f"Invalid restraint library: {path}")
+    return library
+
+
+def restraint_library() -> np.ndarray:
+    """
+    Restraint library loaded on the first use
+    """
+    global _RESTRAINT_LIBRARY  # pylint: disable=global-statement
+    if _RESTRAINT_LIBRARY is None:
+        _RESTRAINT_LIBRARY = load_restraint_library(restraint_library_path())
+    return _RESTRAINT_LIBRARY
+
+
+def restraint_library_fingerprint() -> str:
+    """
+    sha256 hex digest of the restraint definitions in use, changes with any updated target, sigma or threshold
+    """
+    global _RESTRAINT_LIBRARY_FINGERPRINT  # pylint: disable=global-statement
+    if _RESTRAINT_LIBRARY_FINGERPRINT is None:
+        _RESTRAINT_LIBRARY_FINGERPRINT = hashlib.sha256(np.ascontiguousarray(restraint_library()).tobytes()).hexdigest()
+    return _RESTRAINT_LIBRARY_FINGERPRINT
+
+
+def use_restraint_library(path: Optional[str] = None) -> None:
+    """
+    Switch to other restraint library file (None restores the default), drop already loaded and compiled restraints
+    """
+    global _RESTRAINT_LIBRARY_PATH, _RESTRAINT_LIBRARY, _RESTRAINT_LIBRARY_FINGERPRINT  # pylint: disable=global-statement
+    _RESTRAINT_LIBRARY_PATH = path
+    _RESTRAINT_LIBRARY = None
+    _RESTRAINT_LIBRARY_FINGERPRINT = None
+    _RESTRAINT_TABLES.clear()
+    RESTRAINT_INDEX.clear()
+
+
+def restraint_tables(library_name: str) -> RestraintTables:
+    """
+    Return restraint definitions of the library (for example PO4_BONDS) grouped by table name, in the library order
+    """
+    if library_name not in _RESTRAINT_TABLES:
+        library = restraint_library()
+        rows = library[library["library"] == library_name.encode()]
+        if len(rows) == 0:
+            raise KeyError(f"Missing restraint library: {library_name}")
+
+        tables: RestraintTables = {}
+        for row in rows.tolist():
+            values = {field: _decode(value) for field, value in zip(RESTRAINT_FIELDS, row)}
+            if values["atom3_name"]:
+                definition: Union[BondDefinition, AngleDefinition] = AngleDefinition(*(values[field] for field in ANGLE_FIELDS))
+            else:
+                definition = BondDefinition(*(values[field] for field in BOND_FIELDS))
+            tables.setdefault(values["table"], []).append(definition)
+        _RESTRAINT_TABLES[library_name] = tables
+    return _RESTRAINT_TABLES[library_name]
+
+
+def restraint_library_rows(libraries: Dict[str, RestraintTables]) -> np.ndarray:
+    """
+    Convert restraint definitions grouped by library and table name to the restraint library array
+    """
+    rows = []
+    for library_name, tables in libraries.items():
+        for table_name, definitions in tables.items():
+            for definition in definitions:
+                values = {field: getattr(definition, field) for field in definition.__slots__}
+                values.setdefault("atom3_name", "")
+                values.setdefault("atom3_relative_res_position", 0)
+                rows.append(tuple([library_name, table_name] + [values[field] for field in RESTRAINT_FIELDS[2:]]))
+    return np.array(rows, dtype=RESTRAINT_DTYPE)
+
+
+def write_restraint_library(path: str, libraries: Dict[str, RestraintTables]) -> None:
+    """
+    Write restraint library file, for example with updated PDB statistics
+    """
+    np.save(path, restraint_library_rows(libraries), allow_pickle=False)
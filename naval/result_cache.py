@@ -0,0 +1,81 @@
+import gzip
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, Optional, Sequence
+
+from naval import VERSION
+from naval.disk_cache import DiskCache, file_content_hash
+from naval.restraint_library import restraint_library_fingerprint
+
+# bump when the layout of the cached outputs changes
+RESULT_CACHE_FORMAT = "1"
+DEFAULT_RESULT_CACHE_SIZE = 1 << 30
+# kinds of the cached outputs, csv fields of each record are also converted to the parquet, arrow and sqlite outputs,
+# mmcif outputs are lines of the data block
+CSV_OUTPUTS = "csv"
+MMCIF_OUTPUTS = "mmcif"
+RESULT_OUTPUT_KINDS = (CSV_OUTPUTS, MMCIF_OUTPUTS)
+
+ResultOutputs = Dict[str, list]
+
+
+class ResultCache:
+    """
+    On-disk cache of the formatted validation outputs (csv fields of each record or mmCIF lines) keyed by the hash
+    of the input file content, naval version, fingerprint of the restraint library and reader options, separate from the structure cache
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_RESULT_CACHE_SIZE) -> None:
+        self.disk_cache = DiskCache(cache_dir, max_size, ".json.gz")
+
+    @staticmethod
+    def key(file_path: str, res_names: Optional[Sequence[str]] = None, output_kind: str = CSV_OUTPUTS, fast_reader: bool = False) -> str:
+        """
+        Cache key of the structure file outputs, the file name is included as the outputs have the pdbcode taken from it
+        """
+        key_hash = hashlib.sha256()
+        for part in (
+            RESULT_CACHE_FORMAT,
+            VERSION,
+            restraint_library_fingerprint(),
+            file_content_hash(file_path),
+            os.path.basename(file_path),
+            repr(None if res_names is None else sorted(res_names)),
+            output_kind,
+            repr(fast_reader),
+        ):
+            key_hash.update(part.encode("utf-8"))
+            key_hash.update(b"\0")
+        return key_hash.hexdigest()
+
+    def load(self, key: str) -> Optional[ResultOutputs]:
+        """
+        Return the cached fields (or lines) of each output or None
+        """
+        path = self.disk_cache.lookup(key)
+        if path is None:
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def save(self, key: str, outputs: ResultOutputs) -> None:
+        self.disk_cache.store(key, gzip.compress(json.dumps(outputs).encode("utf-8")))
+
+    def invalidate(self, file_paths: Optional[Iterable[str]] = None, res_names: Optional[Sequence[str]] = None) -> int:
+        """
+        Remove the cached outputs of the structure files (all kinds of outputs and readers), or all entries when no files are given.
+        Entries of other naval versions or restraint libraries are never hit again and are evicted as the least recently used.
+        Returns the number of removed entries.
+        """
+        if file_paths is None:
+            count = len(self.disk_cache.entries())
+            self.disk_cache.clear()
+            return count
+        return sum(
+            self.disk_cache.remove(self.key(file_path, res_names, output_kind, fast_reader))
+            for file_path in file_paths
+            if os.path.isfile(file_path)
+            for output_kind in RESULT_OUTPUT_KINDS
+            for fast_reader in (False, True)
+        )
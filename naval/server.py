@@ -0,0 +1,217 @@
+import json
+import multiprocessing
+import os
+import socket
+import socketserver
+import stat
+import threading
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from naval.api import validate
+from naval.printer import column_names
+from naval.sqlite_store import STORE_TABLES
+from naval.validate import prepare_validators, selected_res_names
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_PENDING = 64
+JSON_CONTENT_TYPE = "application/json"
+# job options accepted in the JSON body or as query parameters of the raw content request
+JOB_OPTIONS = ("pdbcode", "format", "fast_reader", "nucleotides_only", "modified_nucleotides")
+
+
+def run_job(job: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """
+    Validate one job in the worker process, the job has the structure `path` or file `content` (text or bytes) and options.
+    Returns the HTTP status and the response with the columns and rows of the bonds, angles and geometry outputs.
+    """
+    try:
+        source = job["path"] if "path" in job else job["content"]
+    except KeyError:
+        return 400, {"error": "Job requires the structure path or content"}
+    try:
+        res_names = selected_res_names(bool(job.get("nucleotides_only")), _modified_nucleotides(job.get("modified_nucleotides")))
+        result = validate(
+            source.encode("utf-8") if isinstance(source, str) and "path" not in job else source,
+            job.get("pdbcode"),
+            job.get("format"),
+            bool(job.get("fast_reader")),
+            res_names,
+        )
+        response: Dict[str, Any] = {"pdbcode": result.pdbcode, "columns": {name: column_names(printer) for name, printer in STORE_TABLES}}
+        response.update(result.rows())
+        return 200, response
+    except Exception:  # pylint: disable=broad-except
+        return 422, {"error": traceback.format_exc()}
+
+
+class ValidationService:
+    """
+    Pool of pre-warmed worker processes (restraint library loaded and restraint indexes compiled) validating jobs.
+    At most `processes` jobs are validated at once, up to `max_pending` further jobs wait in the queue, others are rejected.
+    """
+
+    def __init__(self, processes: int = 1, max_pending: int = DEFAULT_MAX_PENDING) -> None:
+        self.processes = max(processes, 1)
+        self.max_pending = max_pending
+        self.pool = multiprocessing.Pool(self.processes, initializer=prepare_validators)  # pylint: disable=consider-using-with
+        self._slots = threading.BoundedSemaphore(self.processes + max_pending)
+        self._lock = threading.Lock()
+        self.active = 0
+
+    def submit(self, job: Dict[str, Any]) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        Validate the job in the worker pool and wait for the result, returns None when the queue is full
+        """
+        if not self._slots.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return None
+        with self._lock:
+            self.active += 1
+        try:
+            return self.pool.apply(run_job, (job,))
+        finally:
+            with self._lock:
+                self.active -= 1
+            self._slots.release()
+
+    def status(self) -> Dict[str, int]:
+        return {"processes": self.processes, "max_pending": self.max_pending, "jobs": self.active}
+
+    def close(self) -> None:
+        self.pool.terminate()
+        self.pool.join()
+
+
+def _option_value(name: str, values: list) -> Any:
+    if name in ("fast_reader", "nucleotides_only"):
+        return values[-1].lower() in ("1", "true", "yes")
+    if name == "modified_nucleotides":
+        return [res_name for value in values for res_name in value.split(",") if res_name]
+    return values[-1]
+
+
+def _modified_nucleotides(value: Any) -> List[str]:
+    # a list of residue names in the JSON job, or comma separated names as in the query parameters
+    if isinstance(value, str):
+        return _option_value("modified_nucleotides", [value])
+    return list(value or ())
+
+
+class ValidationRequestHandler(BaseHTTPRequestHandler):
+    """
+    `POST /validate` with a JSON job (`{"path": ...}` or `{"content": ...}` and options) or with the raw, optionally compressed,
+    structure file content (options as query parameters), `GET /health` returns the service status
+    """
+
+    server_version = "naval"
+    service: ValidationService
+
+    def address_string(self) -> str:
+        # Unix socket clients have no address
+        return self.client_address[0] if isinstance(self.client_address, tuple) and self.client_address else "unix"
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", JSON_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_job(self) -> Dict[str, Any]:
+        url = urlparse(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.headers.get("Content-Type", "").startswith(JSON_CONTENT_TYPE):
+            payload = json.loads(body)
+            if not isinstance(payload, dict):
+                raise ValueError("JSON job must be an object")
+            return payload
+        job: Dict[str, Any] = {name: _option_value(name, values) for name, values in parse_qs(url.query).items() if name in JOB_OPTIONS}
+        job["content"] = body
+        return job
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        if urlparse(self.path).path == "/health":
+            self._send_json(200, {"status": "ok", **self.service.status()})
+        else:
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        if urlparse(self.path).path != "/validate":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+        try:
+            job = self._read_job()
+        except ValueError as exception:
+            self._send_json(400, {"error": f"Invalid job: {exception}"})
+            return
+        result = self.service.submit(job)
+        if result is None:
+            self._send_json(503, {"error": "Too many pending jobs"})
+        else:
+            self._send_json(*result)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    HTTP server on the Unix socket
+    """
+
+    daemon_threads = True
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+        raise FileExistsError(f"Socket path exists and is not a socket: {socket_path}")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except ConnectionRefusedError:
+            # nobody listens on the socket left by a daemon that did not exit cleanly
+            os.remove(socket_path)
+            return
+    raise FileExistsError(f"Another daemon is listening on the socket: {socket_path}")
+
+
+def create_server(
+    service: ValidationService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+) -> socketserver.BaseServer:
+    """
+    HTTP server on the localhost port or on the Unix socket, each request is handled in its own thread.
+    A stale socket left at the socket path is removed, the socket of a running daemon and other existing files raise FileExistsError.
+    """
+    handler = type("BoundValidationRequestHandler", (ValidationRequestHandler,), {"service": service})
+    if socket_path:
+        if os.path.exists(socket_path):
+            _remove_stale_socket(socket_path)
+        return ThreadingUnixHTTPServer(socket_path, handler)
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Optional[str] = None,
+    processes: int = 1,
+    max_pending: int = DEFAULT_MAX_PENDING,
+) -> None:
+    """
+    Run the validation daemon until interrupted
+    """
+    service = ValidationService(processes, max_pending)
+    server = create_server(service, host, port, socket_path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
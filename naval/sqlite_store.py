@@ -0,0 +1,177 @@
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from naval.printer import (
+    FLOAT_COLUMNS,
+    INT_COLUMNS,
+    AnglesCsvPrinter,
+    BondAngleRecord,
+    BondsCsvPrinter,
+    GeometryCsvPrinter,
+    column_names,
+    typed_rows,
+)
+from naval.validation_record import TorsionRecord
+
+# table name, printer defining the columns (the same as in the CSV outputs)
+STORE_TABLES = (
+    ("bonds", BondsCsvPrinter),
+    ("angles", AnglesCsvPrinter),
+    ("geometry", GeometryCsvPrinter),
+)
+# stored structure (for example the file name without extensions), precedes the columns of the CSV outputs
+ENTRY_COLUMN = "entry"
+# one row per entry and atoms (or residue and torsion), repeated runs replace the rows
+UNIQUE_COLUMNS = {
+    "bonds": (
+        ENTRY_COLUMN,
+        "model_id",
+        "chain",
+        "atom1_resid",
+        "atom1_name",
+        "atom1_altloc",
+        "atom2_resid",
+        "atom2_name",
+        "atom2_altloc",
+        "validator_name",
+    ),
+    "angles": (
+        ENTRY_COLUMN,
+        "model_id",
+        "chain",
+        "atom1_resid",
+        "atom1_name",
+        "atom1_altloc",
+        "atom2_resid",
+        "atom2_name",
+        "atom2_altloc",
+        "atom3_resid",
+        "atom3_name",
+        "atom3_altloc",
+        "validator_name",
+    ),
+    "geometry": (ENTRY_COLUMN, "model_id", "chain", "resid", "altloc", "type", "name"),
+}
+INDEXED_COLUMNS = ("pdbcode", "validation_label", "validator_name")
+PDBCODE_COLUMN = 1
+INSERT_BATCH_SIZE = 10000
+
+
+def _column_type(name: str) -> str:
+    if name in INT_COLUMNS:
+        return "INTEGER"
+    if name in FLOAT_COLUMNS:
+        return "REAL"
+    return "TEXT"
+
+
+def _batches(rows: Iterable[tuple], batch_size: int) -> Iterable[List[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class ResultsStore:
+    """
+    SQLite database with the bonds, angles and geometry validation results of many structures.
+    Tables have the entry column and the columns of the CSV outputs, rows of the entry validated again are replaced (upsert).
+    """
+
+    def __init__(self, db_path: str, batch_size: int = INSERT_BATCH_SIZE) -> None:
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(db_path)
+        self.create_schema()
+
+    def create_schema(self) -> None:
+        with self.connection:
+            for table_name, printer in STORE_TABLES:
+                names = [ENTRY_COLUMN] + column_names(printer)
+                columns = ", ".join(f"{name} {_column_type(name)}" for name in names)
+                self.connection.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({columns})")
+                unique_columns = ", ".join(UNIQUE_COLUMNS[table_name])
+                self.connection.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {table_name}_key ON {table_name} ({unique_columns})")
+                for name in INDEXED_COLUMNS:
+                    if name in names:
+                        self.connection.execute(f"CREATE INDEX IF NOT EXISTS {table_name}_{name} ON {table_name} ({name})")
+
+    def insert_rows(self, table_name: str, rows: Iterable[tuple], entry: Optional[str] = None) -> int:
+        """
+        Insert (or replace) typed rows of the entry in batches (the pdbcode of each row by default), the caller controls the transaction
+        """
+        printer = dict(STORE_TABLES)[table_name]
+        names = [ENTRY_COLUMN] + column_names(printer)
+        sql = f"INSERT OR REPLACE INTO {table_name} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})"
+        entry_rows = ((entry or row[PDBCODE_COLUMN],) + row for row in rows)
+        count = 0
+        for batch in _batches(entry_rows, self.batch_size):
+            self.connection.executemany(sql, batch)
+            count += len(batch)
+        return count
+
+    def delete_entries(self, entries: Iterable[str]) -> None:
+        """
+        Remove all rows of the entries, the caller controls the transaction
+        """
+        for entry in entries:
+            for table_name, _ in STORE_TABLES:
+                self.connection.execute(f"DELETE FROM {table_name} WHERE {ENTRY_COLUMN} = ?", (entry,))
+
+    def store_rows(self, table_rows: Dict[str, List[tuple]], entry: Optional[str] = None, replace_entries: bool = False) -> Dict[str, int]:
+        """
+        Insert rows of all tables (for example all results of one structure) of the entry in a single transaction,
+        without the entry the pdbcode of each row is used.
+        Rows with the same key are replaced, with replace_entries all previous rows of the stored entries are removed first
+        (for example rows of restraints no longer present in the restraint library).
+        """
+        with self.connection:
+            if replace_entries:
+                self.delete_entries([entry] if entry else sorted({row[PDBCODE_COLUMN] for rows in table_rows.values() for row in rows}))
+            return {table_name: self.insert_rows(table_name, rows, entry) for table_name, rows in table_rows.items()}
+
+    def store_results(
+        self,
+        validation_records: Iterable[BondAngleRecord],
+        geometry_records: Iterable[TorsionRecord],
+        entry: Optional[str] = None,
+        replace_entries: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Store the results returned by validate_structure
+        """
+        return self.store_rows(results_rows(validation_records, geometry_records), entry, replace_entries)
+
+    def query(self, sql: str, parameters: Sequence = ()) -> List[tuple]:
+        return self.connection.execute(sql, parameters).fetchall()
+
+    def count(self, table_name: str) -> int:
+        return self.query(f"SELECT COUNT(*) FROM {table_name}")[0][0]
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def results_rows(
+    validation_records: Iterable[BondAngleRecord],
+    geometry_records: Iterable[TorsionRecord],
+) -> Dict[str, List[Tuple]]:
+    """
+    Typed rows of each store table, rows are plain tuples so they can be sent from the worker processes.
+    Validation records are iterated twice (bonds and angles), for example ValidationTable or list.
+    """
+    return {
+        "bonds": list(typed_rows(BondsCsvPrinter, validation_records)),
+        "angles": list(typed_rows(AnglesCsvPrinter, validation_records)),
+        "geometry": list(typed_rows(GeometryCsvPrinter, geometry_records)),
+    }
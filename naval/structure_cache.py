@@ -0,0 +1,53 @@
+import hashlib
+import io
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from naval import VERSION
+from naval.disk_cache import DiskCache, file_content_hash
+from naval.readers.atom_table import AtomTable
+
+# bump when the layout of the cached arrays changes
+STRUCTURE_CACHE_FORMAT = "1"
+DEFAULT_STRUCTURE_CACHE_SIZE = 1 << 30
+
+
+class StructureCache:
+    """
+    On-disk cache of parsed structures (atom table and residue links) keyed by the hash of the input file content
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = DEFAULT_STRUCTURE_CACHE_SIZE) -> None:
+        self.disk_cache = DiskCache(cache_dir, max_size, ".npz")
+
+    @staticmethod
+    def key(file_path: str, res_names: Optional[Sequence[str]] = None) -> str:
+        """
+        Cache key of the structure file, the residue filter changes the content of the atom table.
+        The naval version is included as the readers and residue linking may change between versions.
+        """
+        key_hash = hashlib.sha256()
+        key_hash.update(STRUCTURE_CACHE_FORMAT.encode("utf-8"))
+        key_hash.update(VERSION.encode("utf-8"))
+        key_hash.update(file_content_hash(file_path).encode("utf-8"))
+        key_hash.update(repr(None if res_names is None else sorted(res_names)).encode("utf-8"))
+        return key_hash.hexdigest()
+
+    def load(self, key: str) -> Optional[Tuple[AtomTable, np.ndarray]]:
+        """
+        Return the cached atom table and residue links (pairs of prev and next residue indices) or None
+        """
+        path = self.disk_cache.lookup(key)
+        if path is None:
+            return None
+        with np.load(path, allow_pickle=False) as data:
+            table = AtomTable(*(data[column] for column in AtomTable.__slots__))
+            residue_links = data["residue_links"]
+        return table, residue_links
+
+    def save(self, key: str, table: AtomTable, residue_links: np.ndarray) -> None:
+        buffer = io.BytesIO()
+        columns = {column: getattr(table, column) for column in AtomTable.__slots__}
+        np.savez_compressed(buffer, residue_links=residue_links, **columns)
+        self.disk_cache.store(key, buffer.getvalue())
@@ -0,0 +1,443 @@
+import os
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from Bio.PDB.Structure import Structure
+
+from naval.geometry_engine import (
+    UNDEFINED_CONFORMATION,
+    bond_angles,
+    bond_lengths,
+    classify_alpha_conformation,
+    classify_chi_conformation,
+    classify_gamma_conformation,
+    classify_sugar_conformation,
+    classify_zeta_conformation,
+    dihedral_angles,
+    pseudorotation_with_sd,
+)
+from naval.nucleotide_geometry import NucleotideGeometry, theta_rows
+from naval.printer import (
+    AnglesCsvPrinter,
+    BondsCsvPrinter,
+    GeometryCsvPrinter,
+    write_lines,
+)
+from naval.residue_cache_entry import ResidueCacheEntry
+from naval.restraint_definition import (
+    VALIDATION_LABELS,
+    AngleDefinition,
+    BondDefinition,
+)
+from naval.validate import (
+    VALIDATOR_CLASSES,
+    calculate_geometry,
+    link_residues,
+    pdbcode_from_path,
+    read_structure,
+)
+from naval.validation_engine import classify_values, restraint_thresholds
+from naval.validation_record import TorsionRecord
+from naval.validation_table import (
+    ANGLE,
+    BOND,
+    NO_ATOM,
+    VALIDATION_TYPES,
+    ValidationTable,
+)
+from naval.validators.geometry_validator import GeometryValidator
+
+DEFAULT_CHUNK_SIZE = 64
+# classified torsions and their conformations, the same classes as classify_conformations
+TORSION_CONFORMATIONS = {
+    "alpha": ("alpha_conformation", classify_alpha_conformation),
+    "gamma": ("gamma_conformation", classify_gamma_conformation),
+    "zeta": ("zeta_conformation", classify_zeta_conformation),
+    "chi": ("chi_conformation", classify_chi_conformation),
+}
+THETA_NAMES = ("theta0", "theta1", "theta2", "theta3", "theta4")
+# conformation classes counted in the frame summaries, undefined conformations are not counted
+SUMMARY_CONFORMATIONS = {
+    "alpha": ("sc+", "sc-", "ap", "other"),
+    "gamma": ("gauche+", "gauche-", "trans", "other"),
+    "zeta": ("sc+", "sc-", "ap", "other"),
+    "sugar": ("C2'-endo", "C3'-endo", "other"),
+    "chi": ("syn", "anti"),
+}
+SUMMARY_COLUMNS = (
+    ("frame",)
+    + tuple(f"{validation_type}_{label}" for validation_type in VALIDATION_TYPES for label in VALIDATION_LABELS)
+    + tuple(f"{name}_{conformation}" for name, conformations in SUMMARY_CONFORMATIONS.items() for conformation in conformations)
+)
+
+# validation types, definition indices and (n, 3) atom indices of the bonds and angles of one residue
+ResidueRestraints = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class FrameResult:
+    """
+    Results of one frame: bonds and angles as ValidationTable and the nucleotide geometries of the frame
+    """
+
+    __slots__ = ("frame", "validation_table", "geometries")
+
+    def __init__(self, frame: int, validation_table: ValidationTable, geometries: List[NucleotideGeometry]) -> None:
+        self.frame = frame
+        self.validation_table = validation_table
+        self.geometries = geometries
+
+    def geometry_records(self) -> List[TorsionRecord]:
+        return [record for geometry in self.geometries for record in GeometryValidator(geometry).validate()]
+
+    def summary(self) -> Tuple[int, ...]:
+        """
+        Row of SUMMARY_COLUMNS: the frame, numbers of bonds and angles with each label and numbers of conformations
+        """
+        row = [self.frame]
+        for type_code in range(len(VALIDATION_TYPES)):
+            labels = self.validation_table.label_code[self.validation_table.validation_type == type_code]
+            row.extend(np.bincount(labels, minlength=len(VALIDATION_LABELS)).tolist())
+        for name, conformations in SUMMARY_CONFORMATIONS.items():
+            counts = Counter(conformation for geometry in self.geometries for conformation in getattr(geometry, f"{name}_conformation").values())
+            row.extend(counts[conformation] for conformation in conformations)
+        return tuple(row)
+
+
+class Trajectory:
+    """
+    Topology of one model of the structure prepared once (atoms, residue links, torsion atoms) and validated for many frames
+    of coordinates, for example a molecular dynamics trajectory. Restraints of a residue depend only on the conformations
+    of the residue and its neighbours, they are resolved once for each combination of the conformations found in the frames.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, structure: Structure, model_index: int = 0) -> None:
+        # pylint: disable=too-many-locals
+        self.structure = structure
+        self.model = structure.get_list()[model_index]
+        residue_cache = [ResidueCacheEntry(structure.id, self.model, chain, residue) for chain in self.model for residue in chain]
+        self.residue_cache: List[ResidueCacheEntry] = calculate_geometry(link_residues(residue_cache))
+
+        # frames have coordinates of all atoms (each alternative conformation separately) in this order
+        self.atoms = [atom for residue_entry in self.residue_cache for atom in residue_entry.residue.get_unpacked_list()]
+        self._atom_index = {id(atom): i for i, atom in enumerate(self.atoms)}
+
+        self.nucleotides = [residue_entry for residue_entry in self.residue_cache if residue_entry.geometry is not None]
+        self.geometries: List[NucleotideGeometry] = [residue_entry.get_geometry() for residue_entry in self.nucleotides]
+        positions = {id(residue_entry): i for i, residue_entry in enumerate(self.nucleotides)}
+        self._neighbours = [
+            (positions.get(id(residue_entry.prev_res)), positions.get(id(residue_entry.next_res))) for residue_entry in self.nucleotides
+        ]
+
+        # torsions of each nucleotide, as in calculate_torsions: (position, torsion name, conformation name, altlocs or None
+        # if any atom is missing), values of the torsions are columns of the (n_frames, n_torsions) arrays
+        self._torsions: List[Tuple[int, str, Optional[str], Optional[List[str]]]] = []
+        torsion_atoms: List[int] = []
+        torsion_columns: Dict[Tuple[int, str], Dict[str, Optional[int]]] = {}
+        conformation_columns: Dict[str, List[int]] = {torsion_name: [] for torsion_name in TORSION_CONFORMATIONS}
+        for position, geometry in enumerate(self.geometries):
+            for torsion_name, atom_names, atom_relative_positions in geometry.torsion_definitions():
+                conformation_name = TORSION_CONFORMATIONS[torsion_name][0] if torsion_name in TORSION_CONFORMATIONS else None
+                selected = geometry.torsion_atoms(atom_names, atom_relative_positions)
+                if selected is None:
+                    self._torsions.append((position, torsion_name, conformation_name, None))
+                    torsion_columns[(position, torsion_name)] = {"": None}
+                    continue
+                self._torsions.append((position, torsion_name, conformation_name, [alt_loc for alt_loc, _ in selected]))
+                columns = torsion_columns[(position, torsion_name)] = {}
+                for alt_loc, atoms in selected:
+                    column = columns[alt_loc] = len(torsion_atoms) // 4
+                    if torsion_name in conformation_columns:
+                        conformation_columns[torsion_name].append(column)
+                    torsion_atoms.extend(self._atom_index[id(atom)] for atom in atoms)
+        self._torsion_atoms = np.array(torsion_atoms, dtype=np.int64).reshape(-1, 4)
+        self._conformation_columns = {torsion_name: np.array(columns, dtype=np.int64) for torsion_name, columns in conformation_columns.items()}
+
+        # pseudorotation of each nucleotide, as in theta_rows: (position, altloc, columns of theta0-theta4 or None)
+        self._theta_rows: List[Tuple[int, str, Optional[Tuple[int, ...]]]] = []
+        for position in range(len(self.nucleotides)):
+            theta_columns = [torsion_columns[(position, theta_name)] for theta_name in THETA_NAMES]
+            self._theta_rows.extend((position, alt_loc, columns) for alt_loc, columns in theta_rows(theta_columns))
+
+        self.definitions: List[Union[BondDefinition, AngleDefinition]] = []
+        self._definition_ids: Dict[int, int] = {}
+        # (position, conformations) -> restraints of the residue
+        self._restraints: Dict[tuple, ResidueRestraints] = {}
+
+    @property
+    def n_atoms(self) -> int:
+        return len(self.atoms)
+
+    def model_frames(self, structure: Optional[Structure] = None) -> np.ndarray:
+        """
+        Coordinates of all models of the structure (by default the topology structure) as (n_models, n_atoms, 3) frames,
+        atoms are matched to the topology atoms by chain, residue id, atom name and altloc
+        """
+        structure = self.structure if structure is None else structure
+        keys = [atom.get_full_id()[2:] for atom in self.atoms]
+        models = structure.get_list()
+        frames = np.empty((len(models), len(keys), 3), dtype=np.float32)
+        for i, model in enumerate(models):
+            coords = {atom.get_full_id()[2:]: atom.get_coord() for residue in model.get_residues() for atom in residue.get_unpacked_list()}
+            try:
+                frames[i] = [coords[key] for key in keys]
+            except KeyError as exception:
+                raise ValueError(f"Atom {exception} missing in model {model.get_id()}") from exception
+        return frames
+
+    def _frame_geometries(
+        self,
+        angles: Sequence[float],
+        conformations: Sequence[str],
+        pseudorotations: Sequence[float],
+        tau_maxs: Sequence[float],
+        sugars: Sequence[str],
+    ) -> List[NucleotideGeometry]:
+        """
+        New geometries of the nucleotides with the torsions, pseudorotations and conformations of one frame
+        """
+        # pylint: disable=too-many-arguments,too-many-locals
+        geometries = [NucleotideGeometry(residue_entry) for residue_entry in self.nucleotides]
+        column = 0
+        for position, torsion_name, conformation_name, alt_locs in self._torsions:
+            torsions: Dict[str, Optional[float]] = {"": None}
+            torsion_conformations: Dict[str, Optional[str]] = {"": UNDEFINED_CONFORMATION}
+            if alt_locs is not None:
+                torsions = {}
+                torsion_conformations = {}
+                for alt_loc in alt_locs:
+                    torsions[alt_loc] = angles[column]
+                    torsion_conformations[alt_loc] = conformations[column]
+                    column += 1
+            setattr(geometries[position], torsion_name, torsions)
+            if conformation_name is not None:
+                setattr(geometries[position], conformation_name, torsion_conformations)
+
+        row = 0
+        for position, alt_loc, theta_columns in self._theta_rows:
+            geometry = geometries[position]
+            if theta_columns is None:
+                geometry.pseudorotation[alt_loc] = None
+                geometry.tau_max[alt_loc] = None
+                geometry.sugar_conformation[alt_loc] = UNDEFINED_CONFORMATION
+            else:
+                geometry.pseudorotation[alt_loc] = pseudorotations[row]
+                geometry.tau_max[alt_loc] = tau_maxs[row]
+                geometry.sugar_conformation[alt_loc] = sugars[row]
+                row += 1
+        return geometries
+
+    def _conformations(self, geometries: List[NucleotideGeometry], position: int) -> tuple:
+        """
+        Conformations read by the validators to select restraints: alpha, zeta and sugar conformations of the nucleotide,
+        zeta of the previous and alpha of the next nucleotide
+        """
+        geometry = geometries[position]
+        prev_position, next_position = self._neighbours[position]
+        return (
+            position,
+            tuple(geometry.alpha_conformation.items()),
+            tuple(geometry.zeta_conformation.items()),
+            tuple(geometry.sugar_conformation.items()),
+            None if prev_position is None else tuple(geometries[prev_position].zeta_conformation.items()),
+            None if next_position is None else tuple(geometries[next_position].alpha_conformation.items()),
+        )
+
+    def _definition_index(self, definition: Union[BondDefinition, AngleDefinition]) -> int:
+        i = self._definition_ids.get(id(definition))
+        if i is None:
+            i = self._definition_ids[id(definition)] = len(self.definitions)
+            self.definitions.append(definition)
+        return i
+
+    def _resolve(self, geometries: List[NucleotideGeometry], position: int) -> ResidueRestraints:
+        """
+        Resolve restraints of the nucleotide with the frame geometries linked to the residue and its neighbours
+        """
+        for linked_position in (position,) + self._neighbours[position]:
+            if linked_position is not None:
+                self.nucleotides[linked_position].geometry = geometries[linked_position]
+        restraints = [restraint for validator_class in VALIDATOR_CLASSES for restraint in validator_class(geometries[position]).resolve()]
+
+        validation_type = np.array([BOND if len(atoms) == 2 else ANGLE for _, _, atoms in restraints], dtype=np.uint8)
+        definition_index = np.array([self._definition_index(definition) for _, definition, _ in restraints], dtype=np.int32)
+        atom_indices = np.full((len(restraints), 3), NO_ATOM, dtype=np.int32)
+        for i, (_, _, atoms) in enumerate(restraints):
+            atom_indices[i, : len(atoms)] = [self._atom_index[id(atom)] for atom in atoms]
+        return validation_type, definition_index, atom_indices
+
+    def _frame_restraints(self, geometries: List[NucleotideGeometry]) -> Tuple[tuple, ...]:
+        """
+        Keys of the restraints of all nucleotides of the frame, restraints are resolved for new combinations of the conformations
+        """
+        keys = []
+        for position in range(len(geometries)):
+            key = self._conformations(geometries, position)
+            if key not in self._restraints:
+                self._restraints[key] = self._resolve(geometries, position)
+            keys.append(key)
+        return tuple(keys)
+
+    def _frame_conformations(self, coords: np.ndarray) -> List[List[NucleotideGeometry]]:
+        """
+        Geometries of the (n, n_atoms, 3) frames: torsions of all frames are calculated in one pass
+        and each class of conformations is classified in one call, as in classify_conformations
+        """
+        n_frames = len(coords)
+        angles = np.zeros((n_frames, len(self._torsion_atoms)))
+        if len(self._torsion_atoms):
+            angles = dihedral_angles(coords[:, self._torsion_atoms]).reshape(n_frames, -1)
+        conformations = np.full(angles.shape, UNDEFINED_CONFORMATION, dtype=object)
+        for torsion_name, (_, classify) in TORSION_CONFORMATIONS.items():
+            columns = self._conformation_columns[torsion_name]
+            conformations[:, columns] = classify(angles[:, columns])
+
+        complete_thetas = [theta_columns for _, _, theta_columns in self._theta_rows if theta_columns is not None]
+        pseudorotations = tau_maxs = np.empty((n_frames, 0))
+        if complete_thetas:
+            pseudorotation_array, _, tau_max_array, _ = pseudorotation_with_sd(angles[:, complete_thetas])
+            pseudorotations = pseudorotation_array.reshape(n_frames, -1)
+            tau_maxs = tau_max_array.reshape(n_frames, -1)
+        sugars = classify_sugar_conformation(pseudorotations)
+
+        return [
+            self._frame_geometries(*frame_values)
+            for frame_values in zip(angles.tolist(), conformations.tolist(), pseudorotations.tolist(), tau_maxs.tolist(), sugars.tolist())
+        ]
+
+    def _validate_chunk(self, first_frame: int, coords: np.ndarray) -> List[FrameResult]:
+        """
+        Validate (n, n_atoms, 3) frames, bonds and angles of all frames are calculated in one pass
+        """
+        # pylint: disable=too-many-locals
+        frame_geometries = self._frame_conformations(coords)
+        try:
+            frame_keys = [self._frame_restraints(geometries) for geometries in frame_geometries]
+        finally:
+            # the residue cache keeps geometries of the topology model
+            for residue_entry, geometry in zip(self.nucleotides, self.geometries):
+                residue_entry.geometry = geometry
+
+        # restraints of the frames, frames with the same conformations share the arrays
+        frame_restraints: Dict[Tuple[tuple, ...], Tuple[np.ndarray, ...]] = {}
+        for keys in frame_keys:
+            if keys not in frame_restraints:
+                residue_restraints = [self._restraints[key] for key in keys]
+                frame_restraints[keys] = (
+                    np.concatenate([np.empty(0, dtype=np.uint8)] + [restraints[0] for restraints in residue_restraints]),
+                    np.repeat(np.arange(len(keys), dtype=np.int32), [len(restraints[0]) for restraints in residue_restraints]),
+                    np.concatenate([np.empty(0, dtype=np.int32)] + [restraints[1] for restraints in residue_restraints]),
+                    np.concatenate([np.empty((0, 3), dtype=np.int32)] + [restraints[2] for restraints in residue_restraints]),
+                )
+        restraints = [frame_restraints[keys] for keys in frame_keys]
+        offsets = np.cumsum([0] + [len(validation_type) for validation_type, _, _, _ in restraints])
+        validation_type = np.concatenate([validation_type for validation_type, _, _, _ in restraints])
+        definition_index = np.concatenate([definition_index for _, _, definition_index, _ in restraints])
+        atom_indices = np.concatenate([atom_indices for _, _, _, atom_indices in restraints])
+        frames = np.repeat(np.arange(len(coords)), np.diff(offsets))
+
+        thresholds = restraint_thresholds(self.definitions)
+        calculated_value = np.empty(len(validation_type), dtype=np.float64)
+        label_code = np.empty(len(validation_type), dtype=np.uint8)
+        for type_code, n_atoms, calculate in ((BOND, 2, bond_lengths), (ANGLE, 3, bond_angles)):
+            rows = np.flatnonzero(validation_type == type_code)
+            values = calculate(coords[frames[rows, np.newaxis], atom_indices[rows, :n_atoms]])
+            calculated_value[rows] = values
+            label_code[rows] = classify_values(values, thresholds[definition_index[rows]])
+
+        results = []
+        for frame, (geometries, (start, end)) in enumerate(zip(frame_geometries, zip(offsets[:-1], offsets[1:]))):
+            frame_type, geometry_index, frame_definition_index, frame_atom_indices = restraints[frame]
+            table = ValidationTable(
+                self.atoms,
+                geometries,
+                self.definitions,
+                frame_type,
+                geometry_index,
+                frame_definition_index,
+                frame_atom_indices,
+                calculated_value[start:end],
+                label_code[start:end],
+            )
+            results.append(FrameResult(first_frame + frame, table, geometries))
+        return results
+
+    def validate_frames(self, frames: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[FrameResult]:
+        """
+        Validate (n_frames, n_atoms, 3) coordinates (atoms in the order of the atoms attribute) frame by frame,
+        frames are processed in chunks of chunk_size frames
+        """
+        frames = np.asarray(frames)
+        if frames.ndim == 2:
+            frames = frames[np.newaxis]
+        if frames.ndim != 3 or frames.shape[1:] != (self.n_atoms, 3):
+            raise ValueError(f"Expected (n_frames, {self.n_atoms}, 3) coordinates, got {frames.shape}")
+        for start in range(0, len(frames), chunk_size):
+            end = start + chunk_size
+            yield from self._validate_chunk(start, np.asarray(frames[start:end], dtype=np.float32))
+
+    def summaries(self, frames: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[int, ...]]:
+        """
+        Yield summary rows (SUMMARY_COLUMNS) of the frames
+        """
+        for result in self.validate_frames(frames, chunk_size):
+            yield result.summary()
+
+
+def summary_line(row: Tuple[int, ...]) -> str:
+    return ",".join(str(value) for value in row)
+
+
+def summary_lines(rows: Iterable[Tuple[int, ...]]) -> Iterator[str]:
+    yield ",".join(SUMMARY_COLUMNS)
+    for row in rows:
+        yield summary_line(row)
+
+
+def write_frame_tables(result: FrameResult, out_dir: str, pdbcode: str) -> None:
+    """
+    Write bonds, angles and geometry csv files of the frame: <pdbcode>_frame<n>_bonds.csv, ...
+    """
+
+    def frame_path(name: str) -> str:
+        return os.path.join(out_dir, f"{pdbcode}_frame{result.frame}_{name}.csv")
+
+    with open(frame_path("bonds"), "w", encoding="utf-8") as out_file:
+        BondsCsvPrinter.write(result.validation_table, out_file)
+    with open(frame_path("angles"), "w", encoding="utf-8") as out_file:
+        AnglesCsvPrinter.write(result.validation_table, out_file)
+    with open(frame_path("geometry"), "w", encoding="utf-8") as out_file:
+        GeometryCsvPrinter.write(result.geometry_records(), out_file)
+
+
+def run_trajectory(
+    structure_filepath: str,
+    summary_filepath: str,
+    frames_filepath: Optional[str] = None,
+    tables_dir: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Validate the frames (a .npy file with (n_frames, n_atoms, 3) coordinates or all models of the structure file)
+    with the topology of the first model, write the frame summaries and optionally full tables of each frame.
+    Returns the number of frames.
+    """
+    structure = read_structure(structure_filepath)
+    trajectory = Trajectory(structure)
+    frames = trajectory.model_frames() if frames_filepath is None else np.load(frames_filepath, mmap_mode="r")
+    if tables_dir is not None:
+        os.makedirs(tables_dir, exist_ok=True)
+
+    pdbcode = pdbcode_from_path(structure_filepath)
+
+    def frame_summaries() -> Iterator[Tuple[int, ...]]:
+        for result in trajectory.validate_frames(frames, chunk_size):
+            if tables_dir is not None:
+                write_frame_tables(result, tables_dir, pdbcode)
+            yield result.summary()
+
+    with open(summary_filepath, "w", encoding="utf-8") as summary_file:
+        write_lines(summary_file, summary_lines(frame_summaries()))
+    return len(frames)
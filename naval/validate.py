@@ -1,31 +1,155 @@
+import io
+import multiprocessing
 import os
 import sys
-from typing import List, Tuple, Union
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 
+import numpy as np
 from Bio.PDB import MMCIFParser, PDBParser, Structure
-
+from Bio.PDB.kdtrees import KDTree
+
+from naval.arrow_printer import (
+    CSV_FORMAT,
+    CsvPrinter,
+    arrow_table,
+    output_format,
+    write_arrow_table,
+)
+from naval.geometry_engine import calculate_torsions, classify_conformations
+from naval.mmcif_printer import write_mmcif
+from naval.nucleotide_definitions import NUCLEOTIDE_RES_NAMES
 from naval.nucleotide_geometry import NucleotideGeometry
-from naval.printer import AnglesCsvPrinter, BondsCsvPrinter, GeometryCsvPrinter
+from naval.parallel import validate_residue_cache_parallel
+from naval.printer import (
+    AnglesCsvPrinter,
+    BondsCsvPrinter,
+    GeometryCsvPrinter,
+    write_validation_records,
+)
+from naval.readers.atom_table import atom_table_from_structure, build_structure
+from naval.readers.bcif_reader import read_bcif_atom_table
+from naval.readers.compressed import (
+    decompress_content,
+    open_structure_binary_file,
+    open_structure_file,
+    split_compression_extension,
+)
+from naval.readers.mmcif_reader import read_mmcif_atom_table
+from naval.readers.pdb_reader import read_pdb_atom_table
 from naval.residue_cache_entry import ResidueCacheEntry
+from naval.structure_cache import DEFAULT_STRUCTURE_CACHE_SIZE, StructureCache
+from naval.validation_engine import (
+    ResolvedRestraint,
+    validation_records,
+    validation_table,
+)
 from naval.validation_record import TorsionRecord, ValidationRecord
+from naval.validation_table import ValidationTable
 from naval.validators.bases_validator import BasesValidator
 from naval.validators.geometry_validator import GeometryValidator
 from naval.validators.po4_validator import Po4Validator
 from naval.validators.sugar_pucker_validator import SugarPuckerBasedSugarValidator
 
 MAX_RESIDUE_DISTANCE = 2.0
+LINK_ATOM_NAMES = ("O3'", "P")
+KDTREE_BUCKET_SIZE = 10
+VALIDATOR_CLASSES = (BasesValidator, Po4Validator, SugarPuckerBasedSugarValidator)
+STRUCTURE_FORMATS = ("pdb", "cif", "bcif")
+# msgpack map16 and map32 markers (fixmap is 0x80-0x8f), BinaryCIF files are msgpack maps
+MSGPACK_MAP_BYTES = (0xDE, 0xDF)
+
+
+def prepare_validators() -> None:
+    """
+    Load the restraint library and compile restraint indexes of all validators,
+    for example in a long running worker process before the first structure arrives
+    """
+    for validator_class in VALIDATOR_CLASSES:
+        validator_class.compiled_restraint_index()
+
 
+def pdbcode_from_path(pdb_file_path: str) -> str:
+    return os.path.basename(pdb_file_path)[0:4]
 
-def read_structure(pdb_file_path: str) -> Structure:
+
+def read_structure(pdb_file_path: str, fast_reader: bool = False, res_names: Optional[Sequence[str]] = None) -> Structure:
+    """
+    Read and parse pdb/mm-cif/binary-cif nucleotide structure, the file can be compressed (.gz, .bz2, .xz).
+    With fast_reader the atom records are read directly into arrays (the mmCIF _atom_site loop is tokenized,
+    the PDB file is memory-mapped and sliced by fixed columns) instead of using the Biopython parsers.
+    If res_names is given, atoms of all other residues are dropped while parsing (this implies fast_reader).
+    BinaryCIF columns are always decoded directly into arrays.
     """
-    Read and parse pdb/mm-cif nucleotide structure
+    pdbcode = pdbcode_from_path(pdb_file_path)
+    file_path, compression = split_compression_extension(pdb_file_path)
+    array_reader = fast_reader or res_names is not None
+    if not file_path.endswith("pdb") and not file_path.endswith("cif"):
+        raise ValueError(f"Unsupported structure file format: {pdb_file_path}")
+
+    if file_path.endswith("bcif"):
+        with open_structure_binary_file(pdb_file_path) as handle:
+            return build_structure(read_bcif_atom_table(handle, res_names), pdbcode)
+
+    if array_reader and file_path.endswith("pdb"):
+        if not compression:
+            return build_structure(read_pdb_atom_table(pdb_file_path, res_names), pdbcode)
+        with open_structure_binary_file(pdb_file_path) as handle:
+            return build_structure(read_pdb_atom_table(handle, res_names), pdbcode)
+
+    with open_structure_file(pdb_file_path) as handle:
+        if array_reader:
+            return build_structure(read_mmcif_atom_table(handle, res_names), pdbcode)
+        if file_path.endswith("pdb"):
+            parser = PDBParser(PERMISSIVE=1, QUIET=True)
+        else:
+            parser = MMCIFParser(QUIET=True)
+        return parser.get_structure(pdbcode, handle)
+
+
+def detect_structure_format(content: bytes) -> str:
     """
-    if pdb_file_path.endswith("pdb"):
+    Structure format (pdb, cif or bcif) detected from the not compressed file content
+    """
+    if content[:1] and (0x80 <= content[0] <= 0x8F or content[0] in MSGPACK_MAP_BYTES):
+        return "bcif"
+    text = content.lstrip()
+    if text.startswith(b"data_") or text.startswith(b"#"):
+        return "cif"
+    return "pdb"
+
+
+def read_structure_content(
+    content: Union[bytes, str],
+    pdbcode: str = "",
+    structure_format: Optional[str] = None,
+    fast_reader: bool = False,
+    res_names: Optional[Sequence[str]] = None,
+) -> Structure:
+    """
+    Parse pdb/mm-cif/binary-cif structure file content held in memory, the content can be compressed (gzip, bzip2, xz).
+    The format is detected from the content when not given, the options are the same as for read_structure.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    content = decompress_content(content)
+    structure_format = (structure_format or detect_structure_format(content)).lower().lstrip(".")
+    if structure_format not in STRUCTURE_FORMATS:
+        raise ValueError(f"Unsupported structure file format: {structure_format}")
+    array_reader = fast_reader or res_names is not None
+
+    if structure_format == "bcif":
+        return build_structure(read_bcif_atom_table(content, res_names), pdbcode)
+    if array_reader and structure_format == "pdb":
+        return build_structure(read_pdb_atom_table(content, res_names), pdbcode)
+
+    handle = io.StringIO(content.decode("utf-8"))
+    if array_reader:
+        return build_structure(read_mmcif_atom_table(handle, res_names), pdbcode)
+    if structure_format == "pdb":
         parser = PDBParser(PERMISSIVE=1, QUIET=True)
-    elif pdb_file_path.endswith("cif"):
+    else:
         parser = MMCIFParser(QUIET=True)
-    pdbcode = os.path.basename(pdb_file_path)[0:4]
-    return parser.get_structure(pdbcode, pdb_file_path)
+    return parser.get_structure(pdbcode, handle)
 
 
 def fill_residue_cache(structure: Structure, pdbcode: str) -> List[ResidueCacheEntry]:
@@ -40,125 +164,292 @@ def fill_residue_cache(structure: Structure, pdbcode: str) -> List[ResidueCacheE
     return residue_cache
 
 
-def calc_res_pair_dist(atom_name1, res1, atom_name2, res2):
-    "Return minimal distance for a pair of atoms, taking into account the alternative conformations"
-    try:
-        atom_group1 = res1.residue[atom_name1]
-        atoms1 = atom_group1.disordered_get_list() if atom_group1.is_disordered() else [atom_group1]
+def _link_atoms(residue_cache: List[ResidueCacheEntry], indices: List[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Collect O3' and P atoms (all alternative conformations) of the residues,
+    return coordinates, residue indices, O3' flags and altlocs
+    """
+    coords = []
+    residue_indices = []
+    is_o3 = []
+    altlocs = []
+    for i in indices:
+        residue = residue_cache[i].residue
+        for atom_name in LINK_ATOM_NAMES:
+            if atom_name not in residue:
+                continue
+            atom_group = residue[atom_name]
+            for atom in atom_group.disordered_get_list() if atom_group.is_disordered() else [atom_group]:
+                coords.append(atom.get_coord())
+                residue_indices.append(i)
+                is_o3.append(atom_name == "O3'")
+                altlocs.append(atom.get_altloc())
+    return np.array(coords, dtype=np.float32).reshape(-1, 3), np.array(residue_indices, dtype=np.int64), np.array(is_o3, dtype=bool), altlocs
+
+
+def find_residue_links(residue_cache: List[ResidueCacheEntry], indices: List[int]) -> List[Tuple[float, int, int]]:
+    """
+    Find all O3'(prev)-P(next) pairs closer than MAX_RESIDUE_DISTANCE in one radius search over the KD-tree of the residues atoms,
+    alternative conformations are compared only with the same or blank altloc.
+    Return sorted (distance, prev index, next index) tuples.
+    """
+    return link_candidates(*_link_atoms(residue_cache, indices))
 
-        atom_group2 = res2.residue[atom_name2]
-        atoms2 = atom_group2.disordered_get_list() if atom_group2.is_disordered() else [atom_group2]
-    except KeyError:
-        return float("inf")
 
-    dists = []
-    for atom1 in atoms1:
-        for atom2 in atoms2:
-            if atom1.get_altloc() == atom2.get_altloc() or atom1.get_altloc() == " " or atom2.get_altloc() == " ":
-                dists.append(round(atom2 - atom1, 3))
-    if dists:
-        return min(dists)
-    return float("inf")
+def link_candidates(coords: np.ndarray, residue_indices: np.ndarray, is_o3: np.ndarray, altlocs: List[str]) -> List[Tuple[float, int, int]]:
+    """
+    Find all O3'(prev)-P(next) pairs of the link atoms (coordinates, residue indices, O3' flags and altlocs) closer than
+    MAX_RESIDUE_DISTANCE, return sorted (distance, prev index, next index) tuples
+    """
+    if len(coords) < 2:
+        return []
+
+    links = []
+    tree = KDTree(coords.astype(np.float64), KDTREE_BUCKET_SIZE)
+    for point in tree.neighbor_search(MAX_RESIDUE_DISTANCE):
+        o3_index, p_index = point.index1, point.index2
+        if is_o3[o3_index] == is_o3[p_index]:
+            continue
+        if not is_o3[o3_index]:
+            o3_index, p_index = p_index, o3_index
+        if residue_indices[o3_index] == residue_indices[p_index]:
+            continue
+        if altlocs[o3_index] != altlocs[p_index] and altlocs[o3_index] != " " and altlocs[p_index] != " ":
+            continue
+        # the same float32 distance as Atom.__sub__
+        diff = coords[p_index] - coords[o3_index]
+        distance = round(float(np.sqrt(np.dot(diff, diff))), 3)
+        if distance < MAX_RESIDUE_DISTANCE:
+            links.append((distance, int(residue_indices[o3_index]), int(residue_indices[p_index])))
+    return sorted(links)
+
+
+def assign_residue_links(candidates: List[Tuple[float, int, int]]) -> List[Tuple[int, int]]:
+    """
+    Select (prev index, next index) links from the sorted candidates, each residue has at most one previous
+    and one next residue, so the shortest link wins
+    """
+    links = []
+    with_next: Set[int] = set()
+    with_prev: Set[int] = set()
+    for _, prev_index, next_index in candidates:
+        if prev_index not in with_next and next_index not in with_prev:
+            links.append((prev_index, next_index))
+            with_next.add(prev_index)
+            with_prev.add(next_index)
+    return links
 
 
 def link_residues(residue_cache: List[ResidueCacheEntry]) -> List[ResidueCacheEntry]:
     """
-    Link all residures so that it is possible to easily select previous or next residue
-    """
-    for prev_residue, current_residue in zip(residue_cache[:-1], residue_cache[1:]):
-        # TODO: add only when same chain and is not hetatm
-        # TODO: move to residue cache entry
-        # same chain or next seqid or the same with insetion code
-        if current_residue.chain == prev_residue.chain and (
-            abs(current_residue.resseq - prev_residue.resseq) == 1
-            or (current_residue.resseq == prev_residue.resseq and (current_residue.inscode != " " or prev_residue.inscode != " "))
-        ):
-            # O3'(prev) is close enough to P(next) or O3'(next) is close enough to P(prev)
-            if (
-                min(
-                    calc_res_pair_dist("O3'", prev_residue, "P", current_residue),
-                    calc_res_pair_dist("P", prev_residue, "O3'", current_residue),
-                )
-                < MAX_RESIDUE_DISTANCE
-            ):
-                current_residue.prev_res = prev_residue
-                prev_residue.next_res = current_residue
+    Link all residures so that it is possible to easily select previous or next residue.
+    Residues are linked by O3'(prev)-P(next) proximity within a model, regardless of the chain, numbering or order in the file.
+    When an atom is close to more than one partner, the shortest link wins.
+    """
+    models: Dict[int, List[int]] = {}
+    for i, residue_entry in enumerate(residue_cache):
+        models.setdefault(id(residue_entry.model), []).append(i)
+
+    for indices in models.values():
+        for prev_index, next_index in assign_residue_links(find_residue_links(residue_cache, indices)):
+            residue_cache[next_index].prev_res = residue_cache[prev_index]
+            residue_cache[prev_index].next_res = residue_cache[next_index]
     return residue_cache
 
 
 def calculate_geometry(residue_cache: List[ResidueCacheEntry]) -> List[ResidueCacheEntry]:
     """
-    Iterate over all residues and caclulate required torsion angles and pseudorotation for all nucleotides
+    Iterate over all residues and caclulate required torsion angles and pseudorotation for all nucleotides,
+    torsion angles and conformations of all nucleotides are calculated in one pass
     """
+    geometries = []
     for residue_entry in residue_cache:
         if residue_entry.is_nucleotide():
             geometry = NucleotideGeometry(residue_entry)
-            geometry.calculate_conformation()
-            # geometry.prepare_report_torsion()
             residue_entry.geometry = geometry
+            geometries.append(geometry)
+
+    calculate_torsions(geometries)
+    classify_conformations(geometries)
     return residue_cache
 
 
-def validate_structure(structure) -> Tuple[List[ValidationRecord], List[TorsionRecord]]:
+def residue_links(residue_cache: List[ResidueCacheEntry]) -> np.ndarray:
     """
-    Calculates torsion angles and pass residues through validators.
+    Return (n, 2) array with indices of all linked (previous, next) residue pairs
     """
-    pdbcode = structure.id
-    print(f"# PDB id: {pdbcode}")
+    indices = {id(residue_entry): i for i, residue_entry in enumerate(residue_cache)}
+    links = [(indices[id(residue_entry.prev_res)], i) for i, residue_entry in enumerate(residue_cache) if residue_entry.prev_res is not None]
+    return np.array(links, dtype=np.int64).reshape(-1, 2)
+
 
-    residue_cache = fill_residue_cache(structure, pdbcode)
-    residue_cache = link_residues(residue_cache)
-    residue_cache = calculate_geometry(residue_cache)
+def apply_residue_links(residue_cache: List[ResidueCacheEntry], links: np.ndarray) -> List[ResidueCacheEntry]:
+    """
+    Restore previous/next residue links computed earlier with link_residues
+    """
+    for prev_index, next_index in links.tolist():
+        residue_cache[next_index].prev_res = residue_cache[prev_index]
+        residue_cache[prev_index].next_res = residue_cache[next_index]
+    return residue_cache
+
+
+def prepare_residue_cache(structure, links: Optional[np.ndarray] = None) -> List[ResidueCacheEntry]:
+    """
+    Fill and link the residue cache and calculate the nucleotide geometry.
+    If links are given (for example from the structure cache), they are used instead of link_residues.
+    """
+    residue_cache = fill_residue_cache(structure, structure.id)
+    if links is None:
+        residue_cache = link_residues(residue_cache)
+    else:
+        residue_cache = apply_residue_links(residue_cache, links)
+    return calculate_geometry(residue_cache)
 
-    validation_records = []
+
+def resolve_residue_entry(residue_entry: ResidueCacheEntry) -> Tuple[List[ResolvedRestraint], List[TorsionRecord]]:
+    """
+    Collect bonds and angles of one prepared residue to be validated and its torsion records.
+    """
+    restraints: List[ResolvedRestraint] = []
+    geometry_records: List[TorsionRecord] = []
+    if residue_entry.is_nucleotide():
+        geometry = residue_entry.geometry
+
+        if geometry:
+            geometry_validator = GeometryValidator(geometry)
+            geometry_records.extend(geometry_validator.validate())
+
+            for validator_class in VALIDATOR_CLASSES:
+                restraints.extend(validator_class(geometry).resolve())
+
+    return restraints, geometry_records
+
+
+def validate_residue_entry(residue_entry: ResidueCacheEntry) -> Tuple[List[ValidationRecord], List[TorsionRecord]]:
+    """
+    Pass one prepared residue through validators.
+    """
+    restraints, geometry_records = resolve_residue_entry(residue_entry)
+    return validation_records(restraints), geometry_records
+
+
+def validate_residue_cache(residue_cache: List[ResidueCacheEntry], processes: int = 1) -> Tuple[ValidationTable, List[TorsionRecord]]:
+    """
+    Pass prepared residues through validators.
+    Bonds and angles of all residues are resolved first and calculated in one batch.
+    With more than one process, model/chain partitions are validated in a pool of worker processes
+    (only where processes can be forked, otherwise residues are validated serially).
+    """
+    if processes > 1 and "fork" in multiprocessing.get_all_start_methods():
+        return validate_residue_cache_parallel(residue_cache, resolve_residue_entry, processes)
+
+    restraints = []
     geometry_records = []
     for residue_entry in residue_cache:
-        if residue_entry.is_nucleotide():
-            geometry = residue_entry.geometry
+        residue_restraints, residue_geometry_records = resolve_residue_entry(residue_entry)
+        restraints.extend(residue_restraints)
+        geometry_records.extend(residue_geometry_records)
 
-            if geometry:
-                geometry_validator = GeometryValidator(geometry)
-                geometry_records.extend(geometry_validator.validate())
+    return validation_table(restraints), geometry_records
 
-                bases = BasesValidator(geometry)
-                validation_records.extend(bases.validate())
 
-                po4 = Po4Validator(geometry)
-                validation_records.extend(po4.validate())
+def validate_structure(structure, links: Optional[np.ndarray] = None, processes: int = 1) -> Tuple[ValidationTable, List[TorsionRecord]]:
+    """
+    Calculates torsion angles and pass residues through validators.
+    Bond and angle results are returned as ValidationTable, iterating the table yields ValidationRecord-like views.
+    """
+    residue_cache = prepare_residue_cache(structure, links)
+    return validate_residue_cache(residue_cache, processes)
+
+
+def load_structure(
+    structure_filepath: str,
+    fast_reader: bool = False,
+    res_names: Optional[Sequence[str]] = None,
+    structure_cache: Optional[StructureCache] = None,
+) -> Tuple[Structure, Optional[np.ndarray]]:
+    """
+    Read the structure, using the structure cache when given.
+    Returns the structure and the residue links, links are None when the structure was not cached.
+    """
+    if structure_cache is None:
+        return read_structure(structure_filepath, fast_reader, res_names), None
 
-                sugar = SugarPuckerBasedSugarValidator(geometry)
-                validation_records.extend(sugar.validate())
+    key = structure_cache.key(structure_filepath, res_names)
+    cached = structure_cache.load(key)
+    if cached is not None:
+        table, links = cached
+        return build_structure(table, pdbcode_from_path(structure_filepath)), links
 
-    return validation_records, geometry_records
+    structure = read_structure(structure_filepath, fast_reader, res_names)
+    links = residue_links(link_residues(fill_residue_cache(structure, structure.id)))
+    structure_cache.save(key, atom_table_from_structure(structure), links)
+    return structure, links
 
 
 def print_records(
-    printer: Union[AnglesCsvPrinter, BondsCsvPrinter, GeometryCsvPrinter],
-    validation_records: Union[List[ValidationRecord], List[TorsionRecord]],
+    printer: CsvPrinter,
+    records: Union[ValidationTable, List[ValidationRecord], List[TorsionRecord]],
     out_filename: str,
 ):
     """
-    Save validation records to a file.
+    Save validation records to a file, lines are written as the records are formatted.
+    Files with .parquet or .arrow extension are written as typed columnar tables with the same columns.
     """
-    lines = printer.print(validation_records)  # type: ignore
-    # save to file
+    if output_format(out_filename) != CSV_FORMAT:
+        write_arrow_table(arrow_table(printer, records), out_filename)
+        return
     with open(out_filename, "w", encoding="utf-8") as out_file:
-        out_file.write("\n".join(lines))
-        out_file.write("\n")
-
-
-def main(structure_filepath: str, bonds_out_filepath: str, angles_out_filepath: str, geometry_out_path: str):
-    sructure = read_structure(structure_filepath)
-    validation_records, geometry_records = validate_structure(sructure)
-
-    bonds_printer = BondsCsvPrinter()
-    print_records(bonds_printer, validation_records, bonds_out_filepath)
+        printer.write(records, out_file)  # type: ignore
 
-    angles_printer = AnglesCsvPrinter()
-    print_records(angles_printer, validation_records, angles_out_filepath)
 
-    geometry_printer = GeometryCsvPrinter()
-    print_records(geometry_printer, geometry_records, geometry_out_path)
+def selected_res_names(nucleotides_only: bool, modified_nucleotides: Sequence[str] = ()) -> Optional[Tuple[str, ...]]:
+    """
+    Residue names kept while parsing, None means that all residues are kept.
+    Modified nucleotides are not validated, but have to be kept to link neighbouring standard nucleotides through them.
+    """
+    if not nucleotides_only:
+        return None
+    return tuple(NUCLEOTIDE_RES_NAMES) + tuple(modified_nucleotides)
+
+
+def main(
+    structure_filepath: str,
+    bonds_out_filepath: str,
+    angles_out_filepath: str,
+    geometry_out_path: str,
+    fast_reader: bool = False,
+    nucleotides_only: bool = False,
+    modified_nucleotides: Sequence[str] = (),
+    structure_cache_dir: Optional[str] = None,
+    structure_cache_size: int = DEFAULT_STRUCTURE_CACHE_SIZE,
+    processes: int = 1,
+    mmcif_out_filepath: Optional[str] = None,
+    embed_structure: bool = False,
+):
+    # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-locals
+    structure_cache = StructureCache(structure_cache_dir, structure_cache_size) if structure_cache_dir else None
+    res_names = selected_res_names(nucleotides_only, modified_nucleotides)
+    sructure, links = load_structure(structure_filepath, fast_reader, res_names, structure_cache)
+    print(f"# PDB id: {sructure.id}")
+    table, geometry_records = validate_structure(sructure, links, processes)
+
+    if mmcif_out_filepath:
+        # all results in one mmCIF file instead of the bonds, angles and geometry files
+        with open(mmcif_out_filepath, "w", encoding="utf-8") as mmcif_file:
+            write_mmcif(mmcif_file, sructure.id, table, geometry_records, structure_filepath if embed_structure else None)
+        return 0
+
+    if output_format(bonds_out_filepath) == output_format(angles_out_filepath) == CSV_FORMAT:
+        # bonds and angles are routed to their files in one pass over the records
+        with open(bonds_out_filepath, "w", encoding="utf-8") as bonds_file, open(angles_out_filepath, "w", encoding="utf-8") as angles_file:
+            write_validation_records(table, bonds_file, angles_file)
+    else:
+        print_records(BondsCsvPrinter, table, bonds_out_filepath)
+        print_records(AnglesCsvPrinter, table, angles_out_filepath)
+
+    print_records(GeometryCsvPrinter, geometry_records, geometry_out_path)
     return 0
 
 
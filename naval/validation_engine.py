@@ -0,0 +1,91 @@
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+from Bio.PDB.Atom import Atom
+from Bio.PDB.vectors import Vector
+
+from naval.geometry_engine import bond_angles, bond_lengths
+from naval.nucleotide_geometry import NucleotideGeometry
+from naval.restraint_definition import PDB_OUTLIER, AngleDefinition, BondDefinition
+from naval.validation_record import ValidationRecord
+from naval.validation_table import ANGLE, BOND, NO_ATOM, ValidationTable
+
+# (geometry, restraint definition, atoms of the bond or angle)
+ResolvedRestraint = Tuple[NucleotideGeometry, Union[BondDefinition, AngleDefinition], Tuple[Atom, ...]]
+
+
+def restraint_thresholds(definitions: Sequence[Union[BondDefinition, AngleDefinition]]) -> np.ndarray:
+    """
+    Return (n, 6) array of CSD preferred, PDB allowed and PDB suspicious (left, right) intervals of the definitions
+    """
+    return np.array([definition.thresholds for definition in definitions], dtype=np.float64).reshape(-1, 6)
+
+
+def classify_values(values: np.ndarray, thresholds: np.ndarray) -> np.ndarray:
+    """
+    Return label codes (the same as classify_value) of the values, thresholds are compared in the precision of the values
+    """
+    thresholds = thresholds.astype(values.dtype)
+    inside = (thresholds[:, 0::2] <= values[:, np.newaxis]) & (values[:, np.newaxis] <= thresholds[:, 1::2])
+    # the first matching interval (preferred, allowed, suspicious), outlier if none
+    return np.where(inside.any(axis=1), inside.argmax(axis=1), PDB_OUTLIER).astype(np.uint8)
+
+
+def _atom_coord(atom: Atom) -> np.ndarray:
+    coord = atom.get_coord()
+    # atoms can be created with Bio.PDB.vectors.Vector coordinates
+    return coord.get_array() if isinstance(coord, Vector) else coord
+
+
+def _object_index(ids: Dict[int, int], objects: list, obj) -> int:
+    # position of the object in the list of unique objects, objects are compared by identity
+    i = ids.get(id(obj))
+    if i is None:
+        i = ids[id(obj)] = len(objects)
+        objects.append(obj)
+    return i
+
+
+def validation_table(restraints: List[ResolvedRestraint]) -> ValidationTable:
+    """
+    Calculate all bond lengths and angles of the resolved restraints in one pass and label them
+    """
+    # pylint: disable=too-many-locals
+    atom_ids: Dict[int, int] = {}
+    atoms: List[Atom] = []
+    geometry_ids: Dict[int, int] = {}
+    geometries: List[NucleotideGeometry] = []
+    definition_ids: Dict[int, int] = {}
+    definitions: List[Union[BondDefinition, AngleDefinition]] = []
+
+    validation_type = np.empty(len(restraints), dtype=np.uint8)
+    geometry_index = np.empty(len(restraints), dtype=np.int32)
+    definition_index = np.empty(len(restraints), dtype=np.int32)
+    atom_indices = np.full((len(restraints), 3), NO_ATOM, dtype=np.int32)
+    for i, (geometry, definition, restraint_atoms) in enumerate(restraints):
+        validation_type[i] = BOND if len(restraint_atoms) == 2 else ANGLE
+        geometry_index[i] = _object_index(geometry_ids, geometries, geometry)
+        definition_index[i] = _object_index(definition_ids, definitions, definition)
+        for j, atom in enumerate(restraint_atoms):
+            atom_indices[i, j] = _object_index(atom_ids, atoms, atom)
+
+    coords = np.array([_atom_coord(atom) for atom in atoms], dtype=np.float32).reshape(-1, 3)
+    thresholds = restraint_thresholds(definitions)
+    calculated_value = np.empty(len(restraints), dtype=np.float64)
+    label_code = np.empty(len(restraints), dtype=np.uint8)
+    for type_code, n_atoms, calculate in ((BOND, 2, bond_lengths), (ANGLE, 3, bond_angles)):
+        rows = np.flatnonzero(validation_type == type_code)
+        values = calculate(coords[atom_indices[rows, :n_atoms]])
+        calculated_value[rows] = values
+        label_code[rows] = classify_values(values, thresholds[definition_index[rows]])
+
+    return ValidationTable(
+        atoms, geometries, definitions, validation_type, geometry_index, definition_index, atom_indices, calculated_value, label_code
+    )
+
+
+def validation_records(restraints: List[ResolvedRestraint]) -> List[ValidationRecord]:
+    """
+    Calculate all bond lengths and angles of the resolved restraints in one pass and return validation records
+    """
+    return validation_table(restraints).records()
@@ -3,6 +3,15 @@ from typing import Optional
 from Bio.PDB.Atom import Atom
 
 from naval.nucleotide_geometry import NucleotideGeometry
+from naval.restraint_definition import (
+    CSD_PREFERRED,
+    PDB_ACCEPTABLE,
+    PDB_OUTLIER,
+    PDB_SUSPICIOUS,
+    VALIDATION_LABELS,
+    classify_value,
+    label_thresholds,
+)
 
 
 class ValidationRecord:
@@ -31,9 +40,11 @@ class ValidationRecord:
         "pdb_allowed_right",
         "pdb_suspicious_left",
         "pdb_suspicious_right",
+        "label",
     )
 
     # pylint: disable=too-many-arguments
+    # pylint: disable=too-many-locals
     def __init__(
         self,
         validation_type: str,
@@ -41,7 +52,7 @@ class ValidationRecord:
         geometry: NucleotideGeometry,
         atom1: Atom,
         atom2: Atom,
-        atom3: Atom,
+        atom3: Optional[Atom],
         calculated_value: float,
         target_value: float,
         target_sigma: float,
@@ -51,6 +62,8 @@ class ValidationRecord:
         # percentiles equvalent of 4 sigma 0.9999% of population (1 per 15787)
         pdb_suspicious_left: float,
         pdb_suspicious_right: float,
+        # label calculated in advance (by the validation engine), classified from the thresholds if not given
+        label: Optional[str] = None,
     ) -> None:
         if validation_type not in ("angle", "bond"):
             raise ValueError("Validation type nees to one of ['angle', 'bond']")
@@ -64,41 +77,33 @@ class ValidationRecord:
         self.target_value: float = target_value
         self.target_sigma: float = target_sigma
 
-        self.csd_preferred_left: float = self.target_value - 3 * self.target_sigma
-        self.csd_preferred_right: float = self.target_value + 3 * self.target_sigma
+        thresholds = label_thresholds(target_value, target_sigma, pdb_allowed_left, pdb_allowed_right, pdb_suspicious_left, pdb_suspicious_right)
+        (
+            self.csd_preferred_left,
+            self.csd_preferred_right,
+            self.pdb_allowed_left,
+            self.pdb_allowed_right,
+            self.pdb_suspicious_left,
+            self.pdb_suspicious_right,
+        ) = thresholds
 
-        self.pdb_allowed_left: float = pdb_allowed_left
-        self.pdb_allowed_right: float = pdb_allowed_right
-
-        self.pdb_suspicious_left: float = pdb_suspicious_left
-        self.pdb_suspicious_right: float = pdb_suspicious_right
+        # the label is stored, printers do not classify the value again
+        self.label: str = label if label is not None else VALIDATION_LABELS[classify_value(calculated_value, thresholds)]
 
     def __str__(self) -> str:
         return f"{self.validation_type} {self.name} {self.atom1} {self.atom2}" f" {self.atom3} {self.calculated_value:.3f} {self.target_value}"
 
     def is_preferred(self) -> bool:
-        return self.csd_preferred_left <= self.calculated_value <= self.csd_preferred_right
+        return self.label == VALIDATION_LABELS[CSD_PREFERRED]
 
     def is_allowed(self) -> bool:
-        return False if self.is_preferred() else (self.pdb_allowed_left <= self.calculated_value <= self.pdb_allowed_right)
+        return self.label == VALIDATION_LABELS[PDB_ACCEPTABLE]
 
     def is_suspicious(self) -> bool:
-        return (
-            False if (self.is_preferred() or self.is_allowed()) else (self.pdb_suspicious_left <= self.calculated_value <= self.pdb_suspicious_right)
-        )
+        return self.label == VALIDATION_LABELS[PDB_SUSPICIOUS]
 
     def is_outlier(self) -> bool:
-        return not (self.is_suspicious() or self.is_allowed() or self.is_preferred())
-
-    @property
-    def label(self) -> str:
-        if self.is_preferred():
-            return "CSD-preferred"  # CSD-acceptable ?
-        if self.is_allowed():
-            return "PDB-acceptable"
-        if self.is_suspicious():
-            return "PDB-suspicious"
-        return "PDB-outlier"
+        return self.label == VALIDATION_LABELS[PDB_OUTLIER]
 
 
 class TorsionRecord:
@@ -0,0 +1,290 @@
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from Bio.PDB.Atom import Atom
+
+from naval.nucleotide_geometry import NucleotideGeometry
+from naval.restraint_definition import (
+    CSD_PREFERRED,
+    PDB_ACCEPTABLE,
+    PDB_OUTLIER,
+    PDB_SUSPICIOUS,
+    VALIDATION_LABELS,
+    AngleDefinition,
+    BondDefinition,
+)
+from naval.validation_record import ValidationRecord
+
+VALIDATION_TYPES = ("bond", "angle")
+BOND, ANGLE = range(len(VALIDATION_TYPES))
+NO_ATOM = -1
+
+
+class ValidationTable:
+    """
+    Struct-of-arrays container of the bond and angle validation results.
+    Each row keeps indices of the atoms, geometry and restraint definition, the calculated value and the label code,
+    atoms, geometries and definitions are stored once per table and resolved only when the row is accessed.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    __slots__ = (
+        "atoms",
+        "geometries",
+        "definitions",
+        "validation_type",
+        "geometry_index",
+        "definition_index",
+        "atom_indices",
+        "calculated_value",
+        "label_code",
+    )
+
+    def __init__(
+        self,
+        atoms: List[Atom],
+        geometries: List[NucleotideGeometry],
+        definitions: List[Union[BondDefinition, AngleDefinition]],
+        validation_type: np.ndarray,
+        geometry_index: np.ndarray,
+        definition_index: np.ndarray,
+        atom_indices: np.ndarray,
+        calculated_value: np.ndarray,
+        label_code: np.ndarray,
+    ) -> None:
+        # pylint: disable=too-many-arguments
+        self.atoms = atoms
+        self.geometries = geometries
+        self.definitions = definitions
+        # index of VALIDATION_TYPES
+        self.validation_type = np.asarray(validation_type, dtype=np.uint8)
+        self.geometry_index = np.asarray(geometry_index, dtype=np.int32)
+        self.definition_index = np.asarray(definition_index, dtype=np.int32)
+        # (n, 3) indices of atoms, NO_ATOM for the third atom of bonds
+        self.atom_indices = np.asarray(atom_indices, dtype=np.int32).reshape(-1, 3)
+        # bond lengths are float32 values (as Atom.__sub__), exactly represented in the float64 column
+        self.calculated_value = np.asarray(calculated_value, dtype=np.float64)
+        # index of VALIDATION_LABELS
+        self.label_code = np.asarray(label_code, dtype=np.uint8)
+
+    @classmethod
+    def empty(cls) -> "ValidationTable":
+        return cls([], [], [], np.empty(0), np.empty(0), np.empty(0), np.empty((0, 3)), np.empty(0), np.empty(0))
+
+    @classmethod
+    def concatenate(cls, tables: Sequence["ValidationTable"]) -> "ValidationTable":
+        """
+        Join tables, atoms, geometries and definitions lists are joined and the indices shifted.
+        Lists shared by several tables (for example rows taken from one table) are joined only once.
+        """
+        if not tables:
+            return cls.empty()
+        atoms: List[Atom] = []
+        geometries: List[NucleotideGeometry] = []
+        definitions: List[Union[BondDefinition, AngleDefinition]] = []
+        atom_indices = []
+        geometry_index = []
+        definition_index = []
+        # ids of the shared lists -> offsets of atoms, geometries and definitions in the joined lists
+        offsets: Dict[Tuple[int, int, int], Tuple[int, int, int]] = {}
+        for table in tables:
+            lists_key = (id(table.atoms), id(table.geometries), id(table.definitions))
+            if lists_key not in offsets:
+                offsets[lists_key] = (len(atoms), len(geometries), len(definitions))
+                atoms.extend(table.atoms)
+                geometries.extend(table.geometries)
+                definitions.extend(table.definitions)
+            atom_offset, geometry_offset, definition_offset = offsets[lists_key]
+            atom_indices.append(np.where(table.atom_indices == NO_ATOM, NO_ATOM, table.atom_indices + atom_offset))
+            geometry_index.append(table.geometry_index + geometry_offset)
+            definition_index.append(table.definition_index + definition_offset)
+        return cls(
+            atoms,
+            geometries,
+            definitions,
+            np.concatenate([table.validation_type for table in tables]),
+            np.concatenate(geometry_index),
+            np.concatenate(definition_index),
+            np.concatenate(atom_indices),
+            np.concatenate([table.calculated_value for table in tables]),
+            np.concatenate([table.label_code for table in tables]),
+        )
+
+    def take(self, indices: Union[np.ndarray, slice]) -> "ValidationTable":
+        """
+        Return table with the selected rows (indices, boolean mask or slice), atoms, geometries and definitions are shared
+        """
+        return ValidationTable(
+            self.atoms,
+            self.geometries,
+            self.definitions,
+            self.validation_type[indices],
+            self.geometry_index[indices],
+            self.definition_index[indices],
+            self.atom_indices[indices],
+            self.calculated_value[indices],
+            self.label_code[indices],
+        )
+
+    def bonds(self) -> "ValidationTable":
+        return self.take(self.validation_type == BOND)
+
+    def angles(self) -> "ValidationTable":
+        return self.take(self.validation_type == ANGLE)
+
+    def labels(self) -> np.ndarray:
+        return np.array(VALIDATION_LABELS)[self.label_code]
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Size of the columns in bytes
+        """
+        return sum(
+            column.nbytes
+            for column in (
+                self.validation_type,
+                self.geometry_index,
+                self.definition_index,
+                self.atom_indices,
+                self.calculated_value,
+                self.label_code,
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.validation_type)
+
+    def __getitem__(self, index: int) -> "ValidationRecordView":
+        if not -len(self) <= index < len(self):
+            raise IndexError("validation table index out of range")
+        return ValidationRecordView(self, index % len(self))
+
+    def __iter__(self) -> Iterator["ValidationRecordView"]:
+        for index in range(len(self)):
+            yield ValidationRecordView(self, index)
+
+    def records(self) -> List[ValidationRecord]:
+        """
+        Return rows as ValidationRecord objects
+        """
+        return [view.record() for view in self]
+
+
+class ValidationRecordView:
+    """
+    Read-only view of one row of ValidationTable with the ValidationRecord interface
+    """
+
+    # pylint: disable=too-many-public-methods
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: ValidationTable, index: int) -> None:
+        self.table = table
+        self.index = index
+
+    @property
+    def definition(self) -> Union[BondDefinition, AngleDefinition]:
+        return self.table.definitions[self.table.definition_index[self.index]]
+
+    @property
+    def validation_type(self) -> str:
+        return VALIDATION_TYPES[self.table.validation_type[self.index]]
+
+    @property
+    def name(self) -> str:
+        return self.definition.name
+
+    @property
+    def geometry(self) -> NucleotideGeometry:
+        return self.table.geometries[self.table.geometry_index[self.index]]
+
+    @property
+    def atom1(self) -> Atom:
+        return self.table.atoms[self.table.atom_indices[self.index, 0]]
+
+    @property
+    def atom2(self) -> Atom:
+        return self.table.atoms[self.table.atom_indices[self.index, 1]]
+
+    @property
+    def atom3(self) -> Optional[Atom]:
+        atom_index = self.table.atom_indices[self.index, 2]
+        return None if atom_index == NO_ATOM else self.table.atoms[atom_index]
+
+    @property
+    def calculated_value(self) -> float:
+        value = self.table.calculated_value[self.index]
+        return np.float32(value) if self.table.validation_type[self.index] == BOND else value
+
+    @property
+    def target_value(self) -> float:
+        return self.definition.csd_target
+
+    @property
+    def target_sigma(self) -> float:
+        return self.definition.csd_std
+
+    @property
+    def csd_preferred_left(self) -> float:
+        return self.definition.thresholds[0]
+
+    @property
+    def csd_preferred_right(self) -> float:
+        return self.definition.thresholds[1]
+
+    @property
+    def pdb_allowed_left(self) -> float:
+        return self.definition.thresholds[2]
+
+    @property
+    def pdb_allowed_right(self) -> float:
+        return self.definition.thresholds[3]
+
+    @property
+    def pdb_suspicious_left(self) -> float:
+        return self.definition.thresholds[4]
+
+    @property
+    def pdb_suspicious_right(self) -> float:
+        return self.definition.thresholds[5]
+
+    @property
+    def label(self) -> str:
+        return VALIDATION_LABELS[self.table.label_code[self.index]]
+
+    def is_preferred(self) -> bool:
+        return self.table.label_code[self.index] == CSD_PREFERRED
+
+    def is_allowed(self) -> bool:
+        return self.table.label_code[self.index] == PDB_ACCEPTABLE
+
+    def is_suspicious(self) -> bool:
+        return self.table.label_code[self.index] == PDB_SUSPICIOUS
+
+    def is_outlier(self) -> bool:
+        return self.table.label_code[self.index] == PDB_OUTLIER
+
+    def record(self) -> ValidationRecord:
+        definition = self.definition
+        return ValidationRecord(
+            self.validation_type,
+            definition.name,
+            self.geometry,
+            self.atom1,
+            self.atom2,
+            self.atom3,
+            self.calculated_value,
+            definition.csd_target,
+            definition.csd_std,
+            definition.pdb_3low,
+            definition.pdb_3high,
+            definition.pdb_4low,
+            definition.pdb_4high,
+            self.label,
+        )
+
+    def __str__(self) -> str:
+        return str(self.record())
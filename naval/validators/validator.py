@@ -1,11 +1,12 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-import numpy as np
 from Bio.PDB import Chain
-from Bio.PDB.vectors import calc_angle
 
+from naval.nucleotide_definitions import RESIDUE_CLASSES
 from naval.nucleotide_geometry import NucleotideGeometry
 from naval.restraint_definition import AngleDefinition, BondDefinition
+from naval.restraint_index import RESTRAINT_INDEX, RestraintIndex, RestraintTable
+from naval.validation_engine import ResolvedRestraint, validation_records
 from naval.validation_record import ValidationRecord
 
 
@@ -13,6 +14,13 @@ class NonStandardResidueException(Exception):
     """Raise when non canonical residue is passed to Validator"""
 
 
+def nucleotide_residue_class(res_name: str) -> str:
+    try:
+        return RESIDUE_CLASSES[res_name]
+    except KeyError as exception:
+        raise NonStandardResidueException(f"Non-standard residue: {res_name}") from exception
+
+
 class Validator:
     """
     Base validator class
@@ -20,12 +28,15 @@ class Validator:
 
     # pylint: disable=too-few-public-methods
 
+    name = "validator"
+
     def __init__(self, geometry: NucleotideGeometry, csd_sig: float = 3) -> None:
         self.geometry = geometry
         self.csd_sig = csd_sig
 
         self.bonds_definition: dict = {}
         self.angles_definition: dict = {}
+        self.restraint_index = self.compiled_restraint_index()
 
     def _atom_names_bonds(self, res_name: str) -> List[BondDefinition]:
         # TODO return list of (d.atom1, d.atom2)
@@ -34,31 +45,59 @@ class Validator:
     def _atom_names_angles(self, res_name: str) -> List[AngleDefinition]:
         return self.angles_definition[res_name]
 
-    # pylint: disable=unused-argument
-    def _find_bond_definitions(self, res_name: str, altloc: str, atom1_name: str, atom2_name: str) -> List[BondDefinition]:
-        return self.bonds_definition[res_name]
+    @classmethod
+    def bond_tables(cls) -> Iterator[RestraintTable]:
+        """
+        Yield (residue class, conformation class, bond definitions) tables compiled into the restraint index
+        """
+        yield from ()
+
+    @classmethod
+    def angle_tables(cls) -> Iterator[RestraintTable]:
+        """
+        Yield (residue class, conformation class, angle definitions) tables compiled into the restraint index
+        """
+        yield from ()
+
+    @classmethod
+    def compiled_restraint_index(cls) -> RestraintIndex:
+        if cls.name not in RESTRAINT_INDEX.validators:
+            RESTRAINT_INDEX.add_validator(cls.name, cls.bond_tables(), cls.angle_tables())
+        return RESTRAINT_INDEX
+
+    def _residue_class(self, res_name: str) -> str:
+        return res_name
 
     # pylint: disable=unused-argument
-    # pylint: disable=too-many-arguments
-    def _find_anlge_definitions(self, res_name: str, altloc: str, atom1_name: str, atom2_name: str, atom3_name: str) -> List[AngleDefinition]:
-        return self.angles_definition[res_name]
+    def _bond_conformation_class(self, altloc: str, atom1_name: str, atom2_name: str) -> str:
+        return ""
 
-    def _select_bond_definition(self, definitions, atom1: str, atom2: str) -> Optional[BondDefinition]:
-        for definition in definitions:
-            if definition.atom1_name == atom1 and definition.atom2_name == atom2:
-                return definition
-        return None
-
-    def _select_angle_definition(self, definitions, atom1: str, atom2: str, atom3: str) -> Optional[AngleDefinition]:
-        for definition in definitions:
-            if definition.atom1_name == atom1 and definition.atom2_name == atom2 and definition.atom3_name == atom3:
-                return definition
-        return None
-
-    def _validate_bonds(self, res_name: str, resseq: str, chain: Chain) -> List[ValidationRecord]:
-        # pylint: disable=too-many-locals
+    # pylint: disable=unused-argument
+    def _angle_conformation_class(self, altloc: str, atom1_name: str, atom2_name: str, atom3_name: str) -> str:
+        return ""
+
+    def _find_bond_definition(self, res_name: str, altloc: str, atom1_name: str, atom2_name: str) -> Optional[BondDefinition]:
+        return self.restraint_index.bond(
+            self.name, self._residue_class(res_name), self._bond_conformation_class(altloc, atom1_name, atom2_name), atom1_name, atom2_name
+        )
+
+    def _find_angle_definition(self, res_name: str, altloc: str, atom1_name: str, atom2_name: str, atom3_name: str) -> Optional[AngleDefinition]:
+        # pylint: disable=too-many-arguments
+        return self.restraint_index.angle(
+            self.name,
+            self._residue_class(res_name),
+            self._angle_conformation_class(altloc, atom1_name, atom2_name, atom3_name),
+            atom1_name,
+            atom2_name,
+            atom3_name,
+        )
+
+    def _resolve_bonds(self, res_name: str) -> List[ResolvedRestraint]:
+        """
+        Return (geometry, definition, atoms) of all bonds of the residue matching the restraint definitions
+        """
         # pylint: disable=too-many-nested-blocks
-        records = []
+        restraints: List[ResolvedRestraint] = []
         for atom_definition in self._atom_names_bonds(res_name):
             try:
                 atoms1 = self.geometry.pick_atoms(atom_definition.atom1_name, atom_definition.atom1_relative_res_position)
@@ -71,37 +110,19 @@ class Validator:
                             altloc_set.discard(" ")
                             altloc = "" if len(altloc_set) == 0 else altloc_set.pop()
 
-                            definitions = self._find_bond_definitions(res_name, altloc, atom1.name, atom2.name)
-                            definition = self._select_bond_definition(definitions, atom1.name, atom2.name)
-
-                            dist = round(atom2 - atom1, 3)
-
+                            definition = self._find_bond_definition(res_name, altloc, atom1.name, atom2.name)
                             if definition:
-                                records.append(
-                                    ValidationRecord(
-                                        "bond",
-                                        definition.name,
-                                        self.geometry,
-                                        atom1,
-                                        atom2,
-                                        None,
-                                        dist,
-                                        definition.csd_target,
-                                        definition.csd_std,
-                                        definition.pdb_3low,
-                                        definition.pdb_3high,
-                                        definition.pdb_4low,
-                                        definition.pdb_4high,
-                                    )
-                                )
+                                restraints.append((self.geometry, definition, (atom1, atom2)))
             except KeyError:
                 pass
-        return records
+        return restraints
 
-    def _validate_angles(self, res_name: str, resseq: str, chain: Chain) -> List[ValidationRecord]:
-        # pylint: disable=too-many-locals
+    def _resolve_angles(self, res_name: str) -> List[ResolvedRestraint]:
+        """
+        Return (geometry, definition, atoms) of all angles of the residue matching the restraint definitions
+        """
         # pylint: disable=too-many-nested-blocks
-        records = []
+        restraints: List[ResolvedRestraint] = []
         for atom_definition in self._atom_names_angles(res_name):
             try:
                 atoms1 = self.geometry.pick_atoms(atom_definition.atom1_name, atom_definition.atom1_relative_res_position)
@@ -125,44 +146,25 @@ class Validator:
                                 altloc_set.discard(" ")
                                 altloc = "" if len(altloc_set) == 0 else altloc_set.pop()
 
-                                definitions = self._find_anlge_definitions(res_name, altloc, atom1.name, atom2.name, atom3.name)
-                                definition = self._select_angle_definition(definitions, atom1.name, atom2.name, atom3.name)
-
-                                angle_value = calc_angle(
-                                    atom1.get_vector(),
-                                    atom2.get_vector(),
-                                    atom3.get_vector(),
-                                )
-                                angle_value = np.round(np.rad2deg(angle_value), 1)
-
+                                definition = self._find_angle_definition(res_name, altloc, atom1.name, atom2.name, atom3.name)
                                 if definition:
-                                    records.append(
-                                        ValidationRecord(
-                                            "angle",
-                                            definition.name,
-                                            self.geometry,
-                                            atom1,
-                                            atom2,
-                                            atom3,
-                                            angle_value,
-                                            definition.csd_target,
-                                            definition.csd_std,
-                                            definition.pdb_3low,
-                                            definition.pdb_3high,
-                                            definition.pdb_4low,
-                                            definition.pdb_4high,
-                                        )
-                                    )
+                                    restraints.append((self.geometry, definition, (atom1, atom2, atom3)))
             except KeyError:
                 pass
-        return records
+        return restraints
 
-    def validate(self) -> List[ValidationRecord]:
+    def _validate_bonds(self, res_name: str, resseq: str, chain: Chain) -> List[ValidationRecord]:
+        return validation_records(self._resolve_bonds(res_name))
+
+    def _validate_angles(self, res_name: str, resseq: str, chain: Chain) -> List[ValidationRecord]:
+        return validation_records(self._resolve_angles(res_name))
+
+    def resolve(self) -> List[ResolvedRestraint]:
+        """
+        Return bonds and angles of the residue to be validated, the values are calculated later in one batch
+        """
         res_name = self.geometry.residue_entry.res_name
-        resseq = self.geometry.residue_entry.resseq
-        chain = self.geometry.residue_entry.chain
+        return self._resolve_bonds(res_name) + self._resolve_angles(res_name)
 
-        records = []
-        records.extend(self._validate_bonds(res_name, resseq, chain))
-        records.extend(self._validate_angles(res_name, resseq, chain))
-        return records
+    def validate(self) -> List[ValidationRecord]:
+        return validation_records(self.resolve())
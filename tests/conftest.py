@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+from naval.validate import read_structure, validate_structure
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+@pytest.fixture
+def validate_example():
+    """
+    Validate the example structure, returns the structure, validation table and torsion records
+    """
+
+    def validate(filename):
+        structure = read_structure(EXAMPLES_DIR + filename)
+        validation_table, geometry_records = validate_structure(structure)
+        return structure, validation_table, geometry_records
+
+    return validate
@@ -0,0 +1,58 @@
+import gzip
+import io
+import os
+
+from naval.api import ValidationResult, validate
+from naval.printer import BondsCsvPrinter, GeometryCsvPrinter
+from naval.validate import detect_structure_format, read_structure
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+def read_example(filename):
+    with open(EXAMPLES_DIR + filename, "rb") as handle:
+        return handle.read()
+
+
+def test_detect_structure_format():
+    assert detect_structure_format(read_example("1d8g.cif")) == "cif"
+    assert detect_structure_format(read_example("1d8g.pdb")) == "pdb"
+    assert detect_structure_format(b"\x82\xa7encoder") == "bcif"
+
+
+def test_validate_sources(capsys):
+    expected = validate(EXAMPLES_DIR + "1d8g.cif")
+    assert isinstance(expected, ValidationResult)
+    assert expected.pdbcode == "1d8g"
+    expected_bonds = BondsCsvPrinter.print(expected.validation_table)
+    expected_geometry = GeometryCsvPrinter.print(expected.geometry_records)
+
+    content = read_example("1d8g.cif")
+    sources = [
+        content,
+        gzip.compress(content),
+        io.BytesIO(content),
+        io.StringIO(content.decode("utf-8")),
+        read_structure(EXAMPLES_DIR + "1d8g.cif"),
+    ]
+    for source in sources:
+        result = validate(source, pdbcode="1d8g")
+        assert BondsCsvPrinter.print(result.validation_table) == expected_bonds
+        assert GeometryCsvPrinter.print(result.geometry_records) == expected_geometry
+
+    fast_result = validate(read_example("1d8g.pdb"), pdbcode="1d8g", structure_format="pdb", fast_reader=True)
+    assert len(fast_result.bonds()) == len(expected.bonds())
+    assert len(fast_result.angles()) == len(expected.angles())
+    # nothing is printed
+    assert capsys.readouterr().out == ""
+
+
+def test_validation_result_rows(validate_example):
+    result = validate(EXAMPLES_DIR + "5hr7.pdb")
+    _, validation_table, geometry_records = validate_example("5hr7.pdb")
+
+    rows = result.rows()
+    assert len(rows["bonds"]) == len(validation_table.bonds())
+    assert len(rows["angles"]) == len(validation_table.angles())
+    assert len(rows["geometry"]) == len(geometry_records)
+    assert rows["bonds"][0][1] == "5hr7"
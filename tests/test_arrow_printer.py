@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from naval.arrow_printer import (
+    ARROW_FORMAT,
+    CSV_FORMAT,
+    PARQUET_FORMAT,
+    ArrowTableWriter,
+    arrow_table,
+    output_format,
+    read_arrow_table,
+    write_arrow_table,
+)
+from naval.batch import run_batch
+from naval.printer import AnglesCsvPrinter, BondsCsvPrinter, GeometryCsvPrinter
+
+pa = pytest.importorskip("pyarrow")
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+def csv_rows(table):
+    return [",".join("" if value is None else str(value) for value in row.values()) for row in table.to_pylist()]
+
+
+def test_output_format():
+    assert output_format("bonds.csv") == CSV_FORMAT
+    assert output_format("bonds.PARQUET") == PARQUET_FORMAT
+    assert output_format("/tmp/bonds.arrow") == ARROW_FORMAT
+    assert output_format("bonds.txt") == CSV_FORMAT
+
+
+def test_arrow_table(validate_example):
+    _, validation_table, geometry_records = validate_example("1d8g.cif")
+
+    for printer, records in ((BondsCsvPrinter, validation_table), (AnglesCsvPrinter, validation_table), (GeometryCsvPrinter, geometry_records)):
+        table = arrow_table(printer, records)
+        assert table.schema.names == printer.format_header().split(",")
+        assert csv_rows(table) == printer.print(records)[1:]
+
+    table = arrow_table(BondsCsvPrinter, validation_table)
+    assert pa.types.is_dictionary(table.schema.field("validation_label").type)
+    assert pa.types.is_int32(table.schema.field("model_id").type)
+    assert pa.types.is_float64(table.schema.field("calculated").type)
+
+
+def test_write_arrow_table(tmp_path, validate_example):
+    _, validation_table, _ = validate_example("1d8g.cif")
+    table = arrow_table(AnglesCsvPrinter, validation_table)
+
+    for filename in ("angles.parquet", "angles.arrow"):
+        write_arrow_table(table, str(tmp_path / filename))
+        assert read_arrow_table(str(tmp_path / filename)).equals(table)
+
+    with ArrowTableWriter(str(tmp_path / "merged.arrow"), table.schema) as writer:
+        writer.write(table)
+        writer.write(table.slice(0, 5))
+    assert read_arrow_table(str(tmp_path / "merged.arrow")).num_rows == table.num_rows + 5
+
+
+def test_run_batch_parquet(tmp_path):
+    inputs = [EXAMPLES_DIR + "1d8g.cif", EXAMPLES_DIR + "3p4j.cif"]
+    assert run_batch(inputs, str(tmp_path / "merged"), merged=True, table_format=PARQUET_FORMAT) == 0
+    assert run_batch(inputs, str(tmp_path / "single"), table_format=PARQUET_FORMAT) == 0
+
+    merged = read_arrow_table(str(tmp_path / "merged" / "bonds.parquet"))
+    single = [read_arrow_table(str(tmp_path / "single" / f"{entry}_bonds.parquet")) for entry in ("1d8g", "3p4j")]
+    assert merged.num_rows == sum(table.num_rows for table in single)
+    assert sorted(merged.column("pdbcode").unique().to_pylist()) == ["1d8g", "3p4j"]
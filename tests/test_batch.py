@@ -0,0 +1,67 @@
+import os
+import shutil
+
+import pytest
+
+from naval.batch import (
+    SQLITE_FORMAT,
+    collect_inputs,
+    duplicate_entry_names,
+    entry_name,
+    run_batch,
+)
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+def count_lines(file_path):
+    with open(file_path, "r", encoding="utf-8") as handle:
+        return sum(1 for _ in handle)
+
+
+def test_entry_name():
+    assert entry_name("/data/1abc.cif.gz") == "1abc"
+    assert entry_name("1abc.pdb") == "1abc"
+
+
+def test_collect_inputs(tmp_path):
+    for filename in ("1d8g.cif", "427d.pdb", "3p4j.pdb"):
+        shutil.copy(EXAMPLES_DIR + filename, str(tmp_path / filename))
+    (tmp_path / "notes.txt").write_text("not a structure")
+    manifest_path = tmp_path / "manifest.lst"
+    manifest_path.write_text("# structures\n427d.pdb\n\n1d8g.cif\n")
+
+    assert collect_inputs([str(tmp_path)]) == [str(tmp_path / name) for name in ("1d8g.cif", "3p4j.pdb", "427d.pdb")]
+    assert collect_inputs([str(tmp_path / "*.pdb")]) == [str(tmp_path / name) for name in ("3p4j.pdb", "427d.pdb")]
+    assert collect_inputs([str(manifest_path)]) == [str(tmp_path / name) for name in ("427d.pdb", "1d8g.cif")]
+
+
+def test_run_batch(tmp_path):
+    inputs = [EXAMPLES_DIR + filename for filename in ("1d8g.cif", "427d.pdb", "3p4j.pdb")]
+
+    assert run_batch(inputs, str(tmp_path / "entries"), processes=2) == 0
+    for name in ("1d8g", "427d", "3p4j"):
+        for output in ("bonds", "angles", "geometry"):
+            assert os.path.exists(str(tmp_path / "entries" / f"{name}_{output}.csv"))
+
+    assert run_batch(inputs + [EXAMPLES_DIR + "missing.pdb"], str(tmp_path / "merged"), processes=2, merged=True) == 1
+    for output in ("bonds", "angles", "geometry"):
+        entries_lines = sum(count_lines(str(tmp_path / "entries" / f"{name}_{output}.csv")) - 1 for name in ("1d8g", "427d", "3p4j"))
+        assert count_lines(str(tmp_path / "merged" / f"{output}.csv")) == entries_lines + 1
+
+
+def test_run_batch_duplicate_entry_names(tmp_path):
+    os.makedirs(str(tmp_path / "other"))
+    shutil.copy(EXAMPLES_DIR + "1d8g.cif", str(tmp_path / "other" / "1d8g.cif"))
+    inputs = [EXAMPLES_DIR + "1d8g.cif", str(tmp_path / "other" / "1d8g.cif"), EXAMPLES_DIR + "427d.pdb"]
+    assert duplicate_entry_names(inputs) == ["1d8g"]
+    assert not duplicate_entry_names(inputs[1:])
+
+    with pytest.raises(ValueError):
+        run_batch(inputs, str(tmp_path / "entries"))
+    # sqlite rows are replaced by the entry name
+    with pytest.raises(ValueError):
+        run_batch(inputs, str(tmp_path / "entries"), merged=True, table_format=SQLITE_FORMAT)
+    assert not os.path.exists(str(tmp_path / "entries"))
+    # merged outputs do not depend on entry names
+    assert run_batch(inputs, str(tmp_path / "merged"), merged=True) == 0
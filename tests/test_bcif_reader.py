@@ -0,0 +1,135 @@
+import os
+
+import numpy as np
+import pytest
+
+from naval.readers.bcif_reader import decode_data, read_bcif_atom_table
+from naval.readers.mmcif_reader import read_atom_site_columns, read_mmcif_atom_table
+from naval.validate import read_structure
+from tests.test_readers import validation_lines
+
+msgpack = pytest.importorskip("msgpack")
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+INT_COLUMNS = ("id", "label_entity_id", "auth_seq_id", "pdbx_PDB_model_num")
+FLOAT_COLUMNS = ("Cartn_x", "Cartn_y", "Cartn_z", "occupancy", "B_iso_or_equiv")
+
+
+def encode_byte_array(values, type_code, dtype):
+    return np.asarray(values, dtype=dtype).tobytes(), [{"kind": "ByteArray", "type": type_code}]
+
+
+def encode_integer_packing(values):
+    packed = []
+    for value in values.tolist():
+        while value >= 127:
+            packed.append(127)
+            value -= 127
+        while value <= -128:
+            packed.append(-128)
+            value += 128
+        packed.append(value)
+    data, encoding = encode_byte_array(packed, 1, "<i1")
+    return data, [{"kind": "IntegerPacking", "byteCount": 1, "isUnsigned": False, "srcSize": len(values)}] + encoding
+
+
+def encode_run_length(values):
+    values = np.asarray(values, dtype=np.int64)
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+    counts = np.diff(np.append(starts, len(values)))
+    pairs = np.stack([values[starts], counts], axis=1).ravel()
+    return pairs, {"kind": "RunLength", "srcType": 3, "srcSize": len(values)}
+
+
+def encode_integers(values):
+    values = np.asarray(values, dtype=np.int64)
+    delta_encoding = {"kind": "Delta", "origin": int(values[0]), "srcType": 3}
+    pairs, run_length_encoding = encode_run_length(np.concatenate(([0], np.diff(values))))
+    data, encoding = encode_integer_packing(pairs)
+    return {"data": data, "encoding": [delta_encoding, run_length_encoding] + encoding}
+
+
+def encode_floats(values, factor=1000):
+    encoded = encode_integers(np.round(np.asarray(values, dtype=np.float64) * factor).astype(np.int64))
+    encoded["encoding"] = [{"kind": "FixedPoint", "factor": factor, "srcType": 33}] + encoded["encoding"]
+    return encoded
+
+
+def encode_strings(values):
+    strings = sorted(set(values.tolist()) - {".", "?"})
+    lookup = {string: i for i, string in enumerate(strings)}
+    indices = np.array([lookup.get(value, -1) for value in values.tolist()])
+    offsets = np.cumsum([0] + [len(string) for string in strings])
+    offsets_data, offset_encoding = encode_byte_array(offsets, 3, "<i4")
+    data, data_encoding = encode_byte_array(indices, 3, "<i4")
+    encoding = {
+        "kind": "StringArray",
+        "dataEncoding": data_encoding,
+        "stringData": "".join(strings),
+        "offsetEncoding": offset_encoding,
+        "offsets": offsets_data,
+    }
+    return {"data": data, "encoding": [encoding]}
+
+
+def encode_mask(values):
+    mask = np.where(values == ".", 1, np.where(values == "?", 2, 0))
+    if not mask.any():
+        return None
+    pairs, run_length_encoding = encode_run_length(mask)
+    data, encoding = encode_byte_array(pairs, 3, "<i4")
+    return {"data": data, "encoding": [run_length_encoding] + encoding}
+
+
+def encode_bcif(cif_path):
+    with open(cif_path, "r", encoding="utf-8") as handle:
+        columns = read_atom_site_columns(handle.read())
+
+    encoded_columns = []
+    for name, values in columns.items():
+        if name in INT_COLUMNS:
+            encoded_columns.append({"name": name, "data": encode_integers(values.astype(np.int64)), "mask": None})
+        elif name in FLOAT_COLUMNS:
+            encoded_columns.append({"name": name, "data": encode_floats(values.astype(np.float64)), "mask": None})
+        else:
+            encoded_columns.append({"name": name, "data": encode_strings(values), "mask": encode_mask(values)})
+
+    category = {"name": "_atom_site", "rowCount": len(columns["id"]), "columns": encoded_columns}
+    return msgpack.packb({"version": "0.3.0", "encoder": "test", "dataBlocks": [{"header": "TEST", "categories": [category]}]})
+
+
+def test_decode_integer_packing_and_delta():
+    data, encoding = encode_integer_packing(np.array([0, 300, -200, 5]))
+    assert decode_data(data, encoding).tolist() == [0, 300, -200, 5]
+
+    encoded = encode_integers(np.array([10, 11, 12, 13, 20, 20, 20]))
+    assert decode_data(encoded["data"], encoded["encoding"]).tolist() == [10, 11, 12, 13, 20, 20, 20]
+
+
+def test_decode_interval_quantization():
+    data, encoding = encode_byte_array([0, 1, 2, 4], 4, "<u1")
+    encoding = [{"kind": "IntervalQuantization", "min": 1.0, "max": 2.0, "numSteps": 5, "srcType": 32}] + encoding
+    assert decode_data(data, encoding).tolist() == [1.0, 1.25, 1.5, 2.0]
+
+
+def test_bcif_reader_same_results(tmp_path):
+    for filename in ("1d8g.cif", "6bel.cif"):
+        bcif_path = str(tmp_path / filename.replace(".cif", ".bcif"))
+        with open(bcif_path, "wb") as handle:
+            handle.write(encode_bcif(EXAMPLES_DIR + filename))
+
+        structure = read_structure(EXAMPLES_DIR + filename)
+        bcif_structure = read_structure(bcif_path)
+        assert bcif_structure.id == structure.id
+        assert validation_lines(bcif_structure) == validation_lines(structure)
+
+
+def test_read_independently_encoded_bcif():
+    # 1d8g.bcif was written by the RCSB py-mmcif BinaryCifWriter, not by the encoder of these tests
+    bcif_table = read_bcif_atom_table(EXAMPLES_DIR + "1d8g.bcif")
+    mmcif_table = read_mmcif_atom_table(EXAMPLES_DIR + "1d8g.cif")
+    for column in mmcif_table.__slots__:
+        assert getattr(bcif_table, column).tolist() == getattr(mmcif_table, column).tolist(), column
+
+    assert validation_lines(read_structure(EXAMPLES_DIR + "1d8g.bcif")) == validation_lines(read_structure(EXAMPLES_DIR + "1d8g.cif"))
@@ -0,0 +1,124 @@
+import os
+
+import numpy as np
+import pytest
+from Bio.PDB.Atom import Atom
+from Bio.PDB.vectors import Vector, calc_angle, calc_dihedral
+
+from naval.geometry_engine import (
+    bond_angles,
+    bond_lengths,
+    calculate_torsions,
+    classify_alpha_conformation,
+    classify_chi_conformation,
+    classify_conformations,
+    classify_gamma_conformation,
+    classify_sugar_conformation,
+    dihedral_angles,
+    pseudorotation_with_sd,
+    torsion_values,
+)
+from naval.nucleotide_geometry import NucleotideGeometry
+from naval.validate import fill_residue_cache, link_residues, read_structure
+
+
+def test_dihedral_angles():
+    rng = np.random.default_rng(7)
+    coords = rng.uniform(-20.0, 20.0, (200, 4, 3)).astype(np.float32)
+    # planar cis and trans, collinear atoms
+    coords[0] = [[1, 1, 0], [0, 0, 0], [1, 0, 0], [2, 1, 0]]
+    coords[1] = [[1, 1, 0], [0, 0, 0], [1, 0, 0], [2, -1, 0]]
+    coords[2] = [[0, 0, 0], [1, 0, 0], [2, 0, 0], [2, 1, 0]]
+
+    with np.errstate(invalid="ignore"):
+        expected = [round(np.rad2deg(calc_dihedral(*[Vector(*atom) for atom in torsion])), 1) for torsion in coords]
+    angles = dihedral_angles(coords)
+
+    assert angles[0] == 0.0
+    assert abs(angles[1]) == 180.0
+    assert np.array_equal(angles, np.array(expected), equal_nan=True)
+
+
+def test_bond_lengths():
+    rng = np.random.default_rng(11)
+    coords = rng.uniform(-100.0, 100.0, (1000, 2, 3)).astype(np.float32)
+    coords[:, 1] = coords[:, 0] + rng.uniform(-2.0, 2.0, (1000, 3)).astype(np.float32)
+
+    atoms = [[Atom("C", coord, 10, 1.0, " ", "C", i, "C") for coord in bond] for i, bond in enumerate(coords)]
+    expected = [round(atom2 - atom1, 3) for atom1, atom2 in atoms]
+    lengths = bond_lengths(coords)
+
+    assert lengths.dtype == np.float32
+    assert np.array_equal(lengths, np.array(expected, dtype=np.float32))
+
+
+def test_bond_angles():
+    rng = np.random.default_rng(13)
+    coords = rng.uniform(-20.0, 20.0, (500, 3, 3)).astype(np.float32)
+    # straight angle and atoms at the same position
+    coords[0] = [[0, 0, 0], [1, 0, 0], [2, 0, 0]]
+    coords[1] = [[1, 0, 0], [1, 0, 0], [2, 0, 0]]
+
+    with np.errstate(invalid="ignore"):
+        expected = [np.round(np.rad2deg(calc_angle(*[Vector(*atom) for atom in angle])), 1) for angle in coords]
+    angles = bond_angles(coords)
+
+    assert angles[0] == 180.0
+    assert np.array_equal(angles, np.array(expected))
+
+
+def test_calculate_torsions():
+    struct = read_structure(os.path.dirname(__file__) + "/examples/1d8g.cif")
+    residue_cache = link_residues(fill_residue_cache(struct, struct.id))
+    geometries = [NucleotideGeometry(residue_entry) for residue_entry in residue_cache if residue_entry.is_nucleotide()]
+    calculate_torsions(geometries)
+
+    for geometry in geometries:
+        expected = NucleotideGeometry(geometry.residue_entry)
+        expected.calculate_conformation()
+        for torsion_name, _, _ in geometry.torsion_definitions():
+            assert getattr(geometry, torsion_name) == getattr(expected, torsion_name)
+    # first residue has no previous residue, alternative conformations are kept
+    assert geometries[0].alpha == {"": None}
+    assert any(len(geometry.delta) > 1 for geometry in geometries)
+
+
+def test_pseudorotation_with_sd():
+    thetas = np.array([[1.5, -24.3, 36.9, -37.2, 22.6], [-31.2, 38.4, -31.0, 14.7, 10.3]])
+    pseudorotations, sd_pseudorotations, tau_maxs, sd_tau_maxs = pseudorotation_with_sd(thetas)
+
+    # the values of NucleotideGeometry.calculate_pseudorotation for the same thetas
+    assert pseudorotations.tolist() == [16.4, 146.4]
+    assert tau_maxs.tolist() == [39.2, 38.6]
+    assert sd_pseudorotations.tolist() == pytest.approx([0.5551, 1.0575], abs=1e-4)
+    assert sd_tau_maxs.tolist() == pytest.approx([0.3801, 0.7127], abs=1e-4)
+
+
+def test_classify_conformation():
+    angles = torsion_values([None, 0.0, float("nan"), 60.0, -60.0, 180.0, -120.0, 120.0])
+
+    assert classify_alpha_conformation(angles).tolist() == ["undefined", "undefined", "other", "sc+", "sc-", "ap", "other", "ap"]
+    assert classify_gamma_conformation(angles).tolist() == ["undefined", "undefined", "other", "gauche+", "gauche-", "trans", "other", "other"]
+    assert classify_chi_conformation(angles).tolist() == ["undefined", "undefined", "anti", "syn", "syn", "anti", "anti", "anti"]
+    assert classify_sugar_conformation(torsion_values([None, 18.0, 160.0, 90.0])).tolist() == ["undefined", "C3'-endo", "C2'-endo", "other"]
+
+
+def test_classify_conformations():
+    struct = read_structure(os.path.dirname(__file__) + "/examples/1d8g.cif")
+    residue_cache = link_residues(fill_residue_cache(struct, struct.id))
+    geometries = calculate_torsions([NucleotideGeometry(residue_entry) for residue_entry in residue_cache if residue_entry.is_nucleotide()])
+    classify_conformations(geometries)
+
+    for geometry in geometries:
+        expected = NucleotideGeometry(geometry.residue_entry)
+        expected.calculate_conformation()
+        for name in (
+            "alpha_conformation",
+            "gamma_conformation",
+            "zeta_conformation",
+            "chi_conformation",
+            "pseudorotation",
+            "tau_max",
+            "sugar_conformation",
+        ):
+            assert getattr(geometry, name) == getattr(expected, name)
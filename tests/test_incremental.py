@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import pytest
+
+from naval.incremental import ValidationSession
+from naval.printer import AnglesCsvPrinter, BondsCsvPrinter, GeometryCsvPrinter
+from naval.validate import read_structure, residue_links, validate_structure
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+def session_lines(session):
+    table = session.validation_table()
+    return BondsCsvPrinter.print(table), AnglesCsvPrinter.print(table), GeometryCsvPrinter.print(session.geometry_records())
+
+
+def full_validation_lines(session):
+    table, geometry_records = validate_structure(session.structure)
+    return BondsCsvPrinter.print(table), AnglesCsvPrinter.print(table), GeometryCsvPrinter.print(geometry_records)
+
+
+def test_validation_session_update():
+    session = ValidationSession(read_structure(EXAMPLES_DIR + "5hr7.pdb"))
+    assert session_lines(session) == full_validation_lines(session)
+    assert session.coords.shape == (len(session.atoms), 3)
+
+    nucleotides = [i for i, residue_entry in enumerate(session.residue_cache) if residue_entry.is_nucleotide()]
+    moved_residue = nucleotides[len(nucleotides) // 2]
+    coords = session.coords.copy()
+    coords[session.atom_residues == moved_residue] += np.array([0.3, -0.2, 0.1], dtype=np.float32)
+    # the phosphorus moves relative to the rest of the nucleotide
+    phosphorus = [i for i, atom in enumerate(session.atoms) if session.atom_residues[i] == moved_residue and atom.get_name() == "P"]
+    coords[phosphorus] += 0.2
+
+    diff = session.update(coords)
+    assert len(diff) > 0
+    assert session_lines(session) == full_validation_lines(session)
+
+    # the moved residue and up to two linked residues on each side
+    nearby = {id(session.residue_cache[i]) for i in session.linked_residues(session.linked_residues([moved_residue]))}
+    assert len(nearby) <= 5
+    for previous, updated in diff.changed:
+        assert id(updated.geometry.residue_entry) in nearby
+        assert previous.calculated_value != updated.calculated_value or previous.label != updated.label or previous.name != updated.name
+    assert any(record.validation_type == "bond" for _, record in diff.changed)
+    assert any(record.validation_type == "torsion" for _, record in diff.changed)
+
+    # nothing moved
+    assert len(session.update(coords)) == 0
+
+    with pytest.raises(ValueError):
+        session.update(coords[:-1])
+
+
+def test_validation_session_moved_atom():
+    session = ValidationSession(read_structure(EXAMPLES_DIR + "1d8g.cif"))
+    atom = next(atom for atom in session.atoms if atom.get_name() == "C4'")
+    atom.set_coord(atom.get_coord() + np.array([0.5, 0.0, 0.0], dtype=np.float32))
+
+    diff = session.update()
+    assert diff.changed
+    assert not diff.added and not diff.removed
+    assert session_lines(session) == full_validation_lines(session)
+
+
+def test_validation_session_links():
+    session = ValidationSession(read_structure(EXAMPLES_DIR + "5ckk.pdb"))
+    links = residue_links(session.residue_cache)
+    noise = np.random.default_rng(0).normal(scale=0.3, size=session.coords.shape).astype(np.float32)
+
+    # the noise breaks and forms O3'-P links
+    diff = session.update(session.coords + noise)
+    assert diff.linked or diff.unlinked
+    updated_links = {tuple(link) for link in residue_links(session.residue_cache).tolist()}
+    assert {(id(prev_res), id(next_res)) for prev_res, next_res in diff.unlinked} == {
+        (id(session.residue_cache[i]), id(session.residue_cache[j])) for i, j in links.tolist() if (i, j) not in updated_links
+    }
+    assert session_lines(session) == full_validation_lines(session)
+
+    diff = session.update(session.coords - noise)
+    assert np.array_equal(residue_links(session.residue_cache), links)
+    assert session_lines(session) == full_validation_lines(session)
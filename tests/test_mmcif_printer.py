@@ -0,0 +1,66 @@
+import os
+
+from Bio.PDB.MMCIF2Dict import MMCIF2Dict
+
+from naval.batch import MMCIF_FORMAT, run_batch
+from naval.mmcif_printer import cif_value, write_mmcif
+from naval.validate import read_structure
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+def test_cif_value():
+    assert cif_value("N1") == "N1"
+    assert cif_value(12) == "12"
+    assert cif_value("") == "."
+    assert cif_value(None) == "."
+    assert cif_value(".") == "'.'"
+    assert cif_value("O3'") == "O3'"
+    assert cif_value("_name") == "'_name'"
+    assert cif_value("two words") == "'two words'"
+    assert cif_value("it's a value") == '"it\'s a value"'
+
+
+def test_write_mmcif_sidecar(tmp_path, validate_example):
+    structure, validation_table, geometry_records = validate_example("5hr7.pdb")
+    out_path = str(tmp_path / "5hr7_naval.cif")
+    with open(out_path, "w", encoding="utf-8") as out_file:
+        write_mmcif(out_file, structure.id, validation_table, geometry_records)
+
+    mmcif_dict = MMCIF2Dict(out_path)
+    bonds = validation_table.bonds()
+    angles = validation_table.angles()
+    assert len(mmcif_dict["_naval_bond.id"]) == len(bonds)
+    assert len(mmcif_dict["_naval_angle.id"]) == len(angles)
+    assert len(mmcif_dict["_naval_torsion.id"]) == len(geometry_records)
+    assert mmcif_dict["_naval_bond.atom_site_id_1"][0] == str(bonds[0].atom1.get_serial_number())
+    assert mmcif_dict["_naval_angle.atom_site_id_3"][-1] == str(angles[-1].atom3.get_serial_number())
+    assert mmcif_dict["_naval_angle.validation_label"] == [record.label for record in angles]
+    assert mmcif_dict["_naval_torsion.name"] == [record.name for record in geometry_records]
+
+
+def test_write_mmcif_embedded_structure(tmp_path, validate_example):
+    structure, validation_table, geometry_records = validate_example("1d8g.cif")
+    out_path = str(tmp_path / "1d8g_naval.cif")
+    with open(out_path, "w", encoding="utf-8") as out_file:
+        write_mmcif(out_file, structure.id, validation_table, geometry_records, EXAMPLES_DIR + "1d8g.cif")
+
+    mmcif_dict = MMCIF2Dict(out_path)
+    atom_names = dict(zip(mmcif_dict["_atom_site.id"], mmcif_dict["_atom_site.label_atom_id"]))
+    for atom_site_id, record in zip(mmcif_dict["_naval_bond.atom_site_id_2"], validation_table.bonds()):
+        assert atom_names[atom_site_id] == record.atom2.get_name()
+    # the structure is still readable from the output file
+    embedded = read_structure(out_path)
+    assert len(list(embedded.get_atoms())) == len(list(structure.get_atoms()))
+
+
+def test_run_batch_mmcif(tmp_path):
+    inputs = [EXAMPLES_DIR + "1d8g.cif", EXAMPLES_DIR + "5hr7.pdb"]
+    assert run_batch(inputs, str(tmp_path / "single"), table_format=MMCIF_FORMAT) == 0
+    assert run_batch(inputs, str(tmp_path / "merged"), merged=True, table_format=MMCIF_FORMAT) == 0
+
+    assert sorted(os.listdir(tmp_path / "single")) == ["1d8g_naval.cif", "5hr7_naval.cif"]
+    merged = (tmp_path / "merged" / "naval.cif").read_text(encoding="utf-8")
+    single = [(tmp_path / "single" / name).read_text(encoding="utf-8") for name in ("1d8g_naval.cif", "5hr7_naval.cif")]
+    assert merged == "".join(single)
+    assert merged.count("data_") == 2
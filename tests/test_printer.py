@@ -1,10 +1,16 @@
+import io
 from unittest.mock import Mock
 
 from Bio.PDB.Atom import Atom
 from Bio.PDB.Residue import Residue
 
 from naval.nucleotide_geometry import NucleotideGeometry
-from naval.printer import AnglesCsvPrinter, BondsCsvPrinter, GeometryCsvPrinter
+from naval.printer import (
+    AnglesCsvPrinter,
+    BondsCsvPrinter,
+    GeometryCsvPrinter,
+    write_validation_records,
+)
 from naval.residue_cache_entry import ResidueCacheEntry
 from naval.validation_record import TorsionRecord, ValidationRecord
 
@@ -62,3 +68,18 @@ def test_geometry_csv_printer():
     lines = printer.print(records)
     assert len(lines) == 1 + 1
     assert "torsion" in lines[1]
+
+
+def test_write_validation_records():
+    records = prepare_validation_records() * 3
+    bonds_file = io.StringIO()
+    angles_file = io.StringIO()
+
+    write_validation_records(iter(records), bonds_file, angles_file)
+    assert bonds_file.getvalue() == "\n".join(BondsCsvPrinter.print(records)) + "\n"
+    assert angles_file.getvalue() == "\n".join(AnglesCsvPrinter.print(records)) + "\n"
+
+    torsion_records = prepare_torsion_records()
+    geometry_file = io.StringIO()
+    GeometryCsvPrinter.write(torsion_records, geometry_file)
+    assert geometry_file.getvalue().splitlines() == GeometryCsvPrinter.print(torsion_records)
@@ -0,0 +1,155 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+from naval.printer import AnglesCsvPrinter, BondsCsvPrinter, GeometryCsvPrinter
+from naval.readers.compressed import split_compression_extension
+from naval.readers.mmcif_reader import read_atom_site_columns, read_mmcif_atom_table
+from naval.readers.pdb_reader import read_pdb_atom_table
+from naval.validate import read_structure, selected_res_names, validate_structure
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+def validation_lines(structure, links=None):
+    records, geometry = validate_structure(structure, links)
+    return BondsCsvPrinter.print(records), AnglesCsvPrinter.print(records), GeometryCsvPrinter.print(geometry)
+
+
+def test_read_atom_site_columns_quoted_values():
+    text = (
+        "data_test\n"
+        "loop_\n"
+        "_atom_site.group_PDB\n"
+        "_atom_site.label_atom_id\n"
+        "_atom_site.Cartn_x\n"
+        'ATOM "O5\'" 1.000\n'
+        "ATOM 'C5' 2.000\n"
+        "ATOM P 3.000\n"
+        "#\n"
+    )
+    columns = read_atom_site_columns(text)
+    assert columns["label_atom_id"].tolist() == ["O5'", "C5", "P"]
+    assert columns["Cartn_x"].tolist() == ["1.000", "2.000", "3.000"]
+
+
+def test_read_atom_site_columns_selected_residues():
+    with open(EXAMPLES_DIR + "6bel.cif", "r", encoding="utf-8") as handle:
+        text = handle.read()
+    all_columns = read_atom_site_columns(text)
+    columns = read_atom_site_columns(text, selected_res_names(True))
+
+    selected = np.isin(all_columns["label_comp_id"], selected_res_names(True))
+    assert 0 < len(columns["label_comp_id"]) < len(all_columns["label_comp_id"])
+    for header, column in columns.items():
+        assert column.tolist() == all_columns[header][selected].tolist()
+
+
+def test_read_mmcif_atom_table():
+    with open(EXAMPLES_DIR + "1d8g.cif", "r", encoding="utf-8") as handle:
+        table = read_mmcif_atom_table(io.StringIO(handle.read()))
+    structure = read_structure(EXAMPLES_DIR + "1d8g.cif")
+
+    atoms = list(structure.get_atoms())
+    assert len(table) >= len(atoms)
+    assert table.xyz.dtype == np.float32
+    assert set(table.altloc.tolist()) == {" ", "A", "B"}
+
+
+def test_fast_mmcif_reader_same_results():
+    for filename in ("1d8g.cif", "3ssf.cif", "6bel.cif"):
+        structure = read_structure(EXAMPLES_DIR + filename)
+        fast_structure = read_structure(EXAMPLES_DIR + filename, fast_reader=True)
+        assert fast_structure.id == structure.id
+        assert validation_lines(fast_structure) == validation_lines(structure)
+
+
+def pdb_atom_line(record, serial, name, altloc, res_name, resseq, inscode, xyz, element):
+    # pylint: disable=too-many-arguments
+    return (
+        f"{record:<6}{serial:>5} {name:<4}{altloc}{res_name:>3} A{resseq:>4}{inscode}   "
+        f"{xyz[0]:>8.3f}{xyz[1]:>8.3f}{xyz[2]:>8.3f}  1.00 10.00          {element:>2}"
+    )
+
+
+def test_read_pdb_atom_table():
+    lines = [
+        "HEADER    TEST",
+        "MODEL        2",
+        pdb_atom_line("ATOM", 1, " P", " ", "DC", 1, " ", (36.598, 2.473, -5.743), "P"),
+        pdb_atom_line("ATOM", 2, " O5'", "A", "DC", 1, "A", (37.407, 3.169, -6.693), "O"),
+        pdb_atom_line("HETATM", 3, " O", " ", "HOH", 101, " ", (1.0, 2.0, 3.0), "").rstrip(),
+        "ENDMDL",
+        "END",
+        pdb_atom_line("ATOM", 4, " P", " ", "DC", 2, " ", (0.0, 0.0, 0.0), "P"),
+    ]
+    table = read_pdb_atom_table("\r\n".join(lines).encode("ascii"))
+    assert len(table) == 3
+    assert table.name.tolist() == ["P", "O5'", "O"]
+    assert table.altloc.tolist() == [" ", "A", " "]
+    assert table.inscode.tolist() == [" ", "A", " "]
+    assert table.hetero.tolist() == [" ", " ", "W"]
+    assert table.model.tolist() == [2, 2, 2]
+    assert table.element.tolist() == ["P", "O", ""]
+    assert np.allclose(table.xyz[1], (37.407, 3.169, -6.693))
+
+
+def test_fast_pdb_reader_same_results():
+    for filename in ("1d8g.pdb", "5hr7.pdb"):
+        structure = read_structure(EXAMPLES_DIR + filename)
+        fast_structure = read_structure(EXAMPLES_DIR + filename, fast_reader=True)
+        assert validation_lines(fast_structure) == validation_lines(structure)
+
+
+def test_nucleotides_only_reader():
+    structure = read_structure(EXAMPLES_DIR + "5hr7.pdb", res_names=selected_res_names(True))
+    assert {residue.get_resname() for residue in structure.get_residues()} == {"A", "C", "G", "U"}
+
+    structure = read_structure(EXAMPLES_DIR + "6bel.cif", res_names=selected_res_names(True, ["2DA"]))
+    assert {residue.get_resname() for residue in structure.get_residues()} == {"DA", "DC", "DG", "DT", "2DA"}
+
+
+def test_nucleotides_only_warns_dropped_nucleotides():
+    with pytest.warns(UserWarning, match="G49"):
+        read_structure(EXAMPLES_DIR + "427d.pdb", res_names=selected_res_names(True))
+    with pytest.warns(UserWarning, match="2DA,F3C"):
+        read_structure(EXAMPLES_DIR + "6bel.cif", res_names=selected_res_names(True))
+
+    # water and the drug (DM1) have no backbone link atoms
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        read_structure(EXAMPLES_DIR + "427d.pdb", res_names=selected_res_names(True, ["G49"]))
+
+
+def test_nucleotides_only_same_results():
+    for filename, modified_nucleotides in (("5hr7.pdb", ()), ("427d.pdb", ("G49", "DM1")), ("6bel.cif", ("2DA",))):
+        structure = read_structure(EXAMPLES_DIR + filename)
+        nucleotide_structure = read_structure(EXAMPLES_DIR + filename, res_names=selected_res_names(True, modified_nucleotides))
+        assert validation_lines(nucleotide_structure) == validation_lines(structure)
+
+
+def test_compressed_input(tmp_path):
+    expected = {filename: validation_lines(read_structure(EXAMPLES_DIR + filename)) for filename in ("1d8g.cif", "1d8g.pdb")}
+
+    for filename, lines in expected.items():
+        with open(EXAMPLES_DIR + filename, "rb") as handle:
+            content = handle.read()
+        for extension, compress in ((".gz", gzip.compress), (".bz2", bz2.compress), (".xz", lzma.compress)):
+            compressed_path = str(tmp_path / (filename + extension))
+            with open(compressed_path, "wb") as handle:
+                handle.write(compress(content))
+
+            assert validation_lines(read_structure(compressed_path)) == lines
+            assert validation_lines(read_structure(compressed_path, fast_reader=True)) == lines
+
+
+def test_split_compression_extension():
+    assert split_compression_extension("/data/1abc.cif.gz") == ("/data/1abc.cif", ".gz")
+    assert split_compression_extension("1abc.pdb.XZ") == ("1abc.pdb", ".xz")
+    assert split_compression_extension("1abc.pdb") == ("1abc.pdb", "")
@@ -0,0 +1,81 @@
+import copy
+import os
+
+import numpy as np
+import pytest
+
+from naval import restraint_library
+from naval.restraint_index import RESTRAINT_INDEX
+from naval.restraint_library import (
+    restraint_tables,
+    use_restraint_library,
+    write_restraint_library,
+)
+from naval.validate import read_structure, validate_structure
+from naval.validators import po4_validator
+from naval.validators.bases_validator import bases_restraint_tables
+from naval.validators.po4_validator import Po4Validator
+
+
+def test_restraint_tables():
+    assert isinstance(restraint_library.restraint_library(), np.memmap)
+
+    # restraint tables of the validator modules are loaded on the first use
+    assert po4_validator.PO4_BONDS is restraint_tables("PO4_BONDS")
+    po4_bonds = restraint_tables("PO4_BONDS")
+    assert [definition.name for definition in po4_bonds["PO4==AA_0"]] == ["PO4==AA_0"] * 6
+    assert (po4_bonds["PO4==AA_0"][2].atom1_name, po4_bonds["PO4==AA_0"][2].atom1_relative_res_position) == ("O3'", -1)
+    assert po4_bonds["PO4==AA_0"][0].pdb_count == 272507
+    bases_bonds = bases_restraint_tables("BASES_BONDS")
+    assert bases_bonds["DA"] is bases_bonds["A"]
+    # the aliases are not added to the library tables (and written to the library file)
+    assert "DA" not in restraint_tables("BASES_BONDS")
+    assert restraint_tables("SUGAR_PUCER_BASED_SUGAR_ANGLES")["pucker==A_G_C2p_endo"][0].atom3_name
+
+    with pytest.raises(KeyError):
+        restraint_tables("MISSING")
+
+
+def test_use_restraint_library(tmp_path):
+    struct = read_structure(os.path.dirname(__file__) + "/examples/1d8g.pdb")
+    records, _ = validate_structure(struct)
+
+    libraries = {
+        name: restraint_tables(name)
+        for name in (
+            "PO4_BONDS",
+            "PO4_ANGLES",
+            "BASES_BONDS",
+            "BASES_ANGLES",
+            "BASIC_SUGAR_BONDS",
+            "BASIC_SUGAR_ANGLES",
+            "SUGAR_PUCER_BASED_SUGAR_BONDS",
+            "SUGAR_PUCER_BASED_SUGAR_ANGLES",
+        )
+    }
+    libraries["PO4_BONDS"] = {table: [copy.copy(definition) for definition in definitions] for table, definitions in libraries["PO4_BONDS"].items()}
+    for definitions in libraries["PO4_BONDS"].values():
+        for definition in definitions:
+            definition.csd_target = 1.5
+    path = str(tmp_path / "restraints.npy")
+    write_restraint_library(path, libraries)
+    fingerprint = restraint_library.restraint_library_fingerprint()
+
+    try:
+        use_restraint_library(path)
+        assert not RESTRAINT_INDEX.validators
+        assert restraint_library.restraint_library_path() == path
+        assert restraint_library.restraint_library_fingerprint() != fingerprint
+        updated_records, _ = validate_structure(struct)
+    finally:
+        use_restraint_library()
+    assert restraint_library.restraint_library_fingerprint() == fingerprint
+
+    po4_names = {definition.name for definitions in restraint_tables("PO4_BONDS").values() for definition in definitions}
+    assert any(record.name in po4_names for record in updated_records)
+    for record, updated_record in zip(records, updated_records):
+        if record.validation_type == "bond" and record.name in po4_names:
+            assert updated_record.target_value == 1.5
+        else:
+            assert updated_record.target_value == record.target_value
+    assert Po4Validator.compiled_restraint_index().bond("po4", "A_G", "other", "OP1", "P").csd_target != 1.5
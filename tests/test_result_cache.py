@@ -0,0 +1,99 @@
+import os
+import shutil
+
+import pytest
+
+import naval.batch
+import naval.result_cache
+from naval.arrow_printer import PARQUET_FORMAT
+from naval.batch import SQLITE_FORMAT, validate_entry
+from naval.printer import (
+    AnglesCsvPrinter,
+    BondsCsvPrinter,
+    GeometryCsvPrinter,
+    lines_from_fields,
+    record_fields,
+    typed_rows,
+    typed_rows_from_fields,
+)
+from naval.result_cache import MMCIF_OUTPUTS, ResultCache
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+def test_record_fields(validate_example):
+    structure, validation_table, geometry_records = validate_example("5hr7.pdb")
+
+    for printer, records in ((BondsCsvPrinter, validation_table), (AnglesCsvPrinter, validation_table), (GeometryCsvPrinter, geometry_records)):
+        fields = list(record_fields(printer, records))
+        assert list(lines_from_fields(printer, fields)) == printer.print(records)
+        assert list(typed_rows_from_fields(printer, fields)) == list(typed_rows(printer, records))
+
+    # fields are not split on commas in the values
+    chain = next(iter(structure[0]))
+    chain.id = "A,B"
+    fields = list(record_fields(GeometryCsvPrinter, geometry_records))
+    assert list(typed_rows_from_fields(GeometryCsvPrinter, fields)) == list(typed_rows(GeometryCsvPrinter, geometry_records))
+    assert any(row[3] == "A,B" for row in typed_rows_from_fields(GeometryCsvPrinter, fields))
+
+
+def test_result_cache_key(tmp_path, monkeypatch):
+    structure_path = str(tmp_path / "1d8g.cif")
+    shutil.copy(EXAMPLES_DIR + "1d8g.cif", structure_path)
+    key = ResultCache.key(structure_path)
+
+    assert ResultCache.key(structure_path) == key
+    assert ResultCache.key(structure_path, ("A", "G")) != key
+    assert ResultCache.key(structure_path, output_kind=MMCIF_OUTPUTS) != key
+    assert ResultCache.key(structure_path, fast_reader=True) != key
+
+    # the file content changed
+    with open(structure_path, "a", encoding="utf-8") as structure_file:
+        structure_file.write("#\n")
+    changed_key = ResultCache.key(structure_path)
+    assert changed_key != key
+
+    monkeypatch.setattr(naval.result_cache, "VERSION", "0.0.0")
+    assert ResultCache.key(structure_path) != changed_key
+    monkeypatch.undo()
+    monkeypatch.setattr(naval.result_cache, "restraint_library_fingerprint", lambda: "updated")
+    assert ResultCache.key(structure_path) != changed_key
+
+
+def test_result_cache_batch(tmp_path, monkeypatch):
+    structure_path = EXAMPLES_DIR + "5hr7.pdb"
+    cache_dir = str(tmp_path / "cache")
+    _, expected, _ = validate_entry(structure_path)
+    _, expected_rows, _ = validate_entry(structure_path, table_format=SQLITE_FORMAT)
+    _, outputs, _ = validate_entry(structure_path, result_cache_dir=cache_dir)
+    assert outputs == expected
+    assert len(ResultCache(cache_dir).disk_cache.entries()) == 1
+
+    # results of the unchanged structure are not computed again, in all formats derived from the csv outputs
+    def fail(*args, **kwargs):
+        raise AssertionError("should not be called")
+
+    monkeypatch.setattr(naval.batch, "validate_structure", fail)
+    _, cached, error = validate_entry(structure_path, result_cache_dir=cache_dir)
+    _, cached_rows, _ = validate_entry(structure_path, table_format=SQLITE_FORMAT, result_cache_dir=cache_dir)
+    assert error is None
+    assert cached == expected
+    assert cached_rows == expected_rows
+
+    cache = ResultCache(cache_dir)
+    assert cache.invalidate([EXAMPLES_DIR + "1d8g.cif"]) == 0
+    assert cache.invalidate([structure_path]) == 1
+    _, _, error = validate_entry(structure_path, result_cache_dir=cache_dir)
+    assert error is not None
+
+
+def test_result_cache_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    structure_path = EXAMPLES_DIR + "5hr7.pdb"
+    cache_dir = str(tmp_path / "cache")
+    _, expected, _ = validate_entry(structure_path, table_format=PARQUET_FORMAT)
+    # computed from the records, then from the csv fields of the cached entry
+    for _ in range(2):
+        _, tables, error = validate_entry(structure_path, table_format=PARQUET_FORMAT, result_cache_dir=cache_dir)
+        assert error is None
+        assert all(tables[name].equals(expected[name]) for name in ("bonds", "angles", "geometry"))
@@ -0,0 +1,107 @@
+import json
+import os
+import socket
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from naval.api import validate
+from naval.server import JSON_CONTENT_TYPE, ValidationService, create_server, run_job
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url():
+    service = ValidationService(processes=1, max_pending=0)
+    server = create_server(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", service
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def post(url, body, content_type=None):
+    headers = {"Content-Type": content_type} if content_type else {}
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=body, headers=headers)) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as error:
+        return error.code, json.load(error)
+
+
+def test_run_job():
+    expected = validate(EXAMPLES_DIR + "1d8g.cif").rows()
+
+    status, response = run_job({"path": EXAMPLES_DIR + "1d8g.cif"})
+    assert status == 200
+    assert response["pdbcode"] == "1d8g"
+    assert response["columns"]["bonds"][:2] == ["type", "pdbcode"]
+    assert response["bonds"] == expected["bonds"]
+    assert response["geometry"] == expected["geometry"]
+
+    with open(EXAMPLES_DIR + "1d8g.cif", "r", encoding="utf-8") as handle:
+        status, response = run_job({"content": handle.read(), "pdbcode": "1d8g"})
+    assert status == 200
+    assert response["angles"] == expected["angles"]
+
+    assert run_job({})[0] == 400
+    assert run_job({"path": EXAMPLES_DIR + "missing.cif"})[0] == 422
+
+    # modified nucleotides as a list or comma separated names
+    job = {"path": EXAMPLES_DIR + "6bel.cif", "nucleotides_only": True}
+    status, response = run_job({**job, "modified_nucleotides": ["2DA", "F3C"]})
+    assert status == 200
+    assert run_job({**job, "modified_nucleotides": "2DA,F3C"})[1] == response
+
+
+def test_validation_server(server_url):
+    url, service = server_url
+    status, response = post(url + "/validate", json.dumps({"path": EXAMPLES_DIR + "5hr7.pdb"}).encode(), JSON_CONTENT_TYPE)
+    assert status == 200
+    assert response["pdbcode"] == "5hr7"
+
+    with open(EXAMPLES_DIR + "5hr7.pdb", "rb") as handle:
+        status, raw_response = post(url + "/validate?pdbcode=5hr7&format=pdb&fast_reader=1", handle.read())
+    assert status == 200
+    # JSON arrays instead of tuples
+    assert raw_response["bonds"] == response["bonds"]
+
+    with urllib.request.urlopen(url + "/health") as health:
+        assert json.load(health) == {"status": "ok", "processes": 1, "max_pending": 0, "jobs": 0}
+
+    # the only worker slot is taken, the job is rejected
+    with service._slots:  # pylint: disable=protected-access
+        status, response = post(url + "/validate", json.dumps({"path": EXAMPLES_DIR + "5hr7.pdb"}).encode(), JSON_CONTENT_TYPE)
+    assert status == 503
+    assert post(url + "/other", b"")[0] == 404
+    # JSON body which is not a job object
+    assert post(url + "/validate", b"[1, 2]", JSON_CONTENT_TYPE)[0] == 400
+    assert post(url + "/validate", b"{", JSON_CONTENT_TYPE)[0] == 400
+
+
+def test_create_server_socket_path(tmp_path):
+    service = ValidationService(processes=1)
+    try:
+        socket_path = str(tmp_path / "naval.sock")
+        with socket.socket(socket.AF_UNIX) as stale_socket:
+            stale_socket.bind(socket_path)
+        # the stale socket is replaced
+        server = create_server(service, socket_path=socket_path)
+        # the socket of the running server is kept
+        with pytest.raises(FileExistsError):
+            create_server(service, socket_path=socket_path)
+        server.server_close()
+        create_server(service, socket_path=socket_path).server_close()
+
+        file_path = tmp_path / "naval.txt"
+        file_path.write_text("not a socket")
+        with pytest.raises(FileExistsError):
+            create_server(service, socket_path=str(file_path))
+        assert file_path.read_text() == "not a socket"
+    finally:
+        service.close()
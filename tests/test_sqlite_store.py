@@ -0,0 +1,66 @@
+import os
+
+from naval.batch import SQLITE_DATABASE_NAME, SQLITE_FORMAT, run_batch
+from naval.printer import AnglesCsvPrinter, BondsCsvPrinter, GeometryCsvPrinter
+from naval.sqlite_store import ResultsStore, results_rows
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+def test_results_store(tmp_path, validate_example):
+    _, validation_table, geometry_records = validate_example("1d8g.cif")
+    db_path = str(tmp_path / "results.sqlite")
+
+    with ResultsStore(db_path, batch_size=100) as store:
+        counts = store.store_results(validation_table, geometry_records)
+        assert counts == {
+            "bonds": len(BondsCsvPrinter.print(validation_table)) - 1,
+            "angles": len(AnglesCsvPrinter.print(validation_table)) - 1,
+            "geometry": len(GeometryCsvPrinter.print(geometry_records)) - 1,
+        }
+        # repeated run replaces the rows
+        store.store_results(validation_table, geometry_records)
+        assert store.count("bonds") == counts["bonds"]
+        assert store.count("geometry") == counts["geometry"]
+
+        outliers = store.query("SELECT COUNT(*) FROM angles WHERE pdbcode = ? AND validation_label = ?", ("1d8g", "PDB-outlier"))
+        assert outliers[0][0] == sum(1 for record in validation_table.angles() if record.is_outlier())
+        plan = store.query("EXPLAIN QUERY PLAN SELECT * FROM bonds WHERE validator_name = ?", ("bases==A",))
+        assert "USING INDEX bonds_validator_name" in plan[0][-1]
+
+    # the database is reopened with the same schema
+    with ResultsStore(db_path) as store:
+        row = store.query("SELECT model_id, calculated, target FROM bonds LIMIT 1")[0]
+        assert isinstance(row[0], int) and isinstance(row[1], float) and isinstance(row[2], float)
+
+
+def test_results_store_replace_entries(tmp_path, validate_example):
+    _, validation_table, geometry_records = validate_example("1d8g.cif")
+    rows = results_rows(validation_table, geometry_records)
+
+    with ResultsStore(str(tmp_path / "results.sqlite")) as store:
+        store.store_rows(rows)
+        store.store_rows({"bonds": rows["bonds"][:10], "angles": [], "geometry": []}, replace_entries=True)
+        assert store.count("bonds") == 10
+        assert store.count("angles") == 0
+
+    # entries of the same pdbcode (for example 1d8g.cif and 1d8g.pdb) do not replace each other
+    with ResultsStore(str(tmp_path / "entries.sqlite")) as store:
+        store.store_rows(rows, "1d8g_a", replace_entries=True)
+        store.store_rows(rows, "1d8g_b", replace_entries=True)
+        assert store.count("bonds") == 2 * len(rows["bonds"])
+        store.store_rows({"bonds": rows["bonds"][:10], "angles": [], "geometry": []}, "1d8g_a", replace_entries=True)
+        assert store.count("bonds") == len(rows["bonds"]) + 10
+        assert store.query("SELECT entry, COUNT(*) FROM angles GROUP BY entry") == [("1d8g_b", len(rows["angles"]))]
+
+
+def test_run_batch_sqlite(tmp_path, validate_example):
+    filenames = ("1d8g.cif", "3p4j.cif")
+    inputs = [EXAMPLES_DIR + filename for filename in filenames]
+    assert run_batch(inputs, str(tmp_path), processes=2, table_format=SQLITE_FORMAT) == 0
+    assert run_batch(inputs, str(tmp_path), table_format=SQLITE_FORMAT) == 0
+
+    with ResultsStore(str(tmp_path / SQLITE_DATABASE_NAME)) as store:
+        assert store.query("SELECT DISTINCT entry, pdbcode FROM geometry ORDER BY entry") == [("1d8g", "1d8g"), ("3p4j", "3p4j")]
+        expected = sum(len(BondsCsvPrinter.print(validate_example(filename)[1])) - 1 for filename in filenames)
+        assert store.count("bonds") == expected
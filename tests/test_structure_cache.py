@@ -0,0 +1,86 @@
+import os
+import shutil
+
+import naval.structure_cache
+import naval.validate
+from naval.disk_cache import DiskCache
+from naval.structure_cache import StructureCache
+from naval.validate import (
+    fill_residue_cache,
+    link_residues,
+    load_structure,
+    read_structure,
+    residue_links,
+    selected_res_names,
+)
+from tests.test_readers import validation_lines
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+def test_residue_links():
+    structure = read_structure(EXAMPLES_DIR + "5hr7.pdb")
+    residue_cache = link_residues(fill_residue_cache(structure, structure.id))
+    links = residue_links(residue_cache)
+
+    assert links.shape[1] == 2
+    assert len(links) == sum(1 for residue_entry in residue_cache if residue_entry.prev_res is not None)
+    for prev_index, next_index in links.tolist():
+        assert residue_cache[next_index].prev_res is residue_cache[prev_index]
+
+
+def test_structure_cache(tmp_path, monkeypatch):
+    structure_path = str(tmp_path / "5hr7.pdb")
+    shutil.copy(EXAMPLES_DIR + "5hr7.pdb", structure_path)
+    cache = StructureCache(str(tmp_path / "cache"))
+
+    structure, links = load_structure(structure_path, structure_cache=cache)
+    expected = validation_lines(structure)
+    assert len(cache.disk_cache.entries()) == 1
+
+    # the second run reads the cached atoms and links, without parsing and linking
+    def fail(*args, **kwargs):
+        raise AssertionError("should not be called")
+
+    monkeypatch.setattr(naval.validate, "read_structure", fail)
+    monkeypatch.setattr(naval.validate, "link_residues", fail)
+    cached_structure, cached_links = load_structure(structure_path, structure_cache=cache)
+    assert cached_structure.id == "5hr7"
+    assert cached_links.tolist() == links.tolist()
+    assert validation_lines(cached_structure, cached_links) == expected
+
+
+def test_structure_cache_key(tmp_path, monkeypatch):
+    structure_path = str(tmp_path / "1d8g.pdb")
+    shutil.copy(EXAMPLES_DIR + "1d8g.pdb", structure_path)
+
+    key = StructureCache.key(structure_path)
+    assert key == StructureCache.key(EXAMPLES_DIR + "1d8g.pdb")
+    assert key != StructureCache.key(structure_path, selected_res_names(True))
+
+    with open(structure_path, "a", encoding="utf-8") as handle:
+        handle.write("REMARK changed\n")
+    changed_key = StructureCache.key(structure_path)
+    assert key != changed_key
+
+    monkeypatch.setattr(naval.structure_cache, "VERSION", "0.0.0")
+    assert changed_key != StructureCache.key(structure_path)
+
+
+def test_disk_cache_lru_eviction(tmp_path):
+    cache = DiskCache(str(tmp_path), 250, ".bin")
+    cache.store("a", b"a" * 100)
+    cache.store("b", b"b" * 100)
+    os.utime(cache.entry_path("a"), (1, 1))
+    os.utime(cache.entry_path("b"), (2, 2))
+
+    # "a" is used, so "b" is the least recently used entry
+    assert cache.lookup("a") is not None
+    cache.store("c", b"c" * 100)
+
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") is not None
+    assert cache.lookup("c") is not None
+
+    cache.clear()
+    assert not cache.entries()
@@ -0,0 +1,88 @@
+import os
+
+import numpy as np
+import pytest
+
+from naval.printer import AnglesCsvPrinter, BondsCsvPrinter, GeometryCsvPrinter
+from naval.trajectory import SUMMARY_COLUMNS, Trajectory, run_trajectory
+from naval.validate import (
+    prepare_residue_cache,
+    read_structure,
+    residue_links,
+    validate_residue_cache,
+)
+
+EXAMPLES_DIR = os.path.dirname(__file__) + "/examples/"
+
+
+def frame_lines(result):
+    table = result.validation_table
+    return BondsCsvPrinter.print(table), AnglesCsvPrinter.print(table), GeometryCsvPrinter.print(result.geometry_records())
+
+
+def validated_lines(trajectory, coords):
+    for atom, coord in zip(trajectory.atoms, coords):
+        atom.set_coord(coord.copy())
+    table, geometry_records = validate_residue_cache(prepare_residue_cache(trajectory.structure, residue_links(trajectory.residue_cache)))
+    return BondsCsvPrinter.print(table), AnglesCsvPrinter.print(table), GeometryCsvPrinter.print(geometry_records)
+
+
+@pytest.mark.parametrize("file_name", ["1d8g.cif", "5hr7.pdb"])
+def test_trajectory_frames(file_name):
+    trajectory = Trajectory(read_structure(EXAMPLES_DIR + file_name))
+    frames = trajectory.model_frames()
+    assert frames.shape == (1, trajectory.n_atoms, 3)
+
+    rng = np.random.default_rng(0)
+    frames = np.concatenate([frames, frames + rng.normal(0.0, 0.1, (4,) + frames.shape[1:]).astype(np.float32)])
+    results = list(trajectory.validate_frames(frames, chunk_size=2))
+    assert [result.frame for result in results] == list(range(5))
+    # the same results as validation of each frame with the links of the topology
+    for result in results:
+        assert frame_lines(result) == validated_lines(trajectory, frames[result.frame])
+
+    summary = results[0].summary()
+    assert len(summary) == len(SUMMARY_COLUMNS)
+    assert sum(summary[1:5]) == len(results[0].validation_table.bonds())
+    assert sum(summary[5:9]) == len(results[0].validation_table.angles())
+
+    with pytest.raises(ValueError):
+        list(trajectory.validate_frames(frames[:, :-1]))
+
+
+def test_trajectory_models():
+    # without alternative conformations, children of the copied disordered atoms are not copied
+    structure = read_structure(EXAMPLES_DIR + "5ckk.cif")
+    model = structure[0].copy()
+    model.id = 1
+    for atom in model.get_atoms():
+        atom.set_coord(atom.get_coord() + np.float32(0.05))
+    structure.add(model)
+
+    trajectory = Trajectory(structure)
+    assert trajectory.model is structure[0]
+    frames = trajectory.model_frames()
+    assert frames.shape == (2, trajectory.n_atoms, 3)
+    np.testing.assert_allclose(frames[1], frames[0] + np.float32(0.05), atol=1e-5)
+    assert [result.summary()[1:] for result in trajectory.validate_frames(frames)] == [next(trajectory.summaries(frames[:1]))[1:]] * 2
+
+    model.detach_child(next(iter(model)).id)
+    with pytest.raises(ValueError):
+        trajectory.model_frames()
+
+
+def test_run_trajectory(tmp_path):
+    structure_path = EXAMPLES_DIR + "1d8g.cif"
+    frames = Trajectory(read_structure(structure_path)).model_frames()
+    frames_path = str(tmp_path / "frames.npy")
+    np.save(frames_path, np.concatenate([frames, frames + np.float32(0.2)]))
+
+    summary_path = str(tmp_path / "trajectory.csv")
+    assert run_trajectory(structure_path, summary_path, frames_path, str(tmp_path / "tables")) == 2
+    with open(summary_path, "r", encoding="utf-8") as summary_file:
+        lines = summary_file.read().splitlines()
+    assert lines[0] == ",".join(SUMMARY_COLUMNS)
+    assert [line.split(",")[0] for line in lines[1:]] == ["0", "1"]
+    assert sorted(os.listdir(tmp_path / "tables")) == [
+        f"1d8g_frame{frame}_{name}.csv" for frame in (0, 1) for name in ("angles", "bonds", "geometry")
+    ]
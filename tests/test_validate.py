@@ -1,7 +1,15 @@
 import os
 
-from naval.printer import BondsCsvPrinter
-from naval.validate import read_structure, validate_structure
+from naval.parallel import partition_residue_cache
+from naval.printer import AnglesCsvPrinter, BondsCsvPrinter, GeometryCsvPrinter
+from naval.validate import (
+    fill_residue_cache,
+    link_residues,
+    prepare_residue_cache,
+    read_structure,
+    residue_links,
+    validate_structure,
+)
 
 
 def test_read_structure():
@@ -114,3 +122,49 @@ def test_iterate_struct_6bel_cif():
 
     # seems to be far away, it is 18.1A apart and should be filtered out
     assert len(filter_records_bond(records, "A", 406, " ", "O3'", 407, " ", "P")) == 0
+
+
+def test_validate_structure_parallel():
+    struct = read_structure(os.path.dirname(__file__) + "/examples/5hr7.pdb")
+    records, geometry = validate_structure(struct)
+    parallel_records, parallel_geometry = validate_structure(struct, processes=3)
+
+    assert BondsCsvPrinter.print(parallel_records) == BondsCsvPrinter.print(records)
+    assert AnglesCsvPrinter.print(parallel_records) == AnglesCsvPrinter.print(records)
+    assert GeometryCsvPrinter.print(parallel_geometry) == GeometryCsvPrinter.print(geometry)
+    # atoms of the merged records belong to the parent process structure
+    assert parallel_records[0].atom1.get_parent().get_parent().get_parent().get_parent() is struct
+
+
+def test_partition_residue_cache():
+    struct = read_structure(os.path.dirname(__file__) + "/examples/5hr7.pdb")
+    residue_cache = prepare_residue_cache(struct)
+    partitions = partition_residue_cache(residue_cache)
+
+    assert len(partitions) == 4
+    assert sorted(i for partition in partitions for i in partition) == list(range(len(residue_cache)))
+    for partition in partitions:
+        assert len({residue_cache[i].chain.get_id() for i in partition}) == 1
+
+
+def test_link_residues_across_numbering_gap():
+    struct = read_structure(os.path.dirname(__file__) + "/examples/5ckk.cif")
+    residue_cache = link_residues(fill_residue_cache(struct, struct.id))
+    residues = {(entry.model.get_id(), entry.chain.get_id(), entry.resseq): entry for entry in residue_cache}
+
+    # no residue 0, O3' of -1 is 1.608A from P of 1
+    assert residues[(0, "D", -1)].next_res is residues[(0, "D", 1)]
+    assert residues[(0, "D", 1)].prev_res is residues[(0, "D", -1)]
+
+
+def test_link_residues_out_of_order():
+    struct = read_structure(os.path.dirname(__file__) + "/examples/1d8g.pdb")
+    residue_cache = fill_residue_cache(struct, struct.id)
+    expected = residue_links(link_residues(fill_residue_cache(struct, struct.id)))
+
+    order = list(reversed(range(len(residue_cache))))
+    shuffled = link_residues([residue_cache[i] for i in order])
+    links = [[order[prev_index], order[next_index]] for prev_index, next_index in residue_links(shuffled).tolist()]
+
+    assert len(expected) > 0
+    assert sorted(links) == sorted(expected.tolist())
@@ -0,0 +1,87 @@
+import os
+
+import numpy as np
+
+from naval.restraint_definition import (
+    CSD_PREFERRED,
+    PDB_ACCEPTABLE,
+    PDB_OUTLIER,
+    PDB_SUSPICIOUS,
+    classify_value,
+    label_thresholds,
+)
+from naval.restraint_library import restraint_tables
+from naval.validate import prepare_residue_cache, read_structure, validate_residue_cache
+from naval.validation_engine import classify_values, restraint_thresholds
+from naval.validation_table import VALIDATION_LABELS
+from naval.validators.bases_validator import BasesValidator
+from naval.validators.po4_validator import Po4Validator
+from naval.validators.sugar_pucker_validator import SugarPuckerBasedSugarValidator
+
+
+def record_label_code(value, definition):
+    # the first matching interval, as in ValidationRecord.label
+    intervals = (
+        (definition.csd_target - 3 * definition.csd_std, definition.csd_target + 3 * definition.csd_std),
+        (definition.pdb_3low, definition.pdb_3high),
+        (definition.pdb_4low, definition.pdb_4high),
+    )
+    return next((code for code, (left, right) in enumerate(intervals) if left <= value <= right), len(intervals))
+
+
+def test_classify_values():
+    definitions = restraint_tables("PO4_BONDS")["PO4==AA_0"]
+    thresholds = restraint_thresholds(definitions)
+    values = []
+    for definition in definitions:
+        values.extend(
+            [
+                definition.csd_target,
+                definition.csd_target + 3 * definition.csd_std,
+                definition.pdb_3low,
+                definition.pdb_4high,
+                definition.pdb_4high + 0.1,
+            ]
+        )
+    values = np.array(values, dtype=np.float32)
+    codes = classify_values(values, np.repeat(thresholds, 5, axis=0))
+
+    for value, code, definition in zip(values, codes, [definition for definition in definitions for _ in range(5)]):
+        assert code == record_label_code(value, definition)
+    assert VALIDATION_LABELS[codes[-1]] == "PDB-outlier"
+
+
+def test_validate_residue_cache_batch():
+    struct = read_structure(os.path.dirname(__file__) + "/examples/1d8g.cif")
+    residue_cache = prepare_residue_cache(struct)
+    validation_records, _ = validate_residue_cache(residue_cache)
+
+    # one validator at a time, residue by residue
+    expected = []
+    for residue_entry in residue_cache:
+        if residue_entry.is_nucleotide() and residue_entry.geometry:
+            for validator_class in (BasesValidator, Po4Validator, SugarPuckerBasedSugarValidator):
+                expected.extend(validator_class(residue_entry.geometry).validate())
+
+    assert len(validation_records) == len(expected)
+    for record, expected_record in zip(validation_records, expected):
+        assert (record.name, record.atom1, record.atom2, record.atom3) == (
+            expected_record.name,
+            expected_record.atom1,
+            expected_record.atom2,
+            expected_record.atom3,
+        )
+        assert record.calculated_value == expected_record.calculated_value
+        assert record.label == expected_record.label
+        assert record.label in VALIDATION_LABELS
+
+
+def test_classify_value_intervals():
+    # preferred interval outside of the allowed interval, suspicious interval inside of the allowed interval
+    thresholds = label_thresholds(2.0, 0.1, 1.0, 1.5, 1.2, 1.3)
+    values = np.array([2.0, 1.7, 2.3, 1.0, 1.25, 1.5, 1.6, 0.5, 2.31], dtype=np.float64)
+    expected = [CSD_PREFERRED, CSD_PREFERRED, CSD_PREFERRED, PDB_ACCEPTABLE, PDB_ACCEPTABLE, PDB_ACCEPTABLE, PDB_OUTLIER, PDB_OUTLIER, PDB_OUTLIER]
+
+    assert [classify_value(value, thresholds) for value in values] == expected
+    assert classify_values(values, np.array([thresholds] * len(values))).tolist() == expected
+    assert classify_value(1.0, label_thresholds(2.0, 0.1, 1.5, 1.6, 0.9, 1.1)) == PDB_SUSPICIOUS
@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+
+from naval.printer import AnglesCsvPrinter, BondsCsvPrinter
+from naval.validate import prepare_residue_cache, read_structure, validate_residue_cache
+from naval.validation_record import ValidationRecord
+from naval.validation_table import VALIDATION_LABELS, ValidationTable
+
+
+def prepare_validation_table():
+    struct = read_structure(os.path.dirname(__file__) + "/examples/1d8g.cif")
+    validation_table, _ = validate_residue_cache(prepare_residue_cache(struct))
+    return validation_table
+
+
+def test_validation_table_columns():
+    table = prepare_validation_table()
+
+    assert len(table) > 0
+    assert table.validation_type.dtype == np.uint8
+    assert table.label_code.dtype == np.uint8
+    assert table.atom_indices.shape == (len(table), 3)
+    # atoms, geometries and definitions are stored once
+    assert len(table.atoms) < 3 * len(table)
+    assert len(table.definitions) < len(table)
+    assert table.nbytes == 30 * len(table)
+    assert list(table.labels()) == [record.label for record in table]
+
+
+def test_validation_record_view():
+    table = prepare_validation_table()
+
+    for view, record in zip(table, table.records()):
+        assert isinstance(record, ValidationRecord)
+        assert view.validation_type == record.validation_type
+        assert view.name == record.name
+        assert view.geometry is record.geometry
+        assert (view.atom1, view.atom2, view.atom3) == (record.atom1, record.atom2, record.atom3)
+        assert view.calculated_value == record.calculated_value
+        assert type(view.calculated_value) is type(record.calculated_value)
+        assert (view.csd_preferred_left, view.pdb_allowed_left, view.pdb_suspicious_right) == (
+            record.csd_preferred_left,
+            record.pdb_allowed_left,
+            record.pdb_suspicious_right,
+        )
+        # the label calculated in the batch is the same as for the single value
+        assert view.label == record.label == VALIDATION_LABELS[view.definition.label_code(view.calculated_value)]
+        assert view.label in VALIDATION_LABELS
+
+    assert table[-1].atom1 is table[len(table) - 1].atom1
+    assert BondsCsvPrinter.print(table) == BondsCsvPrinter.print(table.records())
+    assert AnglesCsvPrinter.print(table) == AnglesCsvPrinter.print(table.records())
+
+
+def test_validation_table_take_concatenate():
+    table = prepare_validation_table()
+    bonds = table.bonds()
+    angles = table.angles()
+
+    assert len(bonds) + len(angles) == len(table)
+    assert all(record.validation_type == "bond" for record in bonds)
+    assert all(record.atom3 is not None for record in angles)
+
+    joined = ValidationTable.concatenate([bonds, angles])
+    assert len(joined) == len(table)
+    assert [str(record) for record in joined] == [str(record) for record in bonds] + [str(record) for record in angles]
+    assert len(ValidationTable.concatenate([])) == 0
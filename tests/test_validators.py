@@ -6,6 +6,7 @@ from Bio.PDB.vectors import Vector
 
 from naval.nucleotide_geometry import NucleotideGeometry
 from naval.residue_cache_entry import ResidueCacheEntry
+from naval.restraint_library import restraint_tables
 from naval.validators.bases_validator import BasesValidator
 from naval.validators.po4_validator import Po4Validator
 from naval.validators.sugar_basic_validator import BasicSugarValidator
@@ -61,3 +62,37 @@ def test_sugar_pucker_based_sugar_validator():
             validator = SugarPuckerBasedSugarValidator(geometry)
             validation_records = validator.validate()
             assert len(validation_records) == 3
+
+
+def test_restraint_index():
+    index = Po4Validator.compiled_restraint_index()
+    SugarPuckerBasedSugarValidator.compiled_restraint_index()
+
+    assert index is BasesValidator.compiled_restraint_index()
+    assert index.bond("po4", "A_G", "PO4==AS_1", "OP1", "P") is restraint_tables("PO4_BONDS")["PO4==AS_1"][0]
+    assert index.bond("po4", "U_T_C", "other", "O3'", "P").name == "other==U_T_C"
+    assert index.angle("po4", "DA_DG", "other", "O3'", "P", "O5'").name == "other"
+    assert index.bond("po4", "A_G", "other", "P", "OP1") is None
+    # other pucker restraints are missing for U_T_C, basic sugar restraints are used
+    assert index.bond("sugar_pucker", "U_T_C", "other", "C1'", "C2'").name == "sugar_basic==U_T_C"
+    assert index.bond("sugar_pucker", "A_G", "C3'-endo", "C1'", "C2'").name == "pucker==A_G_C3p_endo"
+    assert index.bond("sugar_pucker", "DA_DG", "basic", "C1'", "C2'").name == "sugar_basic==DA_DG"
+
+
+def test_po4_conformation_class():
+    # the conformation classes select the restraint tables, they are checked directly
+    # pylint: disable=protected-access
+    geometry = prepare_geometry("A", "OP1", "P", "OP2", "O", "P", "O")
+    geometry.alpha_conformation = {"": "sc-"}
+    validator = Po4Validator(geometry)
+
+    assert validator._angle_conformation_class("", "OP1", "P", "OP2") == "other"
+
+    previous_geometry = prepare_geometry("A", "O3'", "C3'", "C4'", "O", "C", "C")
+    previous_geometry.zeta_conformation = {"": "sc-"}
+    geometry.residue_entry.prev_res = previous_geometry.residue_entry
+    previous_geometry.residue_entry.geometry = previous_geometry
+
+    assert validator._angle_conformation_class("", "OP1", "P", "OP2") == "PO4==AS_1"
+    assert validator._bond_conformation_class("A", "OP1", "P") == "PO4==AS_1"
+    assert validator._bond_conformation_class("", "O3'", "C3'") == "other"